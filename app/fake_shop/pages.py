@@ -0,0 +1,322 @@
+import json
+from html import escape
+from typing import Dict, List, Optional
+
+from app.fake_shop.shop_state import Cart, Order, Product
+from app.utils.money_utils import MoneyUtils
+
+# Progressive enhancement matching WooCommerce's cart.js: coupon, update and
+# remove actions go through fetch() and swap the .woocommerce block, so
+# element references captured before the action go stale exactly as they do
+# on the real site. Without JavaScript the same forms and links still work.
+CART_SCRIPT = """
+document.addEventListener('click', function (event) {
+    var dismiss = event.target.closest('.woocommerce-store-notice__dismiss-link');
+    if (dismiss) {
+        event.preventDefault();
+        dismiss.closest('.woocommerce-store-notice').style.display = 'none';
+        return;
+    }
+    var link = event.target.closest('a.remove, a.woocommerce-remove-coupon');
+    if (!link) return;
+    event.preventDefault();
+    refresh(fetch(link.href, {credentials: 'same-origin'}));
+});
+
+document.addEventListener('submit', function (event) {
+    var form = event.target;
+    if (!form.classList.contains('woocommerce-cart-form')) return;
+    event.preventDefault();
+    var data = new FormData(form);
+    if (event.submitter && event.submitter.name) {
+        data.append(event.submitter.name, event.submitter.value);
+    }
+    refresh(fetch(form.action, {method: 'POST', body: data, credentials: 'same-origin'}));
+});
+
+function refresh(pending) {
+    pending.then(function (response) { return response.text(); }).then(function (html) {
+        var doc = new DOMParser().parseFromString(html, 'text/html');
+        document.querySelector('.woocommerce').replaceWith(doc.querySelector('.woocommerce'));
+    });
+}
+"""
+
+
+def money(value) -> str:
+    """Render an amount the way WooCommerce does."""
+    return (
+        '<span class="woocommerce-Price-amount amount"><bdi>'
+        f'<span class="woocommerce-Price-currencySymbol">&pound;</span>{value:.2f}'
+        '</bdi></span>'
+    )
+
+
+def layout(base: str, title: str, content: str, notices: str = "", nonce: str = "") -> str:
+    """Wrap page content with the store notice, navigation and scripts."""
+    params = json.dumps({"apply_coupon_nonce": nonce, "wc_ajax_url": f"{base}/?wc-ajax=%%endpoint%%"})
+    return f"""<!DOCTYPE html>
+<html lang="en-GB">
+<head>
+<meta charset="UTF-8">
+<title>{escape(title)} &ndash; Edgewords Shop</title>
+<script>var wc_cart_params = {params};</script>
+</head>
+<body>
+<p class="woocommerce-store-notice demo_store">This is a demo store for testing purposes &mdash; no orders shall be fulfilled. <a href="#" class="woocommerce-store-notice__dismiss-link">Dismiss</a></p>
+<header class="site-header">
+<nav class="main-navigation"><ul class="menu">
+<li><a href="{base}/">Home</a></li>
+<li><a href="{base}/shop/">Shop</a></li>
+<li><a href="{base}/cart/">Cart</a></li>
+<li><a href="{base}/checkout/">Checkout</a></li>
+<li><a href="{base}/my-account/">My account</a></li>
+</ul></nav>
+</header>
+<main class="site-main">
+<h1 class="entry-title">{escape(title)}</h1>
+<div class="woocommerce">{notices}{content}</div>
+</main>
+<script>{CART_SCRIPT}</script>
+</body>
+</html>"""
+
+
+def success_notice(message_html: str) -> str:
+    return f'<div class="woocommerce-message" role="alert">{message_html}</div>'
+
+
+def error_notice(message: str) -> str:
+    return f'<ul class="woocommerce-error" role="alert"><li>{escape(message)}</li></ul>'
+
+
+def home(base: str) -> str:
+    return f'<p>Welcome to the demo shop. <a href="{base}/shop/">Browse products</a>.</p>'
+
+
+def shop(base: str, products: List[Product], page: int, pages: int) -> str:
+    """Product listing with WooCommerce loop markup and pagination."""
+    items = "".join(
+        f'<li class="product type-product post-{p.id}">'
+        f'<a href="{base}/product/{p.slug}/" class="woocommerce-LoopProduct-link woocommerce-loop-product__link">'
+        f'<h2 class="woocommerce-loop-product__title">{escape(p.name)}</h2>'
+        f'<span class="price">{money(p.price)}</span></a>'
+        f'<a href="?add-to-cart={p.id}" data-product_id="{p.id}" '
+        f'class="button product_type_simple add_to_cart_button">Add to cart</a></li>'
+        for p in products
+    )
+    nav = ""
+    if pages > 1:
+        links = []
+        if page > 1:
+            links.append(f'<li><a class="prev page-numbers" href="{base}/shop/page/{page - 1}/">&larr;</a></li>')
+        for number in range(1, pages + 1):
+            if number == page:
+                links.append(f'<li><span aria-current="page" class="page-numbers current">{number}</span></li>')
+            else:
+                links.append(f'<li><a class="page-numbers" href="{base}/shop/page/{number}/">{number}</a></li>')
+        if page < pages:
+            links.append(f'<li><a class="next page-numbers" href="{base}/shop/page/{page + 1}/">&rarr;</a></li>')
+        nav = f'<nav class="woocommerce-pagination"><ul class="page-numbers">{"".join(links)}</ul></nav>'
+    return f'<ul class="products columns-4">{items}</ul>{nav}'
+
+
+def search_results(base: str, term: str, products: List[Product]) -> str:
+    return (
+        f'<p class="woocommerce-result-count">Search results for &ldquo;{escape(term)}&rdquo;</p>'
+        + shop(base, products, 1, 1)
+    )
+
+
+def product(base: str, item: Product) -> str:
+    """Single product page with the add-to-cart form."""
+    return f"""<div id="product-{item.id}" class="product type-product">
+<div class="summary entry-summary">
+<h1 class="product_title entry-title">{escape(item.name)}</h1>
+<p class="price">{money(item.price)}</p>
+<form class="cart" action="{base}/product/{item.slug}/" method="post" enctype="multipart/form-data">
+<div class="quantity"><input type="number" class="input-text qty text" name="quantity" value="1" min="1" step="1"></div>
+<button type="submit" name="add-to-cart" value="{item.id}" class="single_add_to_cart_button button alt">Add to cart</button>
+</form>
+</div>
+</div>"""
+
+
+def added_to_cart_notice(base: str, item: Product) -> str:
+    return success_notice(
+        f'<a href="{base}/cart/" tabindex="1" class="button wc-forward">View cart</a> '
+        f'&ldquo;{escape(item.name)}&rdquo; has been added to your cart.'
+    )
+
+
+def cart(base: str, basket: Cart, totals: Dict, nonce: str) -> str:
+    """Cart table, coupon form and cart totals."""
+    if basket.is_empty():
+        return (
+            '<p class="cart-empty woocommerce-info">Your cart is currently empty.</p>'
+            f'<p class="return-to-shop"><a class="button wc-backward" href="{base}/shop/">Return to shop</a></p>'
+        )
+
+    rows = "".join(
+        f'<tr class="woocommerce-cart-form__cart-item cart_item">'
+        f'<td class="product-remove"><a href="{base}/cart/?remove_item={line.key}&amp;_wpnonce={nonce}" '
+        f'class="remove" aria-label="Remove this item" data-product_id="{line.product.id}">&times;</a></td>'
+        f'<td class="product-name" data-title="Product"><a href="{base}/product/{line.product.slug}/">{escape(line.product.name)}</a></td>'
+        f'<td class="product-price" data-title="Price">{money(line.product.price)}</td>'
+        f'<td class="product-quantity" data-title="Quantity"><div class="quantity">'
+        f'<input type="number" class="input-text qty text" name="cart[{line.key}][qty]" value="{line.quantity}" min="0" step="1">'
+        f'</div></td>'
+        f'<td class="product-subtotal" data-title="Subtotal">{money(line.line_total)}</td>'
+        f'</tr>'
+        for line in basket.lines.values()
+    )
+    discounts = "".join(
+        f'<tr class="cart-discount coupon-{escape(code)}"><th>Coupon: {escape(code)}</th>'
+        f'<td data-title="Coupon: {escape(code)}">-{money(amount)} '
+        f'<a href="{base}/cart/?remove_coupon={escape(code)}" class="woocommerce-remove-coupon" '
+        f'data-coupon="{escape(code)}">[Remove]</a></td></tr>'
+        for code, amount in totals["discounts"].items()
+    )
+    return f"""<form class="woocommerce-cart-form" action="{base}/cart/" method="post">
+<table class="shop_table shop_table_responsive cart woocommerce-cart-form__contents">
+<thead><tr><th class="product-remove">&nbsp;</th><th class="product-name">Product</th><th class="product-price">Price</th><th class="product-quantity">Quantity</th><th class="product-subtotal">Subtotal</th></tr></thead>
+<tbody>
+{rows}
+<tr><td colspan="5" class="actions">
+<div class="coupon"><label for="coupon_code">Coupon:</label>
+<input type="text" name="coupon_code" class="input-text" id="coupon_code" value="" placeholder="Coupon code">
+<button type="submit" class="button" name="apply_coupon" value="Apply coupon">Apply coupon</button></div>
+<button type="submit" class="button" name="update_cart" value="Update cart">Update cart</button>
+<input type="hidden" name="woocommerce-cart-nonce" value="{nonce}">
+</td></tr>
+</tbody>
+</table>
+</form>
+<div class="cart-collaterals"><div class="cart_totals">
+<h2>Cart totals</h2>
+<table class="shop_table shop_table_responsive">
+<tr class="cart-subtotal"><th>Subtotal</th><td data-title="Subtotal">{money(totals["subtotal"])}</td></tr>
+{discounts}
+<tr class="woocommerce-shipping-totals shipping"><th>Shipping</th><td data-title="Shipping">Flat rate: {money(totals["shipping"])}</td></tr>
+<tr class="order-total"><th>Total</th><td data-title="Total"><strong>{money(totals["total"])}</strong></td></tr>
+</table>
+<div class="wc-proceed-to-checkout"><a href="{base}/checkout/" class="checkout-button button alt wc-forward">Proceed to checkout</a></div>
+</div></div>"""
+
+
+BILLING_FIELDS = (
+    ("billing_first_name", "First name"),
+    ("billing_last_name", "Last name"),
+    ("billing_address_1", "Street address"),
+    ("billing_address_2", "Apartment, suite, unit, etc."),
+    ("billing_city", "Town / City"),
+    ("billing_state", "County"),
+    ("billing_postcode", "Postcode"),
+    ("billing_phone", "Phone"),
+)
+
+
+def checkout(base: str, totals: Dict, values: Optional[Dict[str, str]] = None) -> str:
+    """Checkout form with billing fields and payment methods."""
+    values = values or {}
+    fields = "".join(
+        f'<p class="form-row" id="{name}_field"><label for="{name}">{label}</label>'
+        f'<input type="text" class="input-text" name="{name}" id="{name}" value="{escape(values.get(name, ""))}"></p>'
+        for name, label in BILLING_FIELDS
+    )
+    return f"""<form name="checkout" method="post" class="checkout woocommerce-checkout" action="{base}/checkout/">
+<div class="woocommerce-billing-fields"><h3>Billing details</h3>{fields}</div>
+<h3 id="order_review_heading">Your order</h3>
+<div id="order_review" class="woocommerce-checkout-review-order">
+<table class="shop_table woocommerce-checkout-review-order-table">
+<tr class="cart-subtotal"><th>Subtotal</th><td>{money(totals["subtotal"])}</td></tr>
+<tr class="order-total"><th>Total</th><td><strong>{money(totals["total"])}</strong></td></tr>
+</table>
+<div id="payment" class="woocommerce-checkout-payment">
+<ul class="wc_payment_methods payment_methods methods">
+<li class="wc_payment_method payment_method_bacs"><input id="payment_method_bacs" type="radio" class="input-radio" name="payment_method" value="bacs" checked="checked"><label for="payment_method_bacs">Direct bank transfer</label></li>
+<li class="wc_payment_method payment_method_cheque"><input id="payment_method_cheque" type="radio" class="input-radio" name="payment_method" value="cheque"><label for="payment_method_cheque">Check payments</label></li>
+</ul>
+<div class="form-row place-order">
+<button type="submit" class="button alt" name="woocommerce_checkout_place_order" id="place_order" value="Place order">Place order</button>
+</div>
+</div>
+</div>
+</form>"""
+
+
+def order_received(order: Order) -> str:
+    return f"""<p class="woocommerce-notice woocommerce-notice--success woocommerce-thankyou-order-received">Thank you. Your order has been received.</p>
+<ul class="woocommerce-order-overview woocommerce-thankyou-order-details order_details">
+<li class="woocommerce-order-overview__order order">Order number: <strong>{order.number}</strong></li>
+<li class="woocommerce-order-overview__total total">Total: <strong>{money(order.total)}</strong></li>
+<li class="woocommerce-order-overview__payment-method method">Payment method: <strong>Check payments</strong></li>
+</ul>"""
+
+
+def login_form(base: str) -> str:
+    return f"""<h2>Login</h2>
+<form class="woocommerce-form woocommerce-form-login login" method="post" action="{base}/my-account/">
+<p class="form-row"><label for="username">Username or email address</label>
+<input type="text" class="woocommerce-Input woocommerce-Input--text input-text" name="username" id="username" autocomplete="username" value=""></p>
+<p class="form-row"><label for="password">Password</label>
+<input class="woocommerce-Input woocommerce-Input--text input-text" type="password" name="password" id="password" autocomplete="current-password"></p>
+<p class="form-row"><button type="submit" class="woocommerce-button button woocommerce-form-login__submit" name="login" value="Log in">Log in</button></p>
+</form>"""
+
+
+def account_navigation(base: str) -> str:
+    return f"""<nav class="woocommerce-MyAccount-navigation"><ul>
+<li class="woocommerce-MyAccount-navigation-link--dashboard"><a href="{base}/my-account/">Dashboard</a></li>
+<li class="woocommerce-MyAccount-navigation-link--orders"><a href="{base}/my-account/orders/">Orders</a></li>
+<li class="woocommerce-MyAccount-navigation-link--customer-logout"><a href="{base}/my-account/customer-logout/">Log out</a></li>
+</ul></nav>"""
+
+
+def dashboard(base: str, username: str) -> str:
+    return account_navigation(base) + (
+        f'<div class="woocommerce-MyAccount-content"><p>Hello <strong>{escape(username)}</strong> '
+        f'(not {escape(username)}? <a href="{base}/my-account/customer-logout/">Log out</a>)</p></div>'
+    )
+
+
+def orders(base: str, page_orders: List[Order], page: int, has_next: bool) -> str:
+    """Order history table with WooCommerce's Previous/Next pagination."""
+    rows = "".join(
+        f'<tr class="woocommerce-orders-table__row order">'
+        f'<td class="woocommerce-orders-table__cell woocommerce-orders-table__cell-order-number" data-title="Order">'
+        f'<a href="{base}/my-account/view-order/{o.number}/">#{o.number}</a></td>'
+        f'<td class="woocommerce-orders-table__cell woocommerce-orders-table__cell-order-total" data-title="Total">{money(o.total)}</td>'
+        f'</tr>'
+        for o in page_orders
+    )
+    buttons = ""
+    if page > 1:
+        buttons += (
+            f'<a class="woocommerce-button woocommerce-button--previous woocommerce-Button button" '
+            f'href="{base}/my-account/orders/{page - 1}/">Previous</a>'
+        )
+    if has_next:
+        buttons += (
+            f'<a class="woocommerce-button woocommerce-button--next woocommerce-Button button" '
+            f'href="{base}/my-account/orders/{page + 1}/">Next</a>'
+        )
+    pagination = f'<div class="woocommerce-pagination woocommerce-Pagination">{buttons}</div>' if buttons else ""
+    table = (
+        '<table class="woocommerce-orders-table woocommerce-MyAccount-orders shop_table account-orders-table">'
+        '<thead><tr><th>Order</th><th>Total</th></tr></thead>'
+        f'<tbody>{rows}</tbody></table>'
+        if page_orders else
+        '<div class="woocommerce-info">No order has been made yet.</div>'
+    )
+    return account_navigation(base) + f'<div class="woocommerce-MyAccount-content">{table}{pagination}</div>'
+
+
+def view_order(base: str, order: Optional[Order]) -> str:
+    if order is None:
+        return account_navigation(base) + '<div class="woocommerce-MyAccount-content">' + error_notice("Invalid order.") + "</div>"
+    return account_navigation(base) + (
+        f'<div class="woocommerce-MyAccount-content"><p>Order #<mark class="order-number">{order.number}</mark> '
+        f'was placed and is currently <mark class="order-status">On hold</mark>.</p>'
+        f'<p>Total: {money(order.total)}</p></div>'
+    )
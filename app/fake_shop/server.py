@@ -0,0 +1,404 @@
+import json
+import re
+import secrets
+import threading
+from http.cookies import SimpleCookie
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from app.fake_shop import pages
+from app.fake_shop.shop_state import ShopState
+
+AUTH_COOKIE = "wordpress_logged_in_fakeshop"
+SESSION_COOKIE = "wp_woocommerce_session_fakeshop"
+
+
+class FakeShop:
+    """
+    Local WooCommerce stand-in for hermetic runs.
+
+    Serves the shop listing, product pages, cart (with 2idiscount/Edgewords
+    coupon math), checkout, login and order history under the same paths
+    and with the same DOM the POMs target, so the suite runs offline at
+    local-network latency.
+
+    Usage:
+        shop = FakeShop({"user@example.com": "secret"}).start()
+        Helpers.configure(shop.base_url)
+        ...
+        shop.stop()
+    """
+
+    PATH_PREFIX = "/demo-site"
+    SHOP_PAGE_SIZE = 12
+    ORDERS_PAGE_SIZE = 10
+
+    def __init__(self, accounts: Dict[str, str], host: str = "127.0.0.1", port: int = 0):
+        """
+        Initialize the server (not started yet).
+
+        Args:
+            accounts: username -> password of accounts allowed to log in
+            host: Interface to bind
+            port: Port to bind; 0 picks a free one
+        """
+        self.state = ShopState(accounts)
+        self.nonce = secrets.token_hex(5)
+        self._server = ThreadingHTTPServer((host, port), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}{self.PATH_PREFIX}"
+
+    def start(self) -> "FakeShop":
+        """Serve requests on a background thread."""
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop serving and release the port."""
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def _handler_class(self):
+        shop = self
+
+        class Handler(ShopRequestHandler):
+            pass
+
+        Handler.shop = shop
+        return Handler
+
+
+class ShopRequestHandler(BaseHTTPRequestHandler):
+    """Routes one request to the matching page or endpoint."""
+
+    shop: FakeShop
+    protocol_version = "HTTP/1.1"
+    # Headers and body are separate writes; with Nagle on, keep-alive
+    # clients wait ~40 ms for a delayed ACK before the body arrives
+    disable_nagle_algorithm = True
+
+    # Silence per-request logging on stderr
+    def log_message(self, format, *args):
+        pass
+
+    # Request plumbing
+
+    def do_GET(self):
+        self._dispatch("GET")
+
+    def do_POST(self):
+        self._dispatch("POST")
+
+    def do_DELETE(self):
+        self._dispatch("DELETE")
+
+    def _dispatch(self, method: str) -> None:
+        url = urlsplit(self.path)
+        self.query = {k: v[0] for k, v in parse_qs(url.query, keep_blank_values=True).items()}
+        self.form = self._read_body()
+        self.cookies = SimpleCookie(self.headers.get("Cookie", ""))
+        self.set_cookies: List[str] = []
+        self.notices = ""
+
+        path = url.path
+        prefix = FakeShop.PATH_PREFIX
+        if not path.startswith(prefix):
+            return self._send(404, "Not found", "text/plain")
+        path = path[len(prefix):] or "/"
+        if not path.endswith("/"):
+            path += "/"
+
+        if path.startswith("/wp-json/wc/store/v1/"):
+            return self._store_api(method, path[len("/wp-json/wc/store/v1/"):].strip("/"))
+        if "wc-ajax" in self.query:
+            return self._wc_ajax(self.query["wc-ajax"])
+        if method == "GET" and "add-to-cart" in self.query:
+            self._add_to_cart(self.query["add-to-cart"], self.query.get("quantity", "1"))
+
+        for pattern, handler in self.ROUTES:
+            match = re.fullmatch(pattern, path)
+            if match:
+                return handler(self, method, *match.groups())
+        return self._page("Page not found", pages.error_notice("Page not found"), status=404)
+
+    def _read_body(self) -> Dict[str, str]:
+        length = int(self.headers.get("Content-Length") or 0)
+        if not length:
+            return {}
+        raw = self.rfile.read(length).decode("utf-8")
+        content_type = self.headers.get("Content-Type", "")
+        if content_type.startswith("application/json"):
+            return json.loads(raw or "{}")
+        if content_type.startswith("multipart/form-data"):
+            return self._parse_multipart(raw, content_type)
+        return {k: v[0] for k, v in parse_qs(raw, keep_blank_values=True).items()}
+
+    @staticmethod
+    def _parse_multipart(raw: str, content_type: str) -> Dict[str, str]:
+        boundary = content_type.split("boundary=", 1)[1].strip('"')
+        fields = {}
+        for part in raw.split(f"--{boundary}"):
+            match = re.search(r'name="([^"]+)"\r\n\r\n(.*)\r\n$', part, re.S)
+            if match:
+                fields[match.group(1)] = match.group(2)
+        return fields
+
+    def _send(self, status: int, body: str, content_type: str = "text/html; charset=UTF-8",
+              headers: Optional[Dict[str, str]] = None) -> None:
+        data = body.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        for cookie in self.set_cookies:
+            self.send_header("Set-Cookie", cookie)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _redirect(self, location: str) -> None:
+        self._send(302, "", headers={"Location": location})
+
+    def _page(self, title: str, content: str, status: int = 200) -> None:
+        html = pages.layout(self.base, title, content, self.notices, self.shop.nonce)
+        self._send(status, html)
+
+    def _json(self, payload, status: int = 200) -> None:
+        self._send(status, json.dumps(payload), "application/json",
+                   headers={"Nonce": self.shop.nonce})
+
+    @property
+    def base(self) -> str:
+        return self.shop.base_url
+
+    # Session
+
+    def _cookie(self, name: str) -> Optional[str]:
+        morsel = self.cookies.get(name)
+        return morsel.value if morsel else None
+
+    @property
+    def username(self) -> Optional[str]:
+        return self.shop.state.user_for_token(self._cookie(AUTH_COOKIE))
+
+    @property
+    def owner(self) -> str:
+        """Cart owner: the account when logged in, the cookie session otherwise."""
+        if self.username:
+            return f"user:{self.username}"
+        session = self._cookie(SESSION_COOKIE)
+        if session is None:
+            session = secrets.token_hex(8)
+            self.cookies[SESSION_COOKIE] = session
+            self.set_cookies.append(f"{SESSION_COOKIE}={session}; Path=/; HttpOnly")
+        return f"guest:{session}"
+
+    # Cart actions shared by pages and endpoints
+
+    def _add_to_cart(self, product_id: str, quantity: str) -> None:
+        try:
+            item = self.shop.state.add_to_cart(self.owner, int(product_id), int(quantity or 1))
+        except ValueError:
+            item = None
+        if item is not None:
+            self.notices += pages.added_to_cart_notice(self.base, item)
+
+    def _apply_coupon(self, code: str) -> None:
+        if not code.strip():
+            self.notices += pages.error_notice("Please enter a coupon code.")
+            return
+        error = self.shop.state.apply_coupon(self.owner, code)
+        if error:
+            self.notices += pages.error_notice(error)
+        else:
+            self.notices += pages.success_notice("Coupon code applied successfully.")
+
+    # Pages
+
+    def home(self, method):
+        if "s" in self.query:
+            term = self.query["s"]
+            return self._page(f"Search results: {term}",
+                              pages.search_results(self.base, term, self.shop.state.search(term)))
+        self._page("Home", pages.home(self.base))
+
+    def shop_page(self, method, page="1"):
+        page = int(page)
+        products = list(self.shop.state.products.values())
+        size = FakeShop.SHOP_PAGE_SIZE
+        total_pages = max(1, -(-len(products) // size))
+        chunk = products[(page - 1) * size:page * size]
+        self._page("Shop", pages.shop(self.base, chunk, page, total_pages))
+
+    def product_page(self, method, slug):
+        item = self.shop.state.product_by_slug(slug)
+        if item is None:
+            return self._page("Page not found", pages.error_notice("Page not found"), status=404)
+        if method == "POST" and "add-to-cart" in self.form:
+            self._add_to_cart(self.form["add-to-cart"], self.form.get("quantity", "1"))
+        self._page(item.name, pages.product(self.base, item))
+
+    def cart_page(self, method):
+        state = self.shop.state
+        owner = self.owner
+        if "remove_item" in self.query:
+            state.remove_item(owner, self.query["remove_item"])
+            self.notices += pages.success_notice("Item removed.")
+        if "remove_coupon" in self.query:
+            state.remove_coupon(owner, self.query["remove_coupon"])
+            self.notices += pages.success_notice("Coupon has been removed.")
+        if method == "POST":
+            if "apply_coupon" in self.form:
+                self._apply_coupon(self.form.get("coupon_code", ""))
+            elif "update_cart" in self.form:
+                for name, value in self.form.items():
+                    match = re.fullmatch(r"cart\[(\w+)\]\[qty\]", name)
+                    if match:
+                        state.set_quantity(owner, match.group(1), int(value or 0))
+                self.notices += pages.success_notice("Cart updated.")
+        self._page("Cart", pages.cart(self.base, state.cart(owner), state.totals(owner), self.shop.nonce))
+
+    def checkout_page(self, method):
+        state = self.shop.state
+        owner = self.owner
+        if state.cart(owner).is_empty():
+            return self._redirect(f"{self.base}/cart/")
+        if method == "POST":
+            order = state.place_order(owner, self.username or "guest", {
+                name: self.form.get(name, "") for name, _ in pages.BILLING_FIELDS
+            })
+            return self._redirect(f"{self.base}/checkout/order-received/{order.number}/")
+        self._page("Checkout", pages.checkout(self.base, state.totals(owner)))
+
+    def order_received_page(self, method, number):
+        order = self.shop.state.order(int(number))
+        if order is None:
+            return self._page("Checkout", pages.error_notice("Invalid order."), status=404)
+        self._page("Order received", pages.order_received(order))
+
+    def account_page(self, method):
+        if method == "POST" and "login" in self.form:
+            token = self.shop.state.login(self.form.get("username", ""), self.form.get("password", ""))
+            if token is None:
+                self.notices += pages.error_notice("Unknown username or incorrect password.")
+                return self._page("My account", pages.login_form(self.base))
+            self.set_cookies.append(f"{AUTH_COOKIE}={token}; Path=/; HttpOnly")
+            return self._redirect(f"{self.base}/my-account/")
+
+        username = self.username
+        if username is None:
+            return self._page("My account", pages.login_form(self.base))
+        self._page("My account", pages.dashboard(self.base, username))
+
+    def orders_page(self, method, page="1"):
+        username = self.username
+        if username is None:
+            return self._redirect(f"{self.base}/my-account/")
+        page = int(page)
+        size = FakeShop.ORDERS_PAGE_SIZE
+        orders = self.shop.state.orders_for(username)
+        chunk = orders[(page - 1) * size:page * size]
+        self._page("Orders", pages.orders(self.base, chunk, page, len(orders) > page * size))
+
+    def view_order_page(self, method, number):
+        username = self.username
+        if username is None:
+            return self._redirect(f"{self.base}/my-account/")
+        order = self.shop.state.order(int(number))
+        if order is not None and order.username != username:
+            order = None
+        self._page("My account", pages.view_order(self.base, order))
+
+    def logout_page(self, method):
+        self.shop.state.logout(self._cookie(AUTH_COOKIE))
+        self.set_cookies.append(f"{AUTH_COOKIE}=; Path=/; Max-Age=0")
+        self._redirect(f"{self.base}/my-account/")
+
+    ROUTES: List[Tuple[str, object]] = [
+        (r"/", home),
+        (r"/shop/", shop_page),
+        (r"/shop/page/(\d+)/", shop_page),
+        (r"/product/([\w-]+)/", product_page),
+        (r"/cart/", cart_page),
+        (r"/checkout/", checkout_page),
+        (r"/checkout/order-received/(\d+)/", order_received_page),
+        (r"/my-account/", account_page),
+        (r"/my-account/orders/", orders_page),
+        (r"/my-account/orders/(\d+)/", orders_page),
+        (r"/my-account/view-order/(\d+)/", view_order_page),
+        (r"/my-account/customer-logout/", logout_page),
+    ]
+
+    # AJAX and Store API endpoints
+
+    def _wc_ajax(self, endpoint: str) -> None:
+        if endpoint == "apply_coupon":
+            if self.form.get("security") != self.shop.nonce:
+                return self._send(403, "-1", "text/plain")
+            self._apply_coupon(self.form.get("coupon_code", ""))
+            return self._send(200, self.notices)
+        self._send(400, "0", "text/plain")
+
+    def _store_api(self, method: str, route: str) -> None:
+        state = self.shop.state
+        if route == "products" and method == "GET":
+            term = self.query.get("search", "")
+            products = state.search(term) if term else list(state.products.values())
+            return self._json([
+                {
+                    "id": p.id,
+                    "name": p.name,
+                    "permalink": f"{self.base}/product/{p.slug}/",
+                    "prices": {"price": str(int(p.price * 100)), "currency_code": "GBP"},
+                }
+                for p in products
+            ])
+
+        if method != "GET" and self.headers.get("Nonce") != self.shop.nonce:
+            return self._json({"code": "woocommerce_rest_missing_nonce"}, status=401)
+
+        owner = self.owner
+        if route == "cart/add-item" and method == "POST":
+            state.add_to_cart(owner, int(self.form.get("id", 0)), int(self.form.get("quantity", 1)))
+        elif route == "cart/apply-coupon" and method == "POST":
+            error = state.apply_coupon(owner, self.form.get("code", ""))
+            if error:
+                return self._json({"code": "woocommerce_rest_cart_coupon_error", "message": error}, 400)
+        elif route == "cart/remove-coupon" and method == "POST":
+            state.remove_coupon(owner, self.form.get("code", ""))
+        elif route == "cart/items" and method == "DELETE":
+            for key in list(state.cart(owner).lines):
+                state.remove_item(owner, key)
+            return self._json([])
+        elif route != "cart" or method != "GET":
+            return self._json({"code": "rest_no_route"}, status=404)
+
+        self._json(self._cart_payload(owner))
+
+    def _cart_payload(self, owner: str) -> dict:
+        state = self.shop.state
+        basket = state.cart(owner)
+        totals = state.totals(owner)
+        return {
+            "items": [
+                {"key": line.key, "id": line.product.id, "name": line.product.name,
+                 "quantity": line.quantity}
+                for line in basket.lines.values()
+            ],
+            "coupons": [{"code": code} for code in basket.coupons],
+            "items_count": sum(line.quantity for line in basket.lines.values()),
+            "totals": {
+                "total_items": str(int(totals["subtotal"] * 100)),
+                "total_price": str(int(totals["total"] * 100)),
+                "currency_code": "GBP",
+            },
+        }
@@ -0,0 +1,246 @@
+import secrets
+import threading
+from dataclasses import dataclass, field
+from decimal import Decimal
+from typing import Dict, List, Optional, Tuple
+
+from app.utils.money_utils import MoneyUtils
+
+
+@dataclass(frozen=True)
+class Product:
+    """Immutable catalog entry."""
+    id: int
+    name: str
+    slug: str
+    price: Decimal
+
+
+@dataclass
+class CartLine:
+    """One product line in a cart."""
+    key: str
+    product: Product
+    quantity: int
+
+    @property
+    def line_total(self) -> Decimal:
+        return self.product.price * self.quantity
+
+
+@dataclass
+class Cart:
+    """Mutable cart with applied coupon codes."""
+    lines: Dict[str, CartLine] = field(default_factory=dict)
+    coupons: List[str] = field(default_factory=list)
+
+    def is_empty(self) -> bool:
+        return not self.lines
+
+
+@dataclass(frozen=True)
+class Order:
+    """Immutable placed order."""
+    number: int
+    username: str
+    total: Decimal
+    billing: Tuple[Tuple[str, str], ...]
+
+
+class ShopState:
+    """
+    In-memory data behind the fake shop: catalog, accounts, carts, orders.
+
+    Mirrors the WooCommerce behaviour the tests depend on - one persistent
+    cart per logged-in account, a cookie session cart for guests, and
+    percentage coupons applied to the subtotal before flat-rate shipping.
+    All methods are thread-safe.
+    """
+
+    SHIPPING = Decimal("3.95")
+
+    # Coupon code (lower case, as WooCommerce stores them) -> percent off
+    COUPONS = {
+        "2idiscount": 25,
+        "edgewords": 15,
+    }
+
+    CATALOG = (
+        ("Beanie", "18.00"),
+        ("Belt", "55.00"),
+        ("Cap", "16.00"),
+        ("Hoodie", "45.00"),
+        ("Hoodie with Logo", "45.00"),
+        ("Hoodie with Zipper", "45.00"),
+        ("Long Sleeve Tee", "25.00"),
+        ("Polo", "20.00"),
+        ("Sunglasses", "90.00"),
+        ("T-Shirt", "18.00"),
+        ("T-Shirt with Logo", "18.00"),
+        ("Tshirt", "18.00"),
+        ("V-Neck T-Shirt", "20.00"),
+        ("Beanie with Logo", "20.00"),
+        ("Album", "15.00"),
+        ("Single", "3.00"),
+    )
+
+    def __init__(self, accounts: Dict[str, str], first_order_number: int = 1000):
+        """
+        Initialize shop state.
+
+        Args:
+            accounts: username -> password of accounts allowed to log in
+            first_order_number: Number given to the first placed order
+        """
+        self.accounts = dict(accounts)
+        self.products: Dict[int, Product] = {}
+        for index, (name, price) in enumerate(self.CATALOG, start=10):
+            slug = name.lower().replace(" ", "-")
+            self.products[index] = Product(index, name, slug, Decimal(price))
+
+        self._lock = threading.RLock()
+        self._tokens: Dict[str, str] = {}
+        self._carts: Dict[str, Cart] = {}
+        self._orders: List[Order] = []
+        self._next_order = first_order_number
+
+    # Catalog
+
+    def product_by_slug(self, slug: str) -> Optional[Product]:
+        for product in self.products.values():
+            if product.slug == slug:
+                return product
+        return None
+
+    def search(self, term: str) -> List[Product]:
+        term = term.lower()
+        return [p for p in self.products.values() if term in p.name.lower()]
+
+    # Authentication
+
+    def login(self, username: str, password: str) -> Optional[str]:
+        """Return an auth token if the credentials are valid."""
+        with self._lock:
+            if self.accounts.get(username) != password:
+                return None
+            token = secrets.token_hex(16)
+            self._tokens[token] = username
+            return token
+
+    def user_for_token(self, token: Optional[str]) -> Optional[str]:
+        with self._lock:
+            return self._tokens.get(token or "")
+
+    def logout(self, token: Optional[str]) -> None:
+        with self._lock:
+            self._tokens.pop(token or "", None)
+
+    # Cart
+
+    def cart(self, owner: str) -> Cart:
+        """Get the cart of a user ("user:<name>") or guest session ("guest:<id>")."""
+        with self._lock:
+            return self._carts.setdefault(owner, Cart())
+
+    def add_to_cart(self, owner: str, product_id: int, quantity: int = 1) -> Optional[Product]:
+        with self._lock:
+            product = self.products.get(product_id)
+            if product is None or quantity < 1:
+                return None
+            cart = self.cart(owner)
+            key = f"k{product.id}"
+            line = cart.lines.get(key)
+            if line is None:
+                cart.lines[key] = CartLine(key, product, quantity)
+            else:
+                line.quantity += quantity
+            return product
+
+    def remove_item(self, owner: str, key: str) -> None:
+        with self._lock:
+            self.cart(owner).lines.pop(key, None)
+
+    def set_quantity(self, owner: str, key: str, quantity: int) -> None:
+        with self._lock:
+            cart = self.cart(owner)
+            if key not in cart.lines:
+                return
+            if quantity <= 0:
+                del cart.lines[key]
+            else:
+                cart.lines[key].quantity = quantity
+
+    def empty_cart(self, owner: str) -> None:
+        with self._lock:
+            self._carts[owner] = Cart()
+
+    def apply_coupon(self, owner: str, code: str) -> Optional[str]:
+        """
+        Apply a coupon.
+
+        Returns:
+            Error message, or None on success
+        """
+        code = code.strip().lower()
+        with self._lock:
+            cart = self.cart(owner)
+            if code not in self.COUPONS:
+                return f'Coupon "{code}" does not exist!'
+            if code in cart.coupons:
+                return "Coupon code already applied!"
+            cart.coupons.append(code)
+            return None
+
+    def remove_coupon(self, owner: str, code: str) -> None:
+        with self._lock:
+            cart = self.cart(owner)
+            code = code.strip().lower()
+            if code in cart.coupons:
+                cart.coupons.remove(code)
+
+    def totals(self, owner: str) -> Dict[str, Decimal]:
+        """Subtotal, per-coupon discounts, shipping and total of a cart."""
+        with self._lock:
+            cart = self.cart(owner)
+            subtotal = sum((line.line_total for line in cart.lines.values()), Decimal("0.00"))
+            discounts = {
+                code: MoneyUtils.pct(subtotal, self.COUPONS[code]) for code in cart.coupons
+            }
+            shipping = self.SHIPPING if cart.lines else Decimal("0.00")
+            total = MoneyUtils.round2(subtotal - sum(discounts.values(), Decimal("0")) + shipping)
+            return {
+                "subtotal": MoneyUtils.round2(subtotal),
+                "discounts": discounts,
+                "shipping": shipping,
+                "total": total,
+            }
+
+    # Orders
+
+    def place_order(self, owner: str, username: str, billing: Dict[str, str]) -> Optional[Order]:
+        with self._lock:
+            cart = self.cart(owner)
+            if cart.is_empty():
+                return None
+            order = Order(
+                number=self._next_order,
+                username=username,
+                total=self.totals(owner)["total"],
+                billing=tuple(sorted(billing.items())),
+            )
+            self._next_order += 1
+            self._orders.append(order)
+            self.empty_cart(owner)
+            return order
+
+    def orders_for(self, username: str) -> List[Order]:
+        """Orders of a user, newest first (as My Account lists them)."""
+        with self._lock:
+            return [o for o in reversed(self._orders) if o.username == username]
+
+    def order(self, number: int) -> Optional[Order]:
+        with self._lock:
+            for order in self._orders:
+                if order.number == number:
+                    return order
+            return None
@@ -1,6 +1,6 @@
 from dataclasses import dataclass
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BillingDetails:
     """Immutable billing details for checkout."""
     first_name: str
@@ -0,0 +1,12 @@
+# models/cart_line_item.py
+from dataclasses import dataclass
+from decimal import Decimal
+
+@dataclass(frozen=True, slots=True)
+class CartLineItem:
+    """Immutable row of the cart table."""
+    name: str
+    unit_price: Decimal
+    quantity: int
+    line_total: Decimal
+    key: str = ""
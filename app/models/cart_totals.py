@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 from decimal import Decimal
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CartTotals:
     """Immutable cart monetary totals."""
     subtotal: Decimal
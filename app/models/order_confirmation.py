@@ -1,7 +1,7 @@
 # models/order_confirmation.py
 from dataclasses import dataclass
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class OrderConfirmation:
     """Immutable order confirmation details."""
     order_number: str
@@ -0,0 +1,153 @@
+from typing import Callable, Dict, Tuple, TypeVar
+from weakref import WeakKeyDictionary
+
+from selenium.common.exceptions import NoSuchElementException, StaleElementReferenceException
+from selenium.webdriver.remote.webelement import WebElement
+
+from app.utils.dom_snapshot import DomSnapshot, ElementState
+
+Locator = Tuple[str, str]
+T = TypeVar("T")
+
+
+class ElementCache:
+    """
+    Located elements for one driver, shared by every POM built on it.
+
+    Steps rebuild POMs for each test, so the cache lives per driver rather
+    than per POM instance. Entries are never checked up front: a cached
+    element that went stale (navigation, AJAX re-render) raises
+    StaleElementReferenceException on use and is transparently re-found.
+    """
+
+    _by_driver: "WeakKeyDictionary[object, ElementCache]" = WeakKeyDictionary()
+
+    def __init__(self, driver):
+        self.driver = driver
+        self._elements: Dict[Locator, WebElement] = {}
+
+    @classmethod
+    def for_driver(cls, driver) -> "ElementCache":
+        """Get the cache attached to a driver, creating it on first use."""
+        cache = cls._by_driver.get(driver)
+        if cache is None:
+            cache = cls(driver)
+            cls._by_driver[driver] = cache
+        return cache
+
+    def get(self, locator: Locator) -> WebElement:
+        """Return the cached element, locating it on a miss."""
+        element = self._elements.get(locator)
+        if element is None:
+            element = self.driver.find_element(*locator)
+            self._elements[locator] = element
+        return element
+
+    def invalidate(self, locator: Locator) -> None:
+        """Forget one element."""
+        self._elements.pop(locator, None)
+
+    def clear(self) -> None:
+        """Forget every element (e.g. after driver.get)."""
+        self._elements.clear()
+
+
+class BasePOM:
+    """
+    Base Page Object with a class-level locator registry and cached lookups.
+
+    Locators are declared once as class attributes - (By strategy, value)
+    tuples - and collected into `locators` when the subclass is defined.
+    Interactions go through the helpers below, which reuse elements found
+    earlier on the same page and re-find them when they go stale.
+    """
+
+    locators: Dict[str, Locator] = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        registry = {}
+        for klass in reversed(cls.__mro__):
+            for name, value in vars(klass).items():
+                if BasePOM._is_locator(value):
+                    registry[name] = value
+        cls.locators = registry
+
+    def __init__(self, driver):
+        """
+        Initialize POM with WebDriver.
+
+        Args:
+            driver: WebDriver instance
+        """
+        self.driver = driver
+        self.elements = ElementCache.for_driver(driver)
+
+    @staticmethod
+    def _is_locator(value) -> bool:
+        return (
+            isinstance(value, tuple)
+            and len(value) == 2
+            and all(isinstance(part, str) for part in value)
+        )
+
+    def open_page(self, url: str) -> None:
+        """Navigate to a URL and forget elements found on the previous page."""
+        self.driver.get(url)
+        self.elements.clear()
+
+    def find(self, locator: Locator) -> WebElement:
+        """Get an element, reusing the cached one if still valid."""
+        return self.elements.get(locator)
+
+    def with_element(self, locator: Locator, action: Callable[[WebElement], T]) -> T:
+        """
+        Run an action on an element, re-finding it once if it went stale.
+
+        Args:
+            locator: Locator tuple
+            action: Callable receiving the element
+        """
+        try:
+            return action(self.find(locator))
+        except StaleElementReferenceException:
+            self.elements.invalidate(locator)
+            return action(self.find(locator))
+
+    def click(self, locator: Locator) -> None:
+        """Click an element."""
+        self.with_element(locator, lambda el: el.click())
+
+    def fill(self, locator: Locator, text: str) -> None:
+        """Clear a field and type text into it."""
+        def clear_and_type(element):
+            element.clear()
+            element.send_keys(text)
+
+        self.with_element(locator, clear_and_type)
+
+    def text(self, locator: Locator) -> str:
+        """Get the visible text of an element."""
+        return self.with_element(locator, lambda el: el.text)
+
+    def is_selected(self, locator: Locator) -> bool:
+        """Check if a checkbox/radio is selected."""
+        return self.with_element(locator, lambda el: el.is_selected())
+
+    def is_displayed(self, locator: Locator) -> bool:
+        """Check if an element is present and visible."""
+        try:
+            return self.with_element(locator, lambda el: el.is_displayed())
+        except NoSuchElementException:
+            self.elements.invalidate(locator)
+            return False
+
+    def snapshot(self, *names: str) -> Dict[str, ElementState]:
+        """
+        Read registered locators in one round-trip via DomSnapshot.
+
+        Args:
+            names: Registry names to read; all registered locators if omitted
+        """
+        names = names or tuple(self.locators)
+        return DomSnapshot.read(self.driver, {name: self.locators[name] for name in names})
@@ -1,13 +1,163 @@
 from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.common.exceptions import ElementNotVisibleException, NoSuchElementException
 from decimal import Decimal
-from typing import List
+import re
+from typing import Dict, List, Optional
 
+import requests
+
+from app.models.cart_line_item import CartLineItem
 from app.models.cart_totals import CartTotals
+from app.pom.base_pom import BasePOM
 from app.utils.money_utils import MoneyUtils
+from app.utils.page_script import PageScript
+
+# Empties the cart through the WooCommerce Store API from inside the page, so
+# the request carries the browser's session cookies. The cost does not grow
+# with the items in the cart: read cart (and nonce), remove each coupon in
+# turn, delete all items, read cart again to verify.
+RESET_SCRIPT = PageScript("""
+    const api = arguments[0];
+    const done = arguments[arguments.length - 1];
+    const call = (method, route, body) => fetch(api + route, {
+        method: method,
+        credentials: 'same-origin',
+        headers: { 'Content-Type': 'application/json', 'Nonce': nonce },
+        body: body ? JSON.stringify(body) : undefined,
+    }).then((response) => {
+        if (!response.ok) { throw new Error(method + ' ' + route + ': ' + response.status); }
+        return response;
+    });
+    let nonce = '';
+    (async () => {
+        const current = await call('GET', '/cart');
+        nonce = current.headers.get('Nonce') || current.headers.get('X-WC-Store-API-Nonce') || '';
+        const cart = await current.json();
+        // One at a time: concurrent updates of the same cart session can be lost
+        for (const coupon of cart.coupons || []) {
+            await call('POST', '/cart/remove-coupon', { code: coupon.code });
+        }
+        await call('DELETE', '/cart/items');
+        const after = await (await call('GET', '/cart')).json();
+        done({ items: after.items_count || 0, coupons: (after.coupons || []).length });
+    })().catch((error) => done({ error: String(error) }));
+""")
+
+
+@RESET_SCRIPT.over_http
+def _reset_over_http(driver, api: str) -> dict:
+    """RESET_SCRIPT on HttpDriver: the same Store API calls over the driver's own session."""
+    def call(method: str, route: str, nonce: str = "", body: Optional[dict] = None):
+        response = driver.http.request(
+            method, api + route, json=body, headers={"Nonce": nonce}, timeout=driver.timeout
+        )
+        if not response.ok:
+            raise requests.HTTPError(f"{method} {route}: {response.status_code}")
+        return response
+
+    try:
+        current = call("GET", "/cart")
+        nonce = current.headers.get("Nonce") or current.headers.get("X-WC-Store-API-Nonce") or ""
+        for coupon in current.json().get("coupons") or []:
+            call("POST", "/cart/remove-coupon", nonce, {"code": coupon["code"]})
+        call("DELETE", "/cart/items", nonce)
+        after = call("GET", "/cart").json()
+    except (requests.RequestException, ValueError) as error:
+        return {"error": str(error)}
+    return {"items": after.get("items_count") or 0, "coupons": len(after.get("coupons") or [])}
+
+
+# Reads the whole cart table in one call as compact rows:
+# [cart item key, product name, unit price text, quantity, line total text]
+LINE_ITEMS_SCRIPT = PageScript("""
+    const text = (row, selector) => {
+        const cell = row.querySelector(selector);
+        return cell ? cell.textContent.trim() : '';
+    };
+    return Array.from(document.querySelectorAll('tr.cart_item'), (row) => {
+        const qty = row.querySelector('input.qty');
+        const match = qty ? /cart\\[(\\w+)\\]/.exec(qty.name) : null;
+        return [
+            match ? match[1] : '',
+            text(row, 'td.product-name a') || text(row, 'td.product-name'),
+            text(row, 'td.product-price'),
+            qty ? qty.value : '1',
+            text(row, 'td.product-subtotal'),
+        ];
+    });
+""")
+
+
+def _product_name(row) -> str:
+    return PageScript.text_of(row, "td.product-name a") or PageScript.text_of(row, "td.product-name")
+
+
+@LINE_ITEMS_SCRIPT.over_http
+def _line_items_over_http(driver) -> List[list]:
+    """LINE_ITEMS_SCRIPT on HttpDriver."""
+    rows = []
+    for row in driver.find_elements(By.CSS_SELECTOR, "tr.cart_item"):
+        qty = row.find_elements(By.CSS_SELECTOR, "input.qty")
+        match = re.search(r"cart\[(\w+)\]", qty[0].get_attribute("name") or "") if qty else None
+        rows.append([
+            match.group(1) if match else "",
+            _product_name(row),
+            PageScript.text_of(row, "td.product-price"),
+            qty[0].get_attribute("value") if qty else "1",
+            PageScript.text_of(row, "td.product-subtotal"),
+        ])
+    return rows
+
+
+# Sets the quantity input of every named product and fires the change
+# event that enables WooCommerce's update button. A name matches the row
+# with exactly that product name, else the first row containing it (like
+# the old contains() XPath). Returns names not found.
+SET_QUANTITIES_SCRIPT = PageScript("""
+    const wanted = arguments[0];
+    const rows = [];
+    for (const row of document.querySelectorAll('tr.cart_item')) {
+        const link = row.querySelector('td.product-name a') || row.querySelector('td.product-name');
+        const qty = row.querySelector('input.qty');
+        if (qty) { rows.push([link ? link.textContent.trim() : '', qty]); }
+    }
+    const missing = [];
+    for (const [name, quantity] of Object.entries(wanted)) {
+        const row = rows.find(([text]) => text === name) || rows.find(([text]) => text.includes(name));
+        if (!row) { missing.push(name); continue; }
+        const qty = row[1];
+        qty.value = String(quantity);
+        qty.dispatchEvent(new Event('input', { bubbles: true }));
+        qty.dispatchEvent(new Event('change', { bubbles: true }));
+    }
+    return missing;
+""")
+
+
+@SET_QUANTITIES_SCRIPT.over_http
+def _set_quantities_over_http(driver, wanted: Dict[str, int]) -> List[str]:
+    """SET_QUANTITIES_SCRIPT on HttpDriver: types each quantity."""
+    rows = []
+    for row in driver.find_elements(By.CSS_SELECTOR, "tr.cart_item"):
+        qty = row.find_elements(By.CSS_SELECTOR, "input.qty")
+        if qty:
+            rows.append((_product_name(row), qty[0]))
+
+    missing = []
+    for name, quantity in wanted.items():
+        qty = next((q for text, q in rows if text == name), None) or next(
+            (q for text, q in rows if name in text), None
+        )
+        if qty is None:
+            missing.append(name)
+            continue
+        qty.clear()
+        qty.send_keys(str(quantity))
+    return missing
 
 
-class CartPOM:
+class CartPOM(BasePOM):
     """
     Page Object for cart page - element interactions only.
 
@@ -22,6 +172,22 @@ class CartPOM:
     - Implement business workflows
     """
 
+    # Locators as tuples (strategy, value), registered once per class
+    subtotal_amount = (By.CSS_SELECTOR, ".cart-subtotal .woocommerce-Price-amount")
+    discount_amount = (By.CSS_SELECTOR, "tr.cart-discount td")
+    shipping_amount = (By.CSS_SELECTOR, "tr.shipping .woocommerce-Price-amount")
+    order_total_amount = (By.CSS_SELECTOR, ".order-total .woocommerce-Price-amount")
+
+    coupon_field = (By.ID, "coupon_code")
+    apply_coupon_button = (By.NAME, "apply_coupon")
+
+    remove_buttons = (By.CSS_SELECTOR, "a.remove")
+    remove_coupon_buttons = (By.CSS_SELECTOR, "a.woocommerce-remove-coupon")
+    update_cart_button = (By.NAME, "update_cart")
+
+    cart_form = (By.CSS_SELECTOR, "form.woocommerce-cart-form")
+    empty_cart_message = (By.CSS_SELECTOR, ".cart-empty")
+
     def __init__(self, driver: WebDriver):
         """
         Initialize Cart POM with WebDriver.
@@ -29,20 +195,7 @@ class CartPOM:
         Args:
             driver: WebDriver instance
         """
-        self.driver = driver
-
-        # Define locators as tuples (strategy, value)
-        self.subtotal_amount = (By.CSS_SELECTOR, ".cart-subtotal .woocommerce-Price-amount")
-        self.discount_amount = (By.CSS_SELECTOR, "tr.cart-discount td")
-        self.shipping_amount = (By.CSS_SELECTOR, "tr.shipping .woocommerce-Price-amount")
-        self.order_total_amount = (By.CSS_SELECTOR, ".order-total .woocommerce-Price-amount")
-
-        self.coupon_field = (By.ID, "coupon_code")
-        self.apply_coupon_button = (By.NAME, "apply_coupon")
-
-        self.remove_buttons = (By.CSS_SELECTOR, "a.remove")
-        self.remove_coupon_buttons = (By.CSS_SELECTOR, "a.woocommerce-remove-coupon")
-        self.update_cart_button = (By.NAME, "update_cart")
+        super().__init__(driver)
 
 
     def enter_coupon_code(self, code: str) -> None:
@@ -52,13 +205,24 @@ class CartPOM:
         Args:
             code: Coupon code to enter
         """
-        element = self.driver.find_element(*self.coupon_field)
-        element.clear()
-        element.send_keys(code)
+        self.fill(self.coupon_field, code)
 
     def click_apply_coupon(self) -> None:
         """Click the apply coupon button."""
-        self.driver.find_element(*self.apply_coupon_button).click()
+        self.click(self.apply_coupon_button)
+
+    def reset_via_store_api(self, store_api_url: str) -> Dict:
+        """
+        Remove every item and coupon with one in-page script call.
+
+        Args:
+            store_api_url: Helpers.STORE_API_URL
+
+        Returns:
+            dict: Items and coupons left afterwards, or an 'error' message
+                  if the Store API is not available
+        """
+        return self.driver.execute_async_script(RESET_SCRIPT, store_api_url)
 
     def click_remove_all_coupons(self) -> None:
         """Remove all applied coupons from cart."""
@@ -86,55 +250,60 @@ class CartPOM:
 
     def click_update_cart(self) -> None:
         """Click the update cart button."""
-        self.driver.find_element(*self.update_cart_button).click()
+        self.click(self.update_cart_button)
 
     def get_totals(self) -> CartTotals:
         """
         Get cart totals as CartTotals model object.
 
+        All four amounts are read with a single DomSnapshot call instead of
+        up to six find_element/.text round-trips.
+
         Returns:
             CartTotals: Model containing subtotal, discount, shipping, and total
+
+        Raises:
+            NoSuchElementException: If subtotal, shipping or total is missing
+            ElementNotVisibleException: If one of them is present but hidden
         """
-        subtotal = MoneyUtils.parse(
-            self.driver.find_element(*self.subtotal_amount).text
+        snapshot = self.snapshot(
+            "subtotal_amount", "discount_amount", "shipping_amount", "order_total_amount"
         )
 
+        for name in ("subtotal_amount", "shipping_amount", "order_total_amount"):
+            if not snapshot[name].present:
+                raise NoSuchElementException(f"Cart element not found: {name}")
+            if not snapshot[name].visible:
+                # A hidden element has no text, which would parse as 0.00
+                raise ElementNotVisibleException(f"Cart element not visible: {name}")
+
         # Discount may not be present if no coupon applied
         discount = Decimal('0.00')
-        if self.is_discount_displayed():
-            discount_text = self.driver.find_element(*self.discount_amount).text
-            discount = abs(MoneyUtils.parse(discount_text))  # Make positive
-
-        shipping = MoneyUtils.parse(
-            self.driver.find_element(*self.shipping_amount).text
-        )
-
-        total = MoneyUtils.parse(
-            self.driver.find_element(*self.order_total_amount).text
-        )
+        if snapshot["discount_amount"].visible:
+            discount = abs(MoneyUtils.parse(snapshot["discount_amount"].text))  # Make positive
 
         return CartTotals(
-            subtotal=subtotal,
+            subtotal=MoneyUtils.parse(snapshot["subtotal_amount"].text),
             discount=discount,
-            shipping=shipping,
-            total=total
+            shipping=MoneyUtils.parse(snapshot["shipping_amount"].text),
+            total=MoneyUtils.parse(snapshot["order_total_amount"].text)
         )
 
     def get_subtotal_text(self) -> str:
         """Get raw subtotal text from page."""
-        return self.driver.find_element(*self.subtotal_amount).text
+        return self.text(self.subtotal_amount)
 
     def get_discount_text(self) -> str:
         """Get raw discount text from page."""
-        return self.driver.find_element(*self.discount_amount).text
+        return self.text(self.discount_amount)
 
     def get_shipping_text(self) -> str:
         """Get raw shipping text from page."""
-        return self.driver.find_element(*self.shipping_amount).text
+        return self.text(self.shipping_amount)
 
     def get_total_text(self) -> str:
         """Get raw total text from page."""
-        return self.driver.find_element(*self.order_total_amount).text
+        return self.text(self.order_total_amount)
 
 
 
@@ -145,11 +314,7 @@ class CartPOM:
         Returns:
             bool: True if discount is visible, False otherwise
         """
-        try:
-            element = self.driver.find_element(*self.discount_amount)
-            return element.is_displayed()
-        except Exception:
-            return False
+        return self.is_displayed(self.discount_amount)
 
     def is_cart_empty(self) -> bool:
         """
@@ -182,31 +347,54 @@ class CartPOM:
         return len(coupons) > 0
 
 
-    def update_product_quantity(self, product_name: str, quantity: int) -> None:
+    def get_line_items(self) -> List[CartLineItem]:
+        """
+        Get every row of the cart table with a single script call.
+
+        Returns:
+            List[CartLineItem]: Rows in table order (empty if the cart is empty)
+        """
+        rows = self.driver.execute_script(LINE_ITEMS_SCRIPT)
+        prices = MoneyUtils.parse_many(row[2] for row in rows)
+        totals = MoneyUtils.parse_many(row[4] for row in rows)
+        return [
+            CartLineItem(
+                name=name,
+                unit_price=price,
+                quantity=int(quantity or 0),
+                line_total=total,
+                key=key,
+            )
+            for (key, name, _, quantity, _), price, total in zip(rows, prices, totals)
+        ]
+
+    def set_quantities(self, quantities: Dict[str, int]) -> List[str]:
+        """
+        Set the quantity inputs of several products in one script call.
+
+        The cart is not updated until click_update_cart().
+
+        Args:
+            quantities: Product name -> new quantity (0 removes the line); a
+                name matches the line with exactly that name, else the first
+                line containing it
+
+        Returns:
+            List[str]: Product names not found in the cart
+        """
+        return self.driver.execute_script(
+            SET_QUANTITIES_SCRIPT, {name: int(qty) for name, qty in quantities.items()}
+        )
+
+    def update_product_quantity(self, product_name: str, quantity: int) -> List[str]:
         """
         Update quantity for a specific product.
 
         Args:
-            product_name: Name of product to update
+            product_name: Name, or part of the name, of the product to update
             quantity: New quantity value
 
-        Note: Implementation depends on your page structure.
+        Returns:
+            List[str]: [product_name] if no cart line matches it, else empty
         """
-        # Example implementation - adjust based on your HTML
-        try:
-            # Find the row containing the product
-            product_row = self.driver.find_element(
-                By.XPATH,
-                f"//td[@data-title='Product']//a[contains(text(), '{product_name}')]"
-                "/ancestor::tr"
-            )
-
-            # Find quantity input in that row
-            qty_input = product_row.find_element(
-                By.CSS_SELECTOR,
-                "input.qty"
-            )
-            qty_input.clear()
-            qty_input.send_keys(str(quantity))
-        except Exception as e:
-            print(f"Could not update quantity for {product_name}: {e}")
+        return self.set_quantities({product_name: quantity})
@@ -1,99 +1,156 @@
 from selenium.webdriver.common.by import By
 from selenium.common.exceptions import ElementClickInterceptedException
-
-
-class CheckoutPOM:
+from typing import Dict, List
+from app.pom.base_pom import BasePOM
+from app.utils.page_script import PageScript
+
+# Sets every field by id and fires the events WooCommerce listens to
+# (validation, update_checkout). Returns ids it could not set.
+FILL_SCRIPT = PageScript("""
+    const missing = [];
+    for (const [id, value] of Object.entries(arguments[0])) {
+        const field = document.getElementById(id);
+        if (!field || field.disabled || field.readOnly) { missing.push(id); continue; }
+        if (field.tagName === 'SELECT') {
+            field.value = value;
+            if (field.value !== value) { missing.push(id); continue; }
+        } else {
+            // Native setter, so framework-controlled inputs notice the change
+            const proto = field.tagName === 'TEXTAREA' ? HTMLTextAreaElement : HTMLInputElement;
+            Object.getOwnPropertyDescriptor(proto.prototype, 'value').set.call(field, value);
+        }
+        field.dispatchEvent(new Event('input', { bubbles: true }));
+        field.dispatchEvent(new Event('change', { bubbles: true }));
+    }
+    return missing;
+""")
+SCROLL_INTO_VIEW_SCRIPT = PageScript("arguments[0].scrollIntoView({block:'center'});", http=PageScript.ignore)
+CLICK_SCRIPT = PageScript("arguments[0].click();", http=lambda driver, element: element.click())
+
+
+@FILL_SCRIPT.over_http
+def _fill_over_http(driver, values: Dict[str, str]) -> List[str]:
+    """FILL_SCRIPT on HttpDriver: types each value into its field."""
+    missing = []
+    for field_id, value in values.items():
+        fields = driver.find_elements(By.ID, field_id)
+        field = fields[0] if fields else None
+        if field is None or not field.is_enabled() or field.get_dom_attribute("readonly") is not None:
+            missing.append(field_id)
+        elif field.tag_name == "select":
+            options = [
+                option for option in field.find_elements(By.CSS_SELECTOR, "option")
+                if option.get_attribute("value") == value
+            ]
+            if options:
+                options[0].click()
+            else:
+                missing.append(field_id)
+        else:
+            field.clear()
+            field.send_keys(value)
+    return missing
+
+
+class CheckoutPOM(BasePOM):
     """Page Object for checkout page - element interactions only."""
 
+    first_name_field = (By.ID, "billing_first_name")
+    last_name_field = (By.ID, "billing_last_name")
+    address1_field = (By.ID, "billing_address_1")
+    address2_field = (By.ID, "billing_address_2")
+    city_field = (By.ID, "billing_city")
+    county_field = (By.ID, "billing_state")
+    postcode_field = (By.ID, "billing_postcode")
+    phone_field = (By.ID, "billing_phone")
+    cheque_radio = (By.ID, "payment_method_cheque")
+    cheque_label = (By.CSS_SELECTOR, "li.payment_method_cheque label")
+    place_order_button = (By.ID, "place_order")
+
+    # BillingDetails field -> locator
+    BILLING_FIELDS = {
+        "first_name": first_name_field,
+        "last_name": last_name_field,
+        "address1": address1_field,
+        "address2": address2_field,
+        "city": city_field,
+        "county": county_field,
+        "postcode": postcode_field,
+        "phone": phone_field,
+    }
+
     def __init__(self, driver, waiter):
-        self.driver = driver
+        super().__init__(driver)
         self.waiter = waiter
 
-        self.first_name_field = (By.ID, "billing_first_name")
-        self.last_name_field = (By.ID, "billing_last_name")
-        self.address1_field = (By.ID, "billing_address_1")
-        self.address2_field = (By.ID, "billing_address_2")
-        self.city_field = (By.ID, "billing_city")
-        self.county_field = (By.ID, "billing_state")
-        self.postcode_field = (By.ID, "billing_postcode")
-        self.phone_field = (By.ID, "billing_phone")
-        self.cheque_radio = (By.ID, "payment_method_cheque")
-        self.cheque_label = (By.CSS_SELECTOR, "li.payment_method_cheque label")
-        self.place_order_button = (By.ID, "place_order")
-
     def enter_first_name(self, first_name: str):
         """Enter first name."""
-        element = self.driver.find_element(*self.first_name_field)
-        element.clear()
-        element.send_keys(first_name)
+        self.fill(self.first_name_field, first_name)
 
     def enter_last_name(self, last_name: str):
         """Enter last name."""
-        element = self.driver.find_element(*self.last_name_field)
-        element.clear()
-        element.send_keys(last_name)
+        self.fill(self.last_name_field, last_name)
 
     def enter_address1(self, address: str):
         """Enter address line 1."""
-        element = self.driver.find_element(*self.address1_field)
-        element.clear()
-        element.send_keys(address)
+        self.fill(self.address1_field, address)
 
     def enter_address2(self, address: str):
         """Enter address line 2."""
-        element = self.driver.find_element(*self.address2_field)
-        element.clear()
-        element.send_keys(address)
+        self.fill(self.address2_field, address)
 
     def enter_city(self, city: str):
         """Enter city."""
-        element = self.driver.find_element(*self.city_field)
-        element.clear()
-        element.send_keys(city)
+        self.fill(self.city_field, city)
 
     def enter_county(self, county: str):
         """Enter county."""
-        element = self.driver.find_element(*self.county_field)
-        element.clear()
-        element.send_keys(county)
+        self.fill(self.county_field, county)
 
     def enter_postcode(self, postcode: str):
         """Enter postcode."""
-        element = self.driver.find_element(*self.postcode_field)
-        element.clear()
-        element.send_keys(postcode)
+        self.fill(self.postcode_field, postcode)
 
     def enter_phone(self, phone: str):
         """Enter phone number."""
-        element = self.driver.find_element(*self.phone_field)
-        element.clear()
-        element.send_keys(phone)
+        self.fill(self.phone_field, phone)
+
+    def fill_all(self, values: Dict[tuple, str]) -> List[tuple]:
+        """
+        Set several fields in a single script call.
+
+        Args:
+            values: By.ID locator -> value
+
+        Returns:
+            List: Locators that could not be set this way (missing, disabled,
+                  or a select without that option) - fill them with fill()
+        """
+        by_id = {locator[1]: value for locator, value in values.items()}
+        missing = set(self.driver.execute_script(FILL_SCRIPT, by_id))
+        return [locator for locator in values if locator[1] in missing]
 
     def select_cheque_payment(self):
         """Select cheque payment method."""
         self.waiter.clickable(self.cheque_label)
 
-        radio = self.driver.find_element(*self.cheque_radio)
-        if radio.is_selected():
+        if self.is_selected(self.cheque_radio):
             return
 
-        label = self.driver.find_element(*self.cheque_label)
+        label = self.find(self.cheque_label)
 
         # Scroll into view
-        self.driver.execute_script(
-            "arguments[0].scrollIntoView({block:'center'});",
-            label
-        )
+        self.driver.execute_script(SCROLL_INTO_VIEW_SCRIPT, label)
 
         try:
             label.click()
         except ElementClickInterceptedException:
-            self.driver.execute_script("arguments[0].click();", label)
+            self.driver.execute_script(CLICK_SCRIPT, label)
 
     def click_place_order(self):
         """Click place order button."""
-        self.driver.find_element(*self.place_order_button).click()
+        self.click(self.place_order_button)
 
     def is_cheque_selected(self) -> bool:
         """Check if cheque payment is selected."""
-        return self.driver.find_element(*self.cheque_radio).is_selected()
\ No newline at end of file
+        return self.is_selected(self.cheque_radio)
\ No newline at end of file
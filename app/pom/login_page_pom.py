@@ -1,32 +1,27 @@
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from app.pom.base_pom import BasePOM
 
 
-class LoginPagePOM:
+class LoginPagePOM(BasePOM):
     """Page Object for login page - element interactions only."""
 
-    def __init__(self, driver):
-        self.driver = driver
-        self.username_field = (By.ID, "username")
-        self.password_field = (By.ID, "password")
-        self.submit_button = (By.CSS_SELECTOR, "button[name='login']")
+    username_field = (By.ID, "username")
+    password_field = (By.ID, "password")
+    submit_button = (By.CSS_SELECTOR, "button[name='login']")
 
     def enter_username(self, username: str):
         """Enter username into field."""
-        element = self.driver.find_element(*self.username_field)
-        element.clear()
-        element.send_keys(username)
+        self.fill(self.username_field, username)
 
     def enter_password(self, password: str):
         """Enter password into field."""
-        element = self.driver.find_element(*self.password_field)
-        element.clear()
-        element.send_keys(password)
+        self.fill(self.password_field, password)
 
     def click_submit(self):
         """Click login submit button."""
-        self.driver.find_element(*self.submit_button).click()
+        self.click(self.submit_button)
 
     def get_current_url(self) -> str:
         """Get current page URL."""
@@ -1,31 +1,66 @@
 from selenium.webdriver.common.by import By
-from typing import List
+from typing import List, Optional, Tuple
+from app.pom.base_pom import BasePOM
+from app.utils.page_script import PageScript
 
+# Reads every order number and the Next link of a history page in one call
+ORDERS_PAGE_SCRIPT = PageScript("""
+    const links = document.querySelectorAll(arguments[0]);
+    const next = document.querySelector(arguments[1]);
+    return [
+        Array.from(links, (link) => link.textContent.replace('#', '').trim()),
+        next ? next.href : null
+    ];
+""")
 
-class MyAccountOrdersPOM:
+
+@ORDERS_PAGE_SCRIPT.over_http
+def _orders_page_over_http(driver, links_css: str, next_css: str) -> list:
+    """ORDERS_PAGE_SCRIPT on HttpDriver."""
+    numbers = [
+        link.get_attribute("textContent").replace("#", "", 1).strip()
+        for link in driver.find_elements(By.CSS_SELECTOR, links_css)
+    ]
+    return [numbers, PageScript.href_of(driver, next_css)]
+
+
+class MyAccountOrdersPOM(BasePOM):
     """Page Object for My Account Orders page."""
 
-    def __init__(self, driver):
-        self.driver = driver
-        self.orders_link = (By.LINK_TEXT, "Orders")
-        self.order_links = (
-            By.CSS_SELECTOR,
-            "table.woocommerce-orders-table tbody tr "
-            "td.woocommerce-orders-table__cell-order-number a"
-        )
+    orders_link = (By.LINK_TEXT, "Orders")
+    order_links = (
+        By.CSS_SELECTOR,
+        "table.woocommerce-orders-table tbody tr "
+        "td.woocommerce-orders-table__cell-order-number a"
+    )
+    next_page_link = (By.CSS_SELECTOR, "a.woocommerce-button--next")
+    viewed_order_number = (By.CSS_SELECTOR, "mark.order-number")
 
     def click_orders_tab(self):
         """Click Orders tab."""
-        self.driver.find_element(*self.orders_link).click()
+        self.click(self.orders_link)
+
+    def read_orders_page(self) -> Tuple[List[str], Optional[str]]:
+        """
+        Read the current history page in a single script call.
+
+        Returns:
+            Tuple: Order numbers on this page, URL of the next page (None on the last)
+        """
+        numbers, next_url = self.driver.execute_script(
+            ORDERS_PAGE_SCRIPT, self.order_links[1], self.next_page_link[1]
+        )
+        return numbers, next_url
 
     def get_all_order_numbers(self) -> List[str]:
         """Get all order numbers from orders table."""
-        order_elements = self.driver.find_elements(*self.order_links)
-        return [
-            elem.text.replace("#", "").strip()
-            for elem in order_elements
-        ]
+        return self.read_orders_page()[0]
 
     def is_order_number_displayed(self, order_number: str) -> bool:
         """Check if specific order number is displayed."""
         return order_number in self.get_all_order_numbers()
+
+    def get_viewed_order_number(self) -> Optional[str]:
+        """Order number of the view-order page, None if the order is not viewable."""
+        marks = self.driver.find_elements(*self.viewed_order_number)
+        return marks[0].text.strip() if marks else None
@@ -1,20 +1,16 @@
 from selenium.webdriver.common.by import By
+from app.pom.base_pom import BasePOM
 
 
-class OrderConfirmationPOM:
+class OrderConfirmationPOM(BasePOM):
     """Page Object for order confirmation page."""
 
-    def __init__(self, driver):
-        self.driver = driver
-        self.order_number_element = (By.CSS_SELECTOR, ".order > strong")
+    order_number_element = (By.CSS_SELECTOR, ".order > strong")
 
     def get_order_number(self) -> str:
         """Get order number from confirmation page."""
-        return self.driver.find_element(*self.order_number_element).text.strip()
+        return self.text(self.order_number_element).strip()
 
     def is_order_confirmation_displayed(self) -> bool:
         """Check if order confirmation is displayed."""
-        try:
-            return self.driver.find_element(*self.order_number_element).is_displayed()
-        except:
-            return False
\ No newline at end of file
+        return self.is_displayed(self.order_number_element)
\ No newline at end of file
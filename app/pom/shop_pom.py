@@ -1,29 +1,65 @@
 from selenium.webdriver.common.by import By
 from selenium.common.exceptions import NoSuchElementException
+from typing import List, Optional, Tuple
+from app.pom.base_pom import BasePOM
+from app.utils.page_script import PageScript
 
+# Reads every product's name and URL and the next-page link in one call
+CATALOG_PAGE_SCRIPT = PageScript("""
+    const links = document.querySelectorAll(arguments[0]);
+    const next = document.querySelector(arguments[2]);
+    return [
+        Array.from(links, (link) => {
+            const title = link.querySelector(arguments[1]);
+            return [title ? title.textContent.trim() : '', link.href];
+        }),
+        next ? next.href : null
+    ];
+""")
 
-class ShopPOM:
+
+@CATALOG_PAGE_SCRIPT.over_http
+def _catalog_page_over_http(driver, links_css: str, title_css: str, next_css: str) -> list:
+    """CATALOG_PAGE_SCRIPT on HttpDriver."""
+    products = [
+        [PageScript.text_of(link, title_css), link.get_attribute("href")]
+        for link in driver.find_elements(By.CSS_SELECTOR, links_css)
+    ]
+    return [products, PageScript.href_of(driver, next_css)]
+
+
+class ShopPOM(BasePOM):
     """Page Object for shop page - element interactions only."""
 
-    def __init__(self, driver):
-        self.driver = driver
-        self.product_titles = (By.CSS_SELECTOR, "h2.woocommerce-loop-product__title")
+    product_titles = (By.CSS_SELECTOR, "h2.woocommerce-loop-product__title")
+    product_links = (By.CSS_SELECTOR, "a.woocommerce-LoopProduct-link")
+    next_page_link = (By.CSS_SELECTOR, "a.next.page-numbers")
+
+    def read_catalog_page(self) -> Tuple[List[Tuple[str, str]], Optional[str]]:
+        """
+        Read the product listing on the current page in a single script call.
+
+        Returns:
+            Tuple: (name, product URL) pairs, URL of the next page (None on the last)
+        """
+        products, next_url = self.driver.execute_script(
+            CATALOG_PAGE_SCRIPT, self.product_links[1], self.product_titles[1], self.next_page_link[1]
+        )
+        return [tuple(product) for product in products], next_url
 
     def click_product_by_name(self, product_name: str):
         """Click on product by its name."""
-        products = self.driver.find_elements(*self.product_titles)
+        products, _ = self.read_catalog_page()
+        wanted = product_name.lower()
 
-        for product in products:
-            if product.text.strip().lower() == product_name.lower():
-                product.click()
+        for index, (name, _) in enumerate(products):
+            if name.lower() == wanted:
+                self.driver.find_elements(*self.product_links)[index].click()
                 return
 
         raise NoSuchElementException(f"Product not found: {product_name}")
 
     def is_product_displayed(self, product_name: str) -> bool:
         """Check if product is displayed on page."""
-        products = self.driver.find_elements(*self.product_titles)
-        return any(
-            p.text.strip().lower() == product_name.lower()
-            for p in products
-        )
\ No newline at end of file
+        products, _ = self.read_catalog_page()
+        return any(name.lower() == product_name.lower() for name, _ in products)
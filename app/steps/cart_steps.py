@@ -1,9 +1,16 @@
 from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
 from app.pom.cart_pom import CartPOM
 from app.pom.nav_pom import NavPOM
+from app.pom.checkout_pom import CheckoutPOM
+from typing import Dict, List
+from app.models.cart_line_item import CartLineItem
 from app.models.cart_totals import CartTotals
+from app.utils.helpers import Helpers
+from app.utils.instrumentation import instrumented
 
 
+@instrumented
 class CartSteps:
     """Business workflows for cart operations."""
 
@@ -17,31 +24,92 @@ class CartSteps:
         """Navigate to cart page."""
         self.nav.click_view_cart()
         self.waiter.url_contains("/cart/")
+        self.wait_for_cart_page()
+
+    def wait_for_cart_page(self):
+        """Wait until the cart form or the empty-cart message is rendered."""
+        self.waiter.until(
+            self.waiter.any_of(
+                EC.presence_of_element_located(CartPOM.cart_form),
+                EC.presence_of_element_located(CartPOM.empty_cart_message),
+            ),
+            name="cart page rendered"
+        )
 
     def apply_coupon(self, coupon_code: str):
         """Apply coupon code to cart."""
         self.cart.enter_coupon_code(coupon_code)
         self.cart.click_apply_coupon()
-        self.waiter.clickable((By.CSS_SELECTOR, "tr.cart-discount td"))
+        # Totals are re-rendered by AJAX - wait in-browser, not by polling
+        self.waiter.observed("tr.cart-discount td")
 
     def clear_cart(self):
-        """Clear all items and coupons from cart."""
-        self.navigate_to_cart()
+        """
+        Clear all items and coupons from cart.
+
+        One in-page Store API script does it, whatever the cart size;
+        the UI is only used if the Store API is unavailable or the cart
+        is not empty afterwards.
+        """
+        if Helpers.BASE_URL not in self.driver.current_url:
+            self.cart.open_page(Helpers.CART_URL)
 
-        if self.cart.is_cart_empty():
+        result = self.cart.reset_via_store_api(Helpers.STORE_API_URL)
+        if result.get("error") or result.get("items") or result.get("coupons"):
+            self.clear_cart_via_ui()
             return
 
-        self.cart.click_remove_all_coupons()
-        self.cart.click_remove_all_items()
+        if "/cart/" in self.driver.current_url:
+            # The page still shows the old cart
+            self.cart.open_page(Helpers.CART_URL)
+            self.wait_for_cart_page()
+
+    def clear_cart_via_ui(self):
+        """Clear the cart by clicking each remove link, waiting for every re-render."""
+        self.navigate_to_cart()
+
+        for locator in (CartPOM.remove_coupon_buttons, CartPOM.remove_buttons):
+            while True:
+                links = self.driver.find_elements(*locator)
+                if not links:
+                    break
+                links[0].click()
+                self.waiter.until(EC.staleness_of(links[0]), name="cart re-rendered")
+                self.wait_for_cart_page()
 
     def get_cart_totals(self) -> CartTotals:
         """Get current cart totals."""
         return self.cart.get_totals()
 
+    def get_line_items(self) -> List[CartLineItem]:
+        """Get every cart line (name, unit price, quantity, line total)."""
+        return self.cart.get_line_items()
+
+    def update_quantities(self, quantities: Dict[str, int]) -> List[str]:
+        """
+        Change several line quantities with one cart update.
+
+        Args:
+            quantities: Product name -> new quantity (0 removes the line)
+
+        Returns:
+            List[str]: Product names not in the cart; the others are updated
+        """
+        missing = self.cart.set_quantities(quantities)
+        if len(missing) == len(quantities):
+            return missing
+
+        form = self.driver.find_element(*CartPOM.cart_form)
+        self.cart.click_update_cart()
+        self.waiter.until(EC.staleness_of(form), name="cart updated")
+        self.wait_for_cart_page()
+        return missing
+
     def proceed_to_checkout(self):
         """Proceed to checkout page."""
         self.nav.click_checkout()
         self.waiter.url_contains("/checkout/")
+        self.waiter.visible(CheckoutPOM.first_name_field)
 
     def is_cart_empty(self) -> bool:
         """Check if cart is empty."""
@@ -53,4 +121,8 @@ class CartSteps:
 
     def is_discount_applied(self) -> bool:
         """Check if discount is applied."""
-        return self.cart.is_discount_displayed()
\ No newline at end of file
+        return self.cart.is_discount_displayed()
+
+    def get_current_url(self) -> str:
+        """Get current URL."""
+        return self.driver.current_url
\ No newline at end of file
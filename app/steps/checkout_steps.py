@@ -1,26 +1,45 @@
+from typing import Iterable
 from selenium.webdriver.common.by import By
 from app.pom.checkout_pom import CheckoutPOM
 from app.models.billing_details import BillingDetails
+from app.utils.instrumentation import instrumented
 
 
+@instrumented
 class CheckoutSteps:
     """Business workflows for checkout."""
 
+    # 'typed' sends keystrokes; 'bulk' sets fields with one script (set from --form-fill)
+    form_fill = "typed"
+
     def __init__(self, driver, waiter):
         self.driver = driver
         self.waiter = waiter
         self.checkout = CheckoutPOM(driver, waiter)
 
-    def fill_billing_details(self, details: BillingDetails):
-        """Fill all billing details."""
-        self.checkout.enter_first_name(details.first_name)
-        self.checkout.enter_last_name(details.last_name)
-        self.checkout.enter_address1(details.address1)
-        self.checkout.enter_address2(details.address2)
-        self.checkout.enter_city(details.city)
-        self.checkout.enter_county(details.county)
-        self.checkout.enter_postcode(details.postcode)
-        self.checkout.enter_phone(details.phone)
+    def fill_billing_details(self, details: BillingDetails, typed_fields: Iterable[str] = ()):
+        """
+        Fill all billing details.
+
+        Args:
+            details: Values to enter
+            typed_fields: BillingDetails field names to type with real
+                keystrokes even in bulk mode, e.g. the field a test is about
+        """
+        typed = set(typed_fields)
+        if self.form_fill == "typed":
+            typed = set(CheckoutPOM.BILLING_FIELDS)
+
+        bulk = {
+            locator: getattr(details, name)
+            for name, locator in CheckoutPOM.BILLING_FIELDS.items()
+            if name not in typed
+        }
+        fallback = self.checkout.fill_all(bulk) if bulk else []
+
+        for name, locator in CheckoutPOM.BILLING_FIELDS.items():
+            if name in typed or locator in fallback:
+                self.checkout.fill(locator, getattr(details, name))
 
     def select_cheque_payment(self):
         """Select cheque payment method."""
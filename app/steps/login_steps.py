@@ -1,13 +1,29 @@
+from weakref import WeakKeyDictionary
 from selenium.webdriver.common.by import By
 from pom.login_page_pom import *
 from pom.nav_pom import *
 from app.models.user_credentials import *
 from app.utils.helpers import *
+from app.utils.session_cache import LoginSessionCache
+from app.utils.account_pool import AccountPool
+from app.utils.setup_planner import SetupPlanner
+from app.utils.instrumentation import instrumented
 
 
+@instrumented
 class LoginSteps:
     """Business workflows for authentication."""
 
+    # Shared by every LoginSteps in this worker
+    session_cache = LoginSessionCache()
+    # Set when running in parallel so each worker uses its own account
+    account_pool: AccountPool = None
+    # Set by BaseTest when the next test logs in as the same user
+    keep_session = False
+    setup_planner: SetupPlanner = None
+    # Username each browser was last logged in as
+    _session_users = WeakKeyDictionary()
+
     def __init__(self, driver, waiter):
         self.driver = driver
         self.waiter = waiter
@@ -26,16 +42,92 @@ class LoginSteps:
         self.waiter.visible((By.LINK_TEXT, "Log out"))
 
     def login_as(self, credentials: UserCredentials):
-        """Complete login workflow."""
+        """Complete login workflow, reusing a cached session when possible."""
+        if self.account_pool is not None:
+            credentials = self.account_pool.resolve(credentials)
+
+        if self.is_logged_in_as(credentials):
+            # Session kept from the previous test
+            self._skip("login")
+            return
+
+        if not self.restore_session(credentials):
+            self.navigate_to_login_page()
+            self.login_with(credentials)
+            self.session_cache.store(credentials, self.driver.get_cookies())
+        self._session_users[self.driver] = credentials.username
+
+    @classmethod
+    def user_of(cls, driver):
+        """Username a browser was last logged in as through LoginSteps, if any."""
+        return cls._session_users.get(driver)
+
+    def is_logged_in_as(self, credentials: UserCredentials) -> bool:
+        """True if this browser is still logged in as the given user."""
+        return (
+            self._session_users.get(self.driver) == credentials.username
+            and self.nav.is_logout_displayed()
+        )
+
+    def restore_session(self, credentials: UserCredentials) -> bool:
+        """
+        Log in by injecting cached auth cookies.
+
+        Returns:
+            bool: True if logged in, False if there was no usable snapshot
+                  and the caller must fall back to the UI login
+        """
+        if not self.session_cache.enabled:
+            return False
+
+        session = self.session_cache.get(credentials)
+        if session is None:
+            return False
+
+        self.session_cache.inject(self.driver, session)
         self.navigate_to_login_page()
-        self.login_with(credentials)
+        if self.nav.is_logout_displayed():
+            return True
+
+        # Cookies were rejected (logged out elsewhere, server-side expiry)
+        self.session_cache.invalidate(credentials)
+        return False
 
     def logout(self):
-        """Perform logout."""
+        """
+        Log out through the UI, unless the next test continues this session.
+
+        Log out destroys the WordPress session token on the server, so the
+        user's cached cookies are dropped with it.
+        """
+        if self.keep_session:
+            self._skip("logout")
+            return
+
         self.nav.click_my_account()
         self.waiter.clickable((By.LINK_TEXT, "Log out"))
         self.nav.click_logout()
 
+        username = self._session_users.pop(self.driver, None)
+        if username is not None:
+            self.session_cache.discard(username)
+
+    @classmethod
+    def drop_session(cls, driver) -> None:
+        """
+        Forget a browser's login without ending it on the server.
+
+        For teardown only: the browser's cookies are deleted, but the
+        session stays valid, so a cached snapshot of it can still be
+        injected by a later login_as.
+        """
+        cls._session_users.pop(driver, None)
+        driver.delete_all_cookies()
+
+    def _skip(self, step: str):
+        if self.setup_planner is not None:
+            self.setup_planner.skip(step)
+
     def get_current_url(self) -> str:
         """Get current URL."""
         return self.driver.current_url
@@ -2,13 +2,20 @@ from app.pom.order_confirmation_pom import OrderConfirmationPOM
 from app.pom.my_account_orders_pom import MyAccountOrdersPOM
 from app.pom.nav_pom import NavPOM
 from app.models.order_confirmation import OrderConfirmation
+from app.steps.login_steps import LoginSteps
+from app.utils.helpers import Helpers
+from app.utils.order_history_index import OrderHistoryIndex
+from app.utils.waiter import Waiter
+from app.utils.instrumentation import instrumented
 
 
+@instrumented
 class OrderVerificationSteps:
     """Business workflows for order verification."""
 
-    def __init__(self, driver):
+    def __init__(self, driver, waiter: Waiter = None):
         self.driver = driver
+        self.waiter = waiter or Waiter(driver)
         self.order_confirmation = OrderConfirmationPOM(driver)
         self.my_account_orders = MyAccountOrdersPOM(driver)
         self.nav = NavPOM(driver)
@@ -21,11 +28,34 @@ class OrderVerificationSteps:
     def navigate_to_my_orders(self):
         """Navigate to My Orders page."""
         self.nav.click_my_account()
+        self.waiter.clickable(MyAccountOrdersPOM.orders_link)
         self.my_account_orders.click_orders_tab()
+        self.waiter.url_contains("/orders/")
 
     def is_order_in_history(self, order_number: str) -> bool:
-        """Check if order appears in order history."""
-        return self.my_account_orders.is_order_number_displayed(order_number)
+        """
+        Check if order appears in order history.
+
+        Uses the session's index for the logged-in account and follows
+        the Next pagination only as far as needed.
+        """
+        return self._history_index().find(order_number, self.my_account_orders)
+
+    def open_order(self, order_number: str) -> bool:
+        """
+        Look an order up directly at /my-account/view-order/<n>/.
+
+        Returns:
+            bool: True if the logged-in account can view the order
+        """
+        self.my_account_orders.open_page(f"{Helpers.ACCOUNT_URL}view-order/{order_number}/")
+        found = self.my_account_orders.get_viewed_order_number() == order_number
+        if found:
+            self._history_index().add(order_number)
+        return found
+
+    def _history_index(self) -> OrderHistoryIndex:
+        return OrderHistoryIndex.for_account(LoginSteps.user_of(self.driver))
 
     def get_current_url(self) -> str:
         """Get current URL."""
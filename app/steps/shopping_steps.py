@@ -1,26 +1,47 @@
 # steps/shopping_steps.py
 from selenium.webdriver.common.by import By
+from selenium.common.exceptions import NoSuchElementException
 from app.pom.shop_pom import ShopPOM
 from app.pom.nav_pom import NavPOM
+from app.pom.cart_pom import CartPOM
 from app.models.product_data import ProductData
+from app.utils.store_client import StoreClient
+from app.utils.catalog_index import CatalogIndex
+from app.utils.helpers import Helpers
+from typing import Iterable
+from app.utils.instrumentation import instrumented
 
 
+@instrumented
 class ShoppingSteps:
     """Business workflows for shopping."""
 
-    def __init__(self, driver, waiter):
+    def __init__(self, driver, waiter, cart_setup: str = "ui"):
         self.driver = driver
         self.waiter = waiter
+        self.cart_setup = cart_setup
         self.shop = ShopPOM(driver)
         self.nav = NavPOM(driver)
 
     def browse_to_shop(self):
         """Navigate to shop page."""
         self.nav.click_shop()
+        self.waiter.visible(ShopPOM.product_titles)
 
     def select_product(self, product: ProductData):
         """Select product by name."""
         self.shop.click_product_by_name(product.name)
+        self.waiter.clickable(NavPOM.add_to_cart_button)
+
+    def open_product(self, product: ProductData):
+        """Go straight to a product's page using the session's catalog index."""
+        url = CatalogIndex.for_site(Helpers.BASE_URL).url_for(product.name, self.shop)
+        if url is None:
+            raise NoSuchElementException(f"Product not found: {product.name}")
+
+        if self.driver.current_url != url:
+            self.shop.open_page(url)
+        self.waiter.clickable(NavPOM.add_to_cart_button)
 
     def add_current_product_to_cart(self):
         """Add currently viewed product to cart."""
@@ -29,10 +50,23 @@ class ShoppingSteps:
 
     def add_product_to_cart(self, product: ProductData):
         """Complete workflow to add product to cart."""
-        self.browse_to_shop()
-        self.select_product(product)
+        if self.cart_setup == "http":
+            self.seed_cart([product])
+            return
+
+        self.open_product(product)
         self.add_current_product_to_cart()
 
+    def seed_cart(self, products: Iterable[ProductData], coupons: Iterable[str] = ()):
+        """Put products and coupons in the cart over HTTP, without driving the UI."""
+        client = StoreClient(self.driver)
+        client.pull_cookies()
+        for product in products:
+            client.add_to_cart(product.name)
+        for code in coupons:
+            client.apply_coupon(code)
+        client.push_cookies()
+
     def view_cart(self):
         """Navigate to view cart."""
         self.nav.click_view_cart()
@@ -41,6 +75,7 @@ class ShoppingSteps:
         """Navigate to cart and wait for page load."""
         self.nav.click_view_cart()
         self.waiter.url_contains("/cart/")
+        self.waiter.present(CartPOM.cart_form)
 
     def get_current_url(self) -> str:
         """Get current URL."""
@@ -1,31 +1,29 @@
 import pytest
-from selenium import webdriver
 from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.options import Options
 from app.utils.waiter import Waiter
 from app.utils.helpers import Helpers
+from app.steps.login_steps import LoginSteps
 
 
 class BaseTest:
     """Base test class with setup and teardown."""
 
     @pytest.fixture(autouse=True)
-    def setup(self, request):
-        """Setup browser before each test."""
-        # Get browser from command line or default to chrome
-        browser = request.config.getoption("--browser", default="chrome")
-
-        if browser.lower() == "firefox":
-            self.driver = webdriver.Firefox()
-        elif browser.lower() == "edge":
-            self.driver = webdriver.Edge()
-        else:  # chrome
-            options = Options()
-            self.driver = webdriver.Chrome(options=options)
-
-        self.driver.implicitly_wait(10)
-        self.driver.maximize_window()
+    def setup(self, request, driver_pool):
+        """Borrow a warm browser from the pool before each test."""
+        self.driver_pool = driver_pool
+        self.shoppers = []
+        self.driver = driver_pool.acquire()
         self.waiter = Waiter(self.driver, timeout=10)
+        # Set by pytest_runtest_protocol when the next test has the same user
+        keep_session = getattr(request.node, "keep_session", False)
+        LoginSteps.keep_session = keep_session
+
+        # Tests opt into HTTP cart seeding with @pytest.mark.cart_setup("http")
+        marker = request.node.get_closest_marker("cart_setup")
+        self.cart_setup = (
+            marker.args[0] if marker else request.config.getoption("--cart-setup")
+        )
 
         # Navigate to site and dismiss notice
         print("=== Starting Test Setup ===")
@@ -41,9 +39,32 @@ class BaseTest:
 
         yield
 
-        # Teardown
-        if self.driver:
-            try:
-                self.driver.quit()
-            except:
-                pass
\ No newline at end of file
+        # Teardown - a failed test may leave the browser in a bad state
+        report = getattr(request.node, "rep_call", None)
+        failed = report is None or report.failed
+        LoginSteps.keep_session = False
+        if not failed:
+            # Sessions a test did not log out of stay valid for the login cache
+            for shopper in self.shoppers:
+                LoginSteps.drop_session(shopper)
+            if not keep_session:
+                LoginSteps.drop_session(self.driver)
+        for shopper in self.shoppers:
+            driver_pool.release(shopper, failed=failed)
+        driver_pool.release(self.driver, failed=failed, keep_session=keep_session)
+
+    def new_shopper(self):
+        """
+        Borrow another browser for a second, independent shopper in this test.
+
+        With --contexts-per-browser it is an isolated context (own cookies,
+        storage and window) in the same browser process as self.driver.
+        It is returned to the pool at teardown.
+
+        Returns:
+            WebDriver: Driver with a clean session on the login page
+        """
+        shopper = self.driver_pool.acquire()
+        self.shoppers.append(shopper)
+        shopper.get(Helpers.LOGIN_URL)
+        return shopper
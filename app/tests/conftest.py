@@ -1,3 +1,26 @@
+import os
+import tempfile
+
+import pytest
+
+from app.fake_shop.server import FakeShop
+from app.utils.account_pool import AccountPool
+from app.utils.duration_sharding import DurationSharding
+from app.utils.event_reporter import EventReporter
+from app.utils.setup_planner import SetupPlanner
+from app.utils.browser_contexts import BrowserContexts, ContextStats
+from app.utils.browser_profiles import BrowserProfiles
+from app.utils.driver_factory import DriverFactory
+from app.utils.driver_pool import DriverPool, PoolStats
+from app.utils.driver_services import DriverServices, StartupTimings
+from app.utils.session_cache import LoginSessionCache
+from app.steps.login_steps import LoginSteps
+from app.steps.checkout_steps import CheckoutSteps
+from app.utils.waiter import Waiter
+from app.utils.instrumentation import Instrumentation
+from app.utils.helpers import Helpers
+from app.tests.data.test_data_provider import TestDataProvider
+
 
 def pytest_addoption(parser):
     """Add custom command line options."""
@@ -5,5 +28,420 @@ def pytest_addoption(parser):
         "--browser",
         action="store",
         default="chrome",
-        help="Browser to run tests: chrome, firefox, edge"
+        help="Browser to run tests: chrome, firefox, edge, or http (no browser, no JavaScript)"
+    )
+    parser.addoption(
+        "--profile",
+        action="store",
+        default="default",
+        choices=sorted(BrowserProfiles.ALL),
+        help="Browser performance profile: default, lean, headless"
+    )
+    parser.addoption(
+        "--target",
+        action="store",
+        default="remote",
+        choices=("remote", "local"),
+        help="Site under test: remote demo site or a local fake shop"
+    )
+    parser.addoption(
+        "--base-url",
+        action="store",
+        default=None,
+        help="Base URL of the shop under test (overrides Helpers.BASE_URL)"
+    )
+    parser.addoption(
+        "--pool-size",
+        action="store",
+        type=int,
+        default=1,
+        help="Number of warm browsers kept per worker"
+    )
+    parser.addoption(
+        "--max-driver-uses",
+        action="store",
+        type=int,
+        default=50,
+        help="Tests a pooled browser serves before it is relaunched"
+    )
+    parser.addoption(
+        "--contexts-per-browser",
+        action="store",
+        type=int,
+        default=0,
+        help="Run pooled drivers as isolated contexts, up to N per browser (Chrome/Edge); 0 = one browser each"
+    )
+    parser.addoption(
+        "--driver-service",
+        action="store",
+        default="shared",
+        choices=("shared", "per-browser"),
+        help="One driver process per worker (shared) or one per browser"
+    )
+    parser.addoption(
+        "--login-cache-ttl",
+        action="store",
+        type=float,
+        default=1800,
+        help="Seconds a cached login session is reused; 0 always logs in via the UI"
+    )
+    parser.addoption(
+        "--accounts-file",
+        action="store",
+        default=None,
+        help="CSV of username,password accounts leased one per parallel worker"
+    )
+    parser.addoption(
+        "--cart-setup",
+        action="store",
+        default="ui",
+        choices=("ui", "http"),
+        help="Default cart setup path for tests that opt in: ui or http"
+    )
+    parser.addoption(
+        "--form-fill",
+        action="store",
+        default="typed",
+        choices=("typed", "bulk"),
+        help="Fill checkout forms with real keystrokes (typed) or one faster script (bulk)"
+    )
+    parser.addoption(
+        "--cases-dir",
+        action="store",
+        default=None,
+        help="Directory searched before app/tests/data for @pytest.mark.cases files"
+    )
+    parser.addoption(
+        "--event-log",
+        action="store",
+        default=None,
+        help="JSON-lines file for test events (default: in the pytest cache, else the temp dir)"
+    )
+    parser.addoption(
+        "--step-report",
+        action="store",
+        default=None,
+        help="Write per-step timings to this .json or .csv file"
+    )
+
+
+def pytest_configure(config):
+    """Apply session-wide settings."""
+    base_url = config.getoption("--base-url")
+    if base_url:
+        Helpers.configure(base_url)
+
+    config.addinivalue_line(
+        "markers",
+        "cart_setup(mode): seed the cart via 'ui' clicks or 'http' requests"
+    )
+    config.addinivalue_line(
+        "markers",
+        "cases(name, id_fields): parametrize test_data by streaming a data file"
+    )
+    cases_dir = config.getoption("--cases-dir")
+    if cases_dir:
+        TestDataProvider.cases_dir = cases_dir
+
+    LoginSteps.session_cache = LoginSessionCache(
+        ttl_seconds=config.getoption("--login-cache-ttl")
+    )
+
+    global _relays_worker_reports
+    _relays_worker_reports = (
+        not _is_xdist_worker(config) and config.pluginmanager.hasplugin("dsession")
+    )
+    config.event_log = config.getoption("--event-log") or _default_event_log(config)
+    if _is_xdist_worker(config):
+        worker_id = config.workerinput["workerid"]
+    else:
+        worker_id = "master"
+        EventReporter.remove_parts(config.event_log)
+    EventReporter.current = EventReporter(
+        EventReporter.part_path(config.event_log, worker_id), worker_id
+    ).start()
+
+    CheckoutSteps.form_fill = config.getoption("--form-fill")
+
+    config.setup_planner = SetupPlanner()
+    LoginSteps.setup_planner = config.setup_planner
+
+    config.duration_sharding = DurationSharding(getattr(config, "cache", None))
+    if not _is_xdist_worker(config):
+        _check_accounts_for_workers(config)
+        # The controller sees every worker's reports
+        config.pluginmanager.register(config.duration_sharding)
+
+
+def _check_accounts_for_workers(config) -> None:
+    """Fail before any worker starts if -n asks for more workers than there are accounts."""
+    workers = getattr(config.option, "numprocesses", None)
+    if not isinstance(workers, int) or workers < 2:
+        return
+    accounts_file = config.getoption("--accounts-file")
+    pool = AccountPool.from_file(accounts_file) if accounts_file else AccountPool.from_helpers()
+    if workers > len(pool.accounts):
+        raise pytest.UsageError(
+            f"-n {workers} needs one shop account per worker, but only "
+            f"{len(pool.accounts)} account(s) are available. Workers sharing an "
+            "account clear each other's cart. Pass more accounts with "
+            "--accounts-file or run fewer workers."
+        )
+
+
+def _default_event_log(config) -> str:
+    """Event log in the pytest cache, or in the temp dir with -p no:cacheprovider."""
+    cache = getattr(config, "cache", None)
+    if cache is not None:
+        return str(cache.mkdir("events") / "events.jsonl")
+    return os.path.join(tempfile.gettempdir(), "woocommerce-events", "events.jsonl")
+
+
+# True on the xdist controller, which receives every worker's test reports again
+_relays_worker_reports = False
+
+
+def _is_xdist_worker(config) -> bool:
+    return hasattr(config, "workerinput")
+
+
+def pytest_generate_tests(metafunc):
+    """
+    Parametrize test_data from @pytest.mark.cases.
+
+    Only a CaseRef (file, offset, id) is kept per test during collection;
+    the row is read when the test runs.
+    """
+    marker = metafunc.definition.get_closest_marker("cases")
+    if marker is None or "test_data" not in metafunc.fixturenames:
+        return
+
+    refs = list(TestDataProvider.case_refs(*marker.args, **marker.kwargs))
+    metafunc.parametrize("test_data", refs, ids=[ref.id for ref in refs], indirect=True)
+
+
+@pytest.fixture
+def test_data(request):
+    """The TestData row a @pytest.mark.cases parameter points at."""
+    return TestDataProvider.load(request.param)
+
+
+def pytest_collection_modifyitems(session, config, items):
+    """
+    Under xdist, schedule the slowest tests first so workers finish together;
+    otherwise group data-driven cases that share a setup.
+    """
+    if _is_xdist_worker(config):
+        config.duration_sharding.order(items)
+    else:
+        config.setup_planner.order(items)
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtest_protocol(item, nextitem):
+    """Let a test keep its login for the next test when it is the same user."""
+    item.keep_session = item.config.setup_planner.keeps_session(item, nextitem)
+
+
+def pytest_runtest_logstart(nodeid, location):
+    """Tag following events with the running test."""
+    EventReporter.current.test = nodeid
+
+
+def pytest_runtest_logreport(report):
+    """Record each test's outcome as an event."""
+    if _relays_worker_reports:
+        # The worker that ran the test already logged it
+        return
+    if report.when == "call" or report.outcome != "passed":
+        EventReporter.log(
+            "result",
+            phase=report.when,
+            outcome=report.outcome,
+            duration=round(report.duration, 3),
+        )
+
+
+def pytest_sessionfinish(session, exitstatus):
+    """Persist durations, flush events and hand step timings and stats to the controller."""
+    config = session.config
+    EventReporter.current.close()
+    if _is_xdist_worker(config):
+        config.workeroutput["step_records"] = Instrumentation.to_dicts()
+        config.workeroutput["setup_skipped"] = dict(config.setup_planner.skipped)
+        services = getattr(config, "driver_services", None)
+        if services is not None:
+            config.workeroutput["startup_timings"] = services.timings.to_dict()
+        pool = getattr(config, "driver_pool", None)
+        if pool is not None:
+            config.workeroutput["pool_stats"] = pool.stats.to_dict()
+        contexts = getattr(config, "browser_contexts", None)
+        if contexts is not None:
+            config.workeroutput["context_stats"] = contexts.stats.to_dict()
+        config.workeroutput["login_cache_stats"] = LoginSteps.session_cache.stats_dict()
+        config.workeroutput["wait_stats"] = Waiter.stats.to_dict()
+        return
+
+    config.duration_sharding.save()
+    config.event_count = EventReporter.merge(config.event_log)
+    report_path = config.getoption("--step-report")
+    if report_path:
+        Instrumentation.export(report_path)
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    """Merge a finished xdist worker's step timings, skipped setup steps, startup timings and stats."""
+    Instrumentation.merge_dicts(node.workeroutput.get("step_records", []))
+    node.config.setup_planner.skipped.update(node.workeroutput.get("setup_skipped", {}))
+    timings = node.workeroutput.get("startup_timings")
+    if timings:
+        if getattr(node.config, "startup_timings", None) is None:
+            node.config.startup_timings = StartupTimings()
+        node.config.startup_timings.merge(timings)
+
+    output = node.workeroutput
+    if "pool_stats" in output:
+        if getattr(node.config, "pool_stats", None) is None:
+            node.config.pool_stats = PoolStats()
+        node.config.pool_stats.merge(output["pool_stats"])
+    if "context_stats" in output:
+        if getattr(node.config, "context_stats", None) is None:
+            node.config.context_stats = ContextStats()
+        node.config.context_stats.merge(output["context_stats"])
+    LoginSteps.session_cache.merge_stats(output.get("login_cache_stats", {}))
+    if "wait_stats" in output:
+        Waiter.stats.merge(output["wait_stats"])
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    """Expose each phase report on the item so fixtures can see failures."""
+    outcome = yield
+    report = outcome.get_result()
+    setattr(item, f"rep_{report.when}", report)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def worker_account(request):
+    """Lease this worker's own shop account for the whole session."""
+    worker_id = os.environ.get("PYTEST_XDIST_WORKER", "master")
+    accounts_file = request.config.getoption("--accounts-file")
+    if accounts_file:
+        pool = AccountPool.from_file(accounts_file, worker_id)
+    else:
+        pool = AccountPool.from_helpers(worker_id)
+
+    account = pool.lease()
+    LoginSteps.account_pool = pool
+
+    yield account
+
+    LoginSteps.account_pool = None
+    pool.release()
+
+
+@pytest.fixture(scope="session")
+def site(request):
+    """
+    Base URL of the shop under test.
+
+    With --target=local a fake shop is started for this worker and every
+    Helpers URL is pointed at it.
+    """
+    if request.config.getoption("--target") != "local":
+        yield Helpers.BASE_URL
+        return
+
+    accounts_file = request.config.getoption("--accounts-file")
+    pool = AccountPool.from_file(accounts_file) if accounts_file else AccountPool.from_helpers()
+    shop = FakeShop({a.username: a.password for a in pool.accounts}).start()
+    remote_url = Helpers.BASE_URL
+    Helpers.configure(shop.base_url)
+
+    yield shop.base_url
+
+    Helpers.configure(remote_url)
+    shop.stop()
+
+
+@pytest.fixture(scope="session")
+def driver_pool(request, site):
+    """Session-wide pool of warm browsers for this worker."""
+    browser = request.config.getoption("--browser")
+    profile = BrowserProfiles.get(request.config.getoption("--profile"))
+    services = DriverServices(
+        getattr(request.config, "cache", None),
+        shared=request.config.getoption("--driver-service") == "shared",
+    )
+    factory = lambda: DriverFactory.create(browser, profile, services)
+    contexts = None
+    per_browser = request.config.getoption("--contexts-per-browser")
+    if per_browser > 0:
+        contexts = BrowserContexts(
+            factory,
+            per_browser=per_browser,
+            prepare=lambda context: DriverFactory.block_urls(context, profile),
+        )
+        factory = contexts
+    pool = DriverPool(
+        factory=factory,
+        size=request.config.getoption("--pool-size"),
+        max_uses=request.config.getoption("--max-driver-uses"),
     )
+    request.config.driver_pool = pool
+    request.config.driver_services = services
+    request.config.browser_contexts = contexts
+
+    yield pool
+
+    pool.shutdown()
+    if contexts is not None:
+        contexts.shutdown()
+    services.shutdown()
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config):
+    """Report step timings, setup sharing, browser startup, driver pool and login cache stats at session end."""
+    if Instrumentation.records:
+        terminalreporter.write_sep("=", "slowest steps")
+        for line in Instrumentation.summary_lines():
+            terminalreporter.write_line(line)
+
+    if getattr(config, "event_count", None) is not None:
+        terminalreporter.write_line(f"{config.event_count} test events written to {config.event_log}")
+
+    planner = config.setup_planner
+    if planner.keyed or planner.skipped:
+        terminalreporter.write_sep("=", "setup sharing")
+        for line in planner.summary_lines():
+            terminalreporter.write_line(line)
+        terminalreporter.write_line(f"Duplicate cases dropped: {TestDataProvider.duplicates}")
+
+    services = getattr(config, "driver_services", None)
+    timings = getattr(config, "startup_timings", None) or (services and services.timings)
+    if timings and any(timings.seconds.values()):
+        terminalreporter.write_sep("=", "browser startup")
+        for line in timings.summary_lines():
+            terminalreporter.write_line(line)
+
+    # Serial runs read this process's pool; under xdist the workers' stats are merged
+    pool = getattr(config, "driver_pool", None)
+    pool_stats = getattr(config, "pool_stats", None) or (pool and pool.stats)
+    if pool_stats is None:
+        return
+
+    terminalreporter.write_sep("=", "driver pool")
+    for line in pool_stats.summary_lines():
+        terminalreporter.write_line(line)
+    for line in LoginSteps.session_cache.summary_lines():
+        terminalreporter.write_line(line)
+    contexts = getattr(config, "browser_contexts", None)
+    context_stats = getattr(config, "context_stats", None) or (contexts and contexts.stats)
+    if context_stats is not None:
+        for line in context_stats.summary_lines():
+            terminalreporter.write_line(line)
+
+    terminalreporter.write_sep("=", "wait latency")
+    for line in Waiter.stats.summary_lines():
+        terminalreporter.write_line(line)
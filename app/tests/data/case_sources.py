@@ -0,0 +1,244 @@
+import csv
+import io
+import itertools
+import json
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, List, Sequence, Tuple
+
+try:
+    import pyarrow.parquet as pq
+except ImportError:  # Parquet sources are optional
+    pq = None
+
+
+@dataclass(frozen=True)
+class CaseRef:
+    """
+    Pointer to one test case in a data file.
+
+    pytest only keeps these during collection; the row itself is read
+    when the test runs, so collection memory does not grow with row size.
+    """
+    source: str
+    key: Any  # byte offset (csv/jsonl), row number (parquet), value indexes (matrix)
+    id: str
+    setup: Tuple[str, ...] = ()  # (user, product, coupon), used by SetupPlanner
+
+
+class CaseSources:
+    """Streaming readers for test case files, chosen by file suffix."""
+
+    SUFFIXES = {".csv": "csv", ".jsonl": "jsonl", ".parquet": "parquet", ".matrix.json": "matrix"}
+
+    _csv_headers: Dict[str, List[str]] = {}
+    _matrices: Dict[str, Tuple[dict, List[str], List[list]]] = {}
+
+    @staticmethod
+    def kind(path: str) -> str:
+        """Source type of a file: csv, jsonl, parquet or matrix."""
+        for suffix, kind in CaseSources.SUFFIXES.items():
+            if path.endswith(suffix):
+                return kind
+        raise ValueError(f"Unsupported test data file '{path}', use one of {list(CaseSources.SUFFIXES)}")
+
+    @staticmethod
+    def scan(path: str) -> Iterator[Tuple[Any, Dict[str, Any]]]:
+        """
+        Stream (key, row) pairs from a file, one row in memory at a time.
+
+        Args:
+            path: Data file path
+
+        Returns:
+            Iterator of (key for load(), row dict)
+        """
+        kind = CaseSources.kind(path)
+        if kind == "csv":
+            return CaseSources._scan_csv(path)
+        if kind == "jsonl":
+            return CaseSources._scan_jsonl(path)
+        if kind == "parquet":
+            return CaseSources._scan_parquet(path)
+        return CaseSources._scan_matrix(path)
+
+    @staticmethod
+    def load(path: str, key: Any) -> Dict[str, Any]:
+        """Read the single row a scan() key points at."""
+        kind = CaseSources.kind(path)
+        if kind == "csv":
+            header = CaseSources._csv_header(path)
+            with open(path, "rb") as handle:
+                handle.seek(key)
+                return CaseSources._csv_row(header, next(CaseSources._csv_records(handle))[1])
+        if kind == "jsonl":
+            with open(path, "rb") as handle:
+                handle.seek(key)
+                return json.loads(handle.readline())
+        if kind == "parquet":
+            return CaseSources._parquet_row(path, key)
+        base, names, values = CaseSources._matrix(path)
+        return CaseSources._matrix_row(base, names, values, key)
+
+    # CSV / JSON lines: keys are byte offsets of each record
+
+    @staticmethod
+    def _csv_header(path: str) -> List[str]:
+        header = CaseSources._csv_headers.get(path)
+        if header is None:
+            with open(path, "rb") as handle:
+                header = next(csv.reader([next(CaseSources._csv_records(handle))[1].decode("utf-8-sig")]))
+            CaseSources._csv_headers[path] = header
+        return header
+
+    @staticmethod
+    def _csv_row(header: List[str], record: bytes) -> Dict[str, str]:
+        return dict(zip(header, next(csv.reader([record.decode("utf-8")]))))
+
+    @staticmethod
+    def _scan_csv(path: str):
+        header = CaseSources._csv_header(path)
+        with open(path, "rb") as handle:
+            records = CaseSources._csv_records(handle)
+            next(records, None)
+            for offset, record in records:
+                yield offset, CaseSources._csv_row(header, record)
+
+    @staticmethod
+    def _scan_jsonl(path: str):
+        with open(path, "rb") as handle:
+            for offset, line in CaseSources._lines(handle):
+                yield offset, json.loads(line)
+
+    @staticmethod
+    def _csv_records(handle: io.BufferedReader) -> Iterator[Tuple[int, bytes]]:
+        """
+        Non-blank CSV records with their byte offsets.
+
+        A quoted field may contain line breaks, so a record ends at the first
+        line break outside quotes (an even number of quote characters so far).
+        """
+        offset = start = handle.tell()
+        record = b""
+        for line in handle:
+            if not record:
+                start = offset
+            record += line
+            offset += len(line)
+            if record.count(b'"') % 2:
+                continue
+            if record.strip():
+                yield start, record
+            record = b""
+        if record.strip():
+            yield start, record
+
+    @staticmethod
+    def _lines(handle: io.BufferedReader) -> Iterator[Tuple[int, bytes]]:
+        """Non-blank lines with their byte offsets."""
+        offset = handle.tell()
+        for line in handle:
+            if line.strip():
+                yield offset, line
+            offset += len(line)
+
+    # Parquet: keys are row numbers, read one record batch at a time
+
+    @staticmethod
+    def _parquet_file(path: str):
+        if pq is None:
+            raise ImportError(f"Reading '{path}' requires pyarrow: pip install pyarrow")
+        return pq.ParquetFile(path)
+
+    @staticmethod
+    def _scan_parquet(path: str):
+        row_number = 0
+        for batch in CaseSources._parquet_file(path).iter_batches(batch_size=1024):
+            for row in batch.to_pylist():
+                yield row_number, row
+                row_number += 1
+
+    @staticmethod
+    def _parquet_row(path: str, row_number: int) -> Dict[str, Any]:
+        parquet = CaseSources._parquet_file(path)
+        for group in range(parquet.num_row_groups):
+            rows = parquet.metadata.row_group(group).num_rows
+            if row_number < rows:
+                return parquet.read_row_group(group).slice(row_number, 1).to_pylist()[0]
+            row_number -= rows
+        raise IndexError(f"No row {row_number} in '{path}'")
+
+    # Pairwise matrices: keys are the index of each dimension's value
+
+    @staticmethod
+    def _matrix(path: str):
+        matrix = CaseSources._matrices.get(path)
+        if matrix is None:
+            with open(path, encoding="utf-8") as handle:
+                spec = json.load(handle)
+            dimensions = spec["dimensions"]
+            matrix = (spec.get("base", {}), list(dimensions), list(dimensions.values()))
+            CaseSources._matrices[path] = matrix
+        return matrix
+
+    @staticmethod
+    def _matrix_row(base: dict, names: List[str], values: List[list], key: Tuple[int, ...]):
+        row = dict(base)
+        for name, options, index in zip(names, values, key):
+            value = options[index]
+            row.update(value if isinstance(value, dict) else {name: value})
+        return row
+
+    @staticmethod
+    def _scan_matrix(path: str):
+        base, names, values = CaseSources._matrix(path)
+        for key in CaseSources.pairwise([len(options) for options in values]):
+            yield key, CaseSources._matrix_row(base, names, values, key)
+
+    @staticmethod
+    def pairwise(sizes: Sequence[int]) -> Iterator[Tuple[int, ...]]:
+        """
+        Lazily generate value indexes covering every pair of values at least once.
+
+        Greedy: each row starts from an uncovered pair and fills the other
+        dimensions with whichever value covers the most new pairs. Yields
+        far fewer rows than the full product (e.g. 16 x 2 x 50 -> ~800
+        instead of 1600, 20 x 20 x 20 -> ~450 instead of 8000).
+
+        Args:
+            sizes: Number of values in each dimension
+
+        Returns:
+            Iterator of tuples, one value index per dimension
+        """
+        if len(sizes) < 2:
+            yield from itertools.product(*(range(size) for size in sizes))
+            return
+
+        dimensions = range(len(sizes))
+        # dict keeps insertion order, so output is deterministic
+        uncovered = dict.fromkeys(
+            (i, a, j, b)
+            for i, j in itertools.combinations(dimensions, 2)
+            for a in range(sizes[i])
+            for b in range(sizes[j])
+        )
+
+        while uncovered:
+            i, a, j, b = next(iter(uncovered))
+            row = [None] * len(sizes)
+            row[i], row[j] = a, b
+
+            for k in dimensions:
+                if row[k] is not None:
+                    continue
+                row[k] = max(
+                    range(sizes[k]),
+                    key=lambda v: sum(
+                        ((m, row[m], k, v) if m < k else (k, v, m, row[m])) in uncovered
+                        for m in dimensions if row[m] is not None
+                    ),
+                )
+
+            for m, n in itertools.combinations(dimensions, 2):
+                uncovered.pop((m, row[m], n, row[n]), None)
+            yield tuple(row)
@@ -1,7 +1,12 @@
-from dataclasses import dataclass
+import sys
+from dataclasses import dataclass, fields
+from typing import Any, Dict
+from app.models.billing_details import BillingDetails
+from app.models.product_data import ProductData
+from app.models.user_credentials import UserCredentials
 
 
-@dataclass
+@dataclass(slots=True)
 class TestData:
     """Test data container."""
     username: str
@@ -18,6 +23,48 @@ class TestData:
     phone: str
     expected_discount_percent: int
 
+    # Few distinct values over many rows; per-row values (emails, phones) are not interned
+    INTERNED_FIELDS = frozenset({"product_name", "coupon", "state"})
+
+    @classmethod
+    def from_row(cls, row: Dict[str, Any]) -> "TestData":
+        """
+        Build from a data file row, converting values to the field types.
+
+        Products, coupons and states are interned, so each distinct value is
+        stored once however many rows repeat it.
+        """
+        values = {}
+        for field in fields(cls):
+            value = row.get(field.name, "")
+            if field.type is int:
+                values[field.name] = int(value)
+            else:
+                text = "" if value is None else str(value)
+                values[field.name] = sys.intern(text) if field.name in cls.INTERNED_FIELDS else text
+        return cls(**values)
+
+    def to_user_credentials(self) -> UserCredentials:
+        """Login details of this case."""
+        return UserCredentials(username=self.username, password=self.password)
+
+    def to_product(self) -> ProductData:
+        """Product bought in this case."""
+        return ProductData(name=self.product_name)
+
+    def to_billing_details(self) -> BillingDetails:
+        """Checkout billing form values of this case."""
+        return BillingDetails(
+            first_name=self.first_name,
+            last_name=self.last_name,
+            address1=self.address,
+            address2=self.address2,
+            city=self.city,
+            county=self.state,
+            postcode=self.postcode,
+            phone=self.phone
+        )
+
     def __str__(self):
         return (f"TestData[product={self.product_name}, "
                 f"coupon={self.coupon}, "
@@ -1,78 +1,89 @@
+from app.tests.data.case_sources import CaseRef, CaseSources
 from app.tests.data.test_data import TestData
-from typing import List
+import sys
+from pathlib import Path
+from typing import Iterator, List, Optional, Sequence
 
 
 class TestDataProvider:
     """Provider for test data sets."""
 
+    DATA_DIR = Path(__file__).parent
+    # Searched before DATA_DIR; set from --cases-dir
+    cases_dir: Optional[Path] = None
+    # Row fields that make up a case's setup key (see SetupPlanner)
+    SETUP_FIELDS = ("username", "product_name", "coupon")
+    # Identical rows dropped by case_refs() this session
+    duplicates = 0
+
     @staticmethod
     def get_discount_test_data() -> List[TestData]:
         """Get test data for discount tests."""
-        return [
-            TestData(
-                username="luis.hueso@2.com",
-                password="luis.hueso",
-                product_name="Polo",
-                coupon="2idiscount",
-                first_name="Luis",
-                last_name="Hueso",
-                address="Edgewords",
-                address2="2itesting",
-                city="London",
-                state="Camden",
-                postcode="SE10 9LS",
-                phone="07956987456",
-                expected_discount_percent=25
-            ),
-            TestData(
-                username="luis.hueso@2.com",
-                password="luis.hueso",
-                product_name="Sunglasses",
-                coupon="Edgewords",
-                first_name="John",
-                last_name="Doe",
-                address="Test Street",
-                address2="Suite 100",
-                city="Manchester",
-                state="Greater Manchester",
-                postcode="M1 1AA",
-                phone="07123456789",
-                expected_discount_percent=15
-            )
-        ]
+        return list(TestDataProvider.stream("discount_cases"))
 
     @staticmethod
     def get_checkout_test_data() -> List[TestData]:
         """Get test data for checkout tests."""
-        return [
-            TestData(
-                username="luis.hueso@2.com",
-                password="luis.hueso",
-                product_name="Polo",
-                coupon="2idiscount",
-                first_name="Alice",
-                last_name="Smith",
-                address="123 Main St",
-                address2="Apt 4B",
-                city="Birmingham",
-                state="West Midlands",
-                postcode="B1 1HQ",
-                phone="07111222333",
-                expected_discount_percent=25
-            ),
-            TestData(
-                username="luis.hueso@2.com",
-                password="luis.hueso",
-                product_name="Sunglasses",
-                coupon="Edgewords",
-                first_name="Bob",
-                last_name="Johnson",
-                address="456 Oak Ave",
-                address2="",
-                city="Leeds",
-                state="West Yorkshire",
-                postcode="LS1 1UR",
-                phone="07444555666",
-                expected_discount_percent=15
-            )
-        ]
+        return list(TestDataProvider.stream("checkout_cases"))
+
+    @staticmethod
+    def resolve(name: str) -> str:
+        """
+        Find the data file for a case set.
+
+        Args:
+            name: File name, or a base name tried with each supported suffix
+                (.csv, .jsonl, .parquet, .matrix.json)
+
+        Returns:
+            str: Path of the first matching file, --cases-dir first
+
+        Raises:
+            FileNotFoundError: If no file matches
+        """
+        directories = [d for d in (TestDataProvider.cases_dir, TestDataProvider.DATA_DIR) if d]
+        candidates = [name] + [name + suffix for suffix in CaseSources.SUFFIXES]
+        for directory in directories:
+            for candidate in candidates:
+                path = Path(directory) / candidate
+                if path.is_file():
+                    return str(path)
+        raise FileNotFoundError(f"No test data file for '{name}' in {[str(d) for d in directories]}")
+
+    @staticmethod
+    def stream(name: str) -> Iterator[TestData]:
+        """Lazily yield every case of a case set."""
+        for _, row in CaseSources.scan(TestDataProvider.resolve(name)):
+            yield TestData.from_row(row)
+
+    @staticmethod
+    def case_refs(name: str, id_fields: Sequence[str] = ("product_name", "coupon")) -> Iterator[CaseRef]:
+        """
+        Lazily yield lightweight references to every distinct case of a case set.
+
+        Rows identical to an earlier row are skipped (counted in `duplicates`);
+        each row's values are kept as a tuple to detect them.
+
+        Args:
+            name: Case set, see resolve()
+            id_fields: Row fields joined into the pytest id
+
+        Returns:
+            Iterator[CaseRef]: One reference per row, loaded with load()
+        """
+        path = TestDataProvider.resolve(name)
+        seen = set()
+        for key, row in CaseSources.scan(path):
+            values = tuple(str(value) for value in row.values())
+            if values in seen:
+                TestDataProvider.duplicates += 1
+                continue
+            seen.add(values)
+
+            setup = tuple(sys.intern(str(row.get(field, ""))) for field in TestDataProvider.SETUP_FIELDS)
+            yield CaseRef(path, key, "-".join(str(row[field]) for field in id_fields), setup)
+
+    @staticmethod
+    def load(ref: CaseRef) -> TestData:
+        """Read the case a reference points at."""
+        return TestData.from_row(CaseSources.load(ref.source, ref.key))
@@ -10,6 +10,7 @@ from app.steps.checkout_steps import CheckoutSteps
 from app.steps.order_verification_steps import OrderVerificationSteps
 
 
+@pytest.mark.cart_setup("http")
 class TestCheckout(BaseTest):
     """Test complete checkout process."""
 
@@ -37,7 +38,7 @@ class TestCheckout(BaseTest):
         )
 
         login_steps = LoginSteps(self.driver, self.waiter)
-        shopping_steps = ShoppingSteps(self.driver, self.waiter)
+        shopping_steps = ShoppingSteps(self.driver, self.waiter, self.cart_setup)
         cart_steps = CartSteps(self.driver, self.waiter)
         checkout_steps = CheckoutSteps(self.driver, self.waiter)
         order_steps = OrderVerificationSteps(self.driver)
@@ -94,7 +95,7 @@ class TestCheckout(BaseTest):
         )
 
         login_steps = LoginSteps(self.driver, self.waiter)
-        shopping_steps = ShoppingSteps(self.driver, self.waiter)
+        shopping_steps = ShoppingSteps(self.driver, self.waiter, self.cart_setup)
         cart_steps = CartSteps(self.driver, self.waiter)
         checkout_steps = CheckoutSteps(self.driver, self.waiter)
         order_steps = OrderVerificationSteps(self.driver)
@@ -1,9 +1,5 @@
 import pytest
 from app.tests.BaseTest import BaseTest
-from app.tests.data.test_data_provider import TestDataProvider
-from app.models.user_credentials import UserCredentials
-from app.models.product_data import ProductData
-from app.models.billing_details import BillingDetails
 from app.steps.login_steps import LoginSteps
 from app.steps.shopping_steps import ShoppingSteps
 from app.steps.cart_steps import CartSteps
@@ -12,14 +8,11 @@ from app.steps.order_verification_steps import OrderVerificationSteps
 from app.utils.report_utils import ReportUtils
 
 
+@pytest.mark.cart_setup("http")
 class TestDataDrivenCheckout(BaseTest):
     """Data-driven checkout tests."""
 
-    @pytest.mark.parametrize(
-        "test_data",
-        TestDataProvider.get_checkout_test_data(),
-        ids=lambda td: f"{td.first_name}-{td.coupon}"
-    )
+    @pytest.mark.cases("checkout_cases", id_fields=("first_name", "coupon"))
     def test_should_complete_checkout_successfully(self, test_data):
         """
         GIVEN authenticated user with product ready for checkout
@@ -27,24 +20,12 @@ class TestDataDrivenCheckout(BaseTest):
         THEN order should be created and visible in order history
         """
         # GIVEN - Authenticated user with product
-        user = UserCredentials(
-            username=test_data.username,
-            password=test_data.password
-        )
-        product = ProductData(name=test_data.product_name)
-        billing_details = BillingDetails(
-            first_name=test_data.first_name,
-            last_name=test_data.last_name,
-            address1=test_data.address,
-            address2=test_data.address2,
-            city=test_data.city,
-            county=test_data.state,
-            postcode=test_data.postcode,
-            phone=test_data.phone
-        )
+        user = test_data.to_user_credentials()
+        product = test_data.to_product()
+        billing_details = test_data.to_billing_details()
 
         login_steps = LoginSteps(self.driver, self.waiter)
-        shopping_steps = ShoppingSteps(self.driver, self.waiter)
+        shopping_steps = ShoppingSteps(self.driver, self.waiter, self.cart_setup)
         cart_steps = CartSteps(self.driver, self.waiter)
         checkout_steps = CheckoutSteps(self.driver, self.waiter)
         order_steps = OrderVerificationSteps(self.driver)
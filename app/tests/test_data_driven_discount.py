@@ -1,9 +1,6 @@
 import pytest
 from decimal import Decimal
 from app.tests.BaseTest import BaseTest
-from app.tests.data.test_data_provider import TestDataProvider
-from app.models.user_credentials import UserCredentials
-from app.models.product_data import ProductData
 from app.steps.login_steps import LoginSteps
 from app.steps.shopping_steps import ShoppingSteps
 from app.steps.cart_steps import CartSteps
@@ -14,11 +11,7 @@ from app.utils.report_utils import ReportUtils
 class TestDataDrivenDiscount(BaseTest):
     """Data-driven discount calculation tests."""
 
-    @pytest.mark.parametrize(
-        "test_data",
-        TestDataProvider.get_discount_test_data(),
-        ids=lambda td: f"{td.product_name}-{td.coupon}"
-    )
+    @pytest.mark.cases("discount_cases", id_fields=("product_name", "coupon"))
     def test_should_calculate_discount_correctly(self, test_data):
         """
         GIVEN user logs in with test credentials
@@ -26,11 +19,8 @@ class TestDataDrivenDiscount(BaseTest):
         THEN discount calculation should match expected percentage
         """
         # GIVEN - User logs in
-        user = UserCredentials(
-            username=test_data.username,
-            password=test_data.password
-        )
-        product = ProductData(name=test_data.product_name)
+        user = test_data.to_user_credentials()
+        product = test_data.to_product()
 
         login_steps = LoginSteps(self.driver, self.waiter)
         shopping_steps = ShoppingSteps(self.driver, self.waiter)
@@ -0,0 +1,88 @@
+import pytest
+
+from app.tests.BaseTest import BaseTest
+from app.models.user_credentials import UserCredentials
+from app.models.product_data import ProductData
+from app.pom.cart_pom import CartPOM, LINE_ITEMS_SCRIPT, RESET_SCRIPT, SET_QUANTITIES_SCRIPT
+from app.pom.checkout_pom import FILL_SCRIPT
+from app.pom.my_account_orders_pom import MyAccountOrdersPOM, ORDERS_PAGE_SCRIPT
+from app.pom.shop_pom import ShopPOM, CATALOG_PAGE_SCRIPT
+from app.steps.login_steps import LoginSteps
+from app.steps.shopping_steps import ShoppingSteps
+from app.steps.cart_steps import CartSteps
+from app.utils.dom_snapshot import DomSnapshot
+from app.utils.helpers import Helpers
+from app.utils.http_driver import HttpDriver
+from app.utils.waiter import Waiter
+
+
+class TestPageScriptParity(BaseTest):
+    """Each PageScript's HttpDriver equivalent must return what the in-page script returns."""
+
+    def test_http_equivalents_match_in_page_scripts(self):
+        """
+        GIVEN a logged-in customer with a product in the cart
+        WHEN each page script runs in the browser and on an HttpDriver sharing its session
+        THEN both return the same value
+        """
+        if self.driver.capabilities.get("browserName") == "http":
+            pytest.skip("needs a browser that runs JavaScript")
+
+        # GIVEN - A customer with a cart, and an HttpDriver on the same session
+        user = UserCredentials(
+            username="luis.hueso@2.com",
+            password="luis.hueso"
+        )
+        LoginSteps(self.driver, self.waiter).login_as(user)
+        CartSteps(self.driver, self.waiter).clear_cart()
+        ShoppingSteps(self.driver, self.waiter).add_product_to_cart(ProductData(name="Polo"))
+
+        twin = HttpDriver()
+        twin.get(Helpers.LOGIN_URL)
+        for cookie in self.driver.get_cookies():
+            twin.add_cookie(cookie)
+
+        def both(url, script, *args, run_async=False):
+            self.driver.get(url)
+            twin.get(url)
+            run = self.driver.execute_async_script if run_async else self.driver.execute_script
+            return run(script, *args), twin.execute_script(script, *args)
+
+        totals = {
+            "subtotal": CartPOM.subtotal_amount,
+            "discount": CartPOM.discount_amount,
+            "shipping": CartPOM.shipping_amount,
+            "total": CartPOM.order_total_amount,
+        }
+        cases = {
+            "catalog page": (Helpers.SHOP_URL, CATALOG_PAGE_SCRIPT, (
+                ShopPOM.product_links[1], ShopPOM.product_titles[1], ShopPOM.next_page_link[1]
+            ), False),
+            "order history": (f"{Helpers.ACCOUNT_URL}orders/", ORDERS_PAGE_SCRIPT, (
+                MyAccountOrdersPOM.order_links[1], MyAccountOrdersPOM.next_page_link[1]
+            ), False),
+            "cart line items": (Helpers.CART_URL, LINE_ITEMS_SCRIPT, (), False),
+            "cart totals snapshot": (Helpers.CART_URL, DomSnapshot.SCRIPT, (
+                [[key, by, value] for key, (by, value) in totals.items()],
+            ), False),
+            "mutation wait": (Helpers.CART_URL, Waiter.MUTATION_SCRIPT, (".cart-subtotal", True, 0), True),
+            "unknown quantity": (Helpers.CART_URL, SET_QUANTITIES_SCRIPT, ({"No such product": 2},), False),
+            "checkout fill": (Helpers.CHECKOUT_URL, FILL_SCRIPT, (
+                {"billing_first_name": "Luis", "no_such_field": "x"},
+            ), False),
+        }
+
+        # WHEN / THEN - Both sides agree on every page
+        try:
+            for name, (url, script, args, run_async) in cases.items():
+                in_page, over_http = both(url, script, *args, run_async=run_async)
+                assert in_page == over_http, f"{name}: browser {in_page!r} != HttpDriver {over_http!r}"
+
+            # The reset empties the shared cart, so the second run sees the first one's result
+            in_page, over_http = both(Helpers.CART_URL, RESET_SCRIPT, Helpers.STORE_API_URL, run_async=True)
+            assert in_page == over_http == {"items": 0, "coupons": 0}, \
+                f"cart reset: browser {in_page!r} != HttpDriver {over_http!r}"
+        finally:
+            twin.quit()
+
+        LoginSteps(self.driver, self.waiter).logout()
@@ -0,0 +1,49 @@
+from app.tests.BaseTest import BaseTest
+from app.models.user_credentials import UserCredentials
+from app.models.product_data import ProductData
+from app.steps.login_steps import LoginSteps
+from app.steps.shopping_steps import ShoppingSteps
+from app.steps.cart_steps import CartSteps
+from app.utils.waiter import Waiter
+
+
+class TestShopperIsolation(BaseTest):
+    """Concurrent shoppers must not share sessions or carts."""
+
+    def test_guest_shopper_does_not_see_logged_in_customers_cart(self):
+        """
+        GIVEN a logged-in customer and a guest shopping at the same time
+        WHEN each adds a different product to the cart
+        THEN each cart holds only that shopper's product
+        """
+        # GIVEN - A customer and a guest; with --contexts-per-browser the
+        # guest is another context of the customer's browser
+        user = UserCredentials(
+            username="luis.hueso@2.com",
+            password="luis.hueso"
+        )
+        guest = self.new_shopper()
+        guest_waiter = Waiter(guest, timeout=10)
+
+        login_steps = LoginSteps(self.driver, self.waiter)
+        customer_cart = CartSteps(self.driver, self.waiter)
+        guest_cart = CartSteps(guest, guest_waiter)
+
+        login_steps.login_as(user)
+        customer_cart.clear_cart()
+
+        # WHEN - Both shoppers fill their carts
+        ShoppingSteps(self.driver, self.waiter).add_product_to_cart(ProductData(name="Polo"))
+        ShoppingSteps(guest, guest_waiter).add_product_to_cart(ProductData(name="Beanie"))
+
+        # THEN - Neither sees the other's cart
+        customer_cart.navigate_to_cart()
+        guest_cart.navigate_to_cart()
+        assert [item.name for item in customer_cart.get_line_items()] == ["Polo"], \
+            "Customer cart should only hold the customer's product"
+        assert [item.name for item in guest_cart.get_line_items()] == ["Beanie"], \
+            "Guest cart should only hold the guest's product"
+        assert not LoginSteps(guest, guest_waiter).nav.is_logout_displayed(), \
+            "Guest should not share the customer's login"
+
+        login_steps.logout()
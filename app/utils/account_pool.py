@@ -0,0 +1,146 @@
+# utils/account_pool.py
+import csv
+import os
+import tempfile
+from pathlib import Path
+from typing import List, Optional
+
+from app.models.user_credentials import UserCredentials
+from app.utils.helpers import Helpers
+
+
+class AccountPool:
+    """
+    Hands each pytest-xdist worker its own shop account.
+
+    WooCommerce keeps one persistent cart per account, so workers sharing
+    an account clear and fill each other's cart. Every worker leases one
+    account for the whole session; a lock file per account guarantees no
+    two workers of the same run hold the same one.
+
+    Tests keep using the shared default account from Helpers - LoginSteps
+    swaps it for the leased account via resolve().
+    """
+
+    def __init__(self, accounts: List[UserCredentials], worker_id: str = "master"):
+        """
+        Initialize the pool.
+
+        Args:
+            accounts: Credentials available to this run
+            worker_id: xdist worker id (gw0, gw1, ...) or "master"
+        """
+        if not accounts:
+            raise ValueError("Account pool is empty")
+
+        self.accounts = accounts
+        self.worker_id = worker_id
+        self.leased: Optional[UserCredentials] = None
+        self._lock_path: Optional[Path] = None
+
+    @staticmethod
+    def from_file(path: str, worker_id: str = "master") -> "AccountPool":
+        """
+        Load accounts from a CSV file with username,password columns.
+
+        Args:
+            path: CSV file path
+            worker_id: xdist worker id
+        """
+        with open(path, newline="", encoding="utf-8") as handle:
+            accounts = [
+                UserCredentials(username=row["username"], password=row["password"])
+                for row in csv.DictReader(handle)
+            ]
+        return AccountPool(accounts, worker_id)
+
+    @staticmethod
+    def from_helpers(worker_id: str = "master") -> "AccountPool":
+        """Build the pool from Helpers.ACCOUNT_POOL."""
+        accounts = [
+            UserCredentials(username=username, password=password)
+            for username, password in Helpers.ACCOUNT_POOL
+        ]
+        return AccountPool(accounts, worker_id)
+
+    @property
+    def worker_index(self) -> int:
+        """Numeric worker index - 0 when not running under xdist."""
+        if self.worker_id.startswith("gw"):
+            return int(self.worker_id[2:])
+        return 0
+
+    def lease(self) -> UserCredentials:
+        """
+        Reserve an account for this worker.
+
+        Tries the account matching the worker index first so leases are
+        stable between runs, then any other free account.
+
+        Returns:
+            UserCredentials: Account reserved for this worker
+
+        Raises:
+            RuntimeError: If every account is held by another worker
+        """
+        if self.worker_id == "master":
+            self.leased = self.accounts[0]
+            return self.leased
+
+        lock_dir = self._lock_dir()
+        start = self.worker_index % len(self.accounts)
+        order = self.accounts[start:] + self.accounts[:start]
+
+        for account in order:
+            lock_path = lock_dir / f"{self._slug(account.username)}.lock"
+            try:
+                fd = os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            except FileExistsError:
+                continue
+
+            os.write(fd, self.worker_id.encode())
+            os.close(fd)
+            self.leased = account
+            self._lock_path = lock_path
+            return account
+
+        raise RuntimeError(
+            f"No free account for worker {self.worker_id}: "
+            f"{len(self.accounts)} account(s) for this many workers. "
+            "Pass more accounts with --accounts-file."
+        )
+
+    def release(self) -> None:
+        """Give the leased account back; the last worker out removes the run's lock dir."""
+        if self._lock_path is not None:
+            self._lock_path.unlink(missing_ok=True)
+            try:
+                self._lock_path.parent.rmdir()
+            except OSError:
+                pass  # Other workers still hold accounts
+            self._lock_path = None
+        self.leased = None
+
+    def resolve(self, credentials: UserCredentials) -> UserCredentials:
+        """
+        Map the shared default account to this worker's leased account.
+
+        Any other credentials are returned unchanged.
+        """
+        if self.leased is None:
+            return credentials
+        if credentials.username != Helpers.USERNAME:
+            return credentials
+        return self.leased
+
+    @staticmethod
+    def _lock_dir() -> Path:
+        # Every worker of one xdist run shares the same run id
+        run_id = os.environ.get("PYTEST_XDIST_TESTRUNUID", "local")
+        path = Path(tempfile.gettempdir()) / f"woo-accounts-{run_id}"
+        path.mkdir(parents=True, exist_ok=True)
+        return path
+
+    @staticmethod
+    def _slug(username: str) -> str:
+        return "".join(ch if ch.isalnum() else "_" for ch in username)
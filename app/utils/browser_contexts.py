@@ -0,0 +1,229 @@
+# utils/browser_contexts.py
+import inspect
+import types
+from dataclasses import asdict, dataclass, field
+from typing import Callable, Dict, List, Optional
+
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.remote.switch_to import SwitchTo
+from selenium.webdriver.remote.webelement import WebElement
+
+
+@dataclass
+class HostBrowser:
+    """A real browser process and the isolated contexts open in it."""
+    driver: object
+    contexts: List["ContextDriver"] = field(default_factory=list)
+    # Window the browser's WebDriver session is currently switched to
+    active_handle: Optional[str] = None
+
+
+class ContextDriver:
+    """
+    WebDriver for one isolated browser context of a shared browser.
+
+    Behaves like the browser's own driver, but every command first switches
+    the session to this context's window (only when another context was
+    active). WebElements it returns are bound to it, so element calls
+    switch too. quit() disposes the context, not the browser.
+    """
+
+    def __init__(self, host: HostBrowser, handle: str, context_id: str, owner: "BrowserContexts"):
+        self._host = host
+        self._owner = owner
+        self.handle = handle
+        self.context_id = context_id
+        self._switch_to = SwitchTo(self)
+
+    def execute(self, driver_command: str, params: Optional[dict] = None) -> dict:
+        """Run a command in this context's window."""
+        host = self._host
+        if host.active_handle != self.handle:
+            host.driver.switch_to.window(self.handle)
+            host.active_handle = self.handle
+        response = host.driver.execute(driver_command, params)
+        if response:
+            self._adopt(response.get("value"))
+        return response
+
+    @property
+    def switch_to(self) -> SwitchTo:
+        """Frames and alerts of this context's window."""
+        return self._switch_to
+
+    @property
+    def window_handles(self) -> List[str]:
+        """Only this context's window - other contexts belong to other tests."""
+        return [self.handle]
+
+    def quit(self) -> None:
+        """Dispose the context (its window, cookies and storage)."""
+        self._owner.dispose(self)
+
+    def __getattr__(self, name: str):
+        if name.startswith("__") or name in ("_host", "_owner"):
+            raise AttributeError(name)
+        driver = self._host.driver
+        # Bind the browser driver's methods and properties to this proxy so
+        # the commands they send go through execute() above. The class
+        # definition wins over per-instance wrappers on the browser (e.g.
+        # DriverServices' first get() timing), which would run in its window.
+        attr = inspect.getattr_static(type(driver), name, None)
+        if inspect.isfunction(attr):
+            return types.MethodType(attr, self)
+        if isinstance(attr, property):
+            return attr.fget(self)
+        return getattr(driver, name)
+
+    def _adopt(self, value) -> None:
+        """Re-parent returned elements so their commands switch to this window."""
+        if isinstance(value, WebElement):
+            value._parent = self
+        elif isinstance(value, list):
+            for item in value:
+                self._adopt(item)
+        elif isinstance(value, dict):
+            for item in value.values():
+                self._adopt(item)
+
+
+@dataclass
+class ContextStats:
+    """Contexts and browsers opened by BrowserContexts over a session."""
+    opened: int = 0
+    browsers: int = 0
+    fallbacks: int = 0
+
+    def merge(self, other: dict) -> None:
+        """Add another worker's stats (as produced by to_dict) to these."""
+        self.opened += other.get("opened", 0)
+        self.browsers += other.get("browsers", 0)
+        self.fallbacks += other.get("fallbacks", 0)
+
+    def to_dict(self) -> dict:
+        """Plain dict for xdist workeroutput."""
+        return asdict(self)
+
+    def summary_lines(self) -> List[str]:
+        """Format context usage for the pytest terminal summary."""
+        return [
+            f"Browser contexts: {self.opened} in {self.browsers} browser(s)"
+            + (f", {self.fallbacks} separate browser(s)" if self.fallbacks else "")
+        ]
+
+
+class BrowserContexts:
+    """
+    Driver factory that packs several isolated shoppers into one browser.
+
+    Chrome and Edge get a CDP browser context per driver
+    (Target.createBrowserContext): its own window, cookie jar and storage,
+    like a separate incognito profile, at the cost of a tab instead of a
+    browser process. Up to `per_browser` contexts share a browser; more
+    launch another one. Firefox has no CDP, so it falls back to a separate
+    browser per driver, as does a Chromium browser refusing the commands.
+    """
+
+    def __init__(self, factory: Callable[[], object], per_browser: int = 4,
+                 prepare: Optional[Callable[[object], None]] = None):
+        """
+        Initialize without launching a browser.
+
+        Args:
+            factory: Callable returning a new WebDriver (a real browser)
+            per_browser: Maximum contexts open in one browser
+            prepare: Called with every new context driver (e.g. URL blocking)
+        """
+        self.factory = factory
+        self.per_browser = max(1, per_browser)
+        self.prepare = prepare
+        self.hosts: List[HostBrowser] = []
+        self.stats = ContextStats()
+        self._supported = True
+
+    def __call__(self):
+        """
+        Open a new isolated context, launching a browser if all are full.
+
+        Returns:
+            WebDriver: ContextDriver, or a separate browser where contexts are unsupported
+        """
+        if not self._supported:
+            return self._separate_browser()
+
+        host = next((h for h in self.hosts if len(h.contexts) < self.per_browser), None)
+        launched = host is None
+        if launched:
+            host = HostBrowser(self.factory())
+            if not hasattr(host.driver, "execute_cdp_cmd"):
+                self._supported = False
+                self.stats.fallbacks += 1
+                return host.driver
+            self.hosts.append(host)
+
+        try:
+            context = self._open(host)
+        except WebDriverException:
+            self._supported = False
+            if launched:
+                # It would otherwise stay open, unused, until shutdown
+                self.hosts.remove(host)
+                self._quit(host)
+            return self._separate_browser()
+        if launched:
+            self.stats.browsers += 1
+
+        if self.prepare is not None:
+            self.prepare(context)
+        return context
+
+    def dispose(self, context: ContextDriver) -> None:
+        """Close a context; its browser stays up for the next one."""
+        host = context._host
+        if context in host.contexts:
+            host.contexts.remove(context)
+        if host.active_handle == context.handle:
+            host.active_handle = None
+        try:
+            host.driver.execute_cdp_cmd(
+                "Target.disposeBrowserContext", {"browserContextId": context.context_id}
+            )
+        except WebDriverException:
+            pass  # Browser may already be gone
+
+    def shutdown(self) -> None:
+        """Quit every host browser; call after the pool has quit its drivers."""
+        for host in self.hosts:
+            self._quit(host)
+        self.hosts.clear()
+
+    def _open(self, host: HostBrowser) -> ContextDriver:
+        driver = host.driver
+        context_id = driver.execute_cdp_cmd(
+            "Target.createBrowserContext", {"disposeOnDetach": False}
+        )["browserContextId"]
+        target: Dict = driver.execute_cdp_cmd(
+            "Target.createTarget",
+            {"url": "about:blank", "browserContextId": context_id, "newWindow": True},
+        )
+        # ChromeDriver window handles are DevTools target ids
+        handle = target["targetId"]
+        if handle not in driver.window_handles:
+            driver.execute_cdp_cmd("Target.disposeBrowserContext", {"browserContextId": context_id})
+            raise WebDriverException("Browser context window is not visible to WebDriver")
+
+        context = ContextDriver(host, handle, context_id, self)
+        host.contexts.append(context)
+        self.stats.opened += 1
+        return context
+
+    @staticmethod
+    def _quit(host: HostBrowser) -> None:
+        try:
+            host.driver.quit()
+        except Exception:
+            pass  # Browser may already be gone
+
+    def _separate_browser(self):
+        self.stats.fallbacks += 1
+        return self.factory()
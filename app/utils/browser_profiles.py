@@ -0,0 +1,84 @@
+# utils/browser_profiles.py
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+# Third-party requests the tests never look at
+THIRD_PARTY_BLOCKLIST = (
+    "*google-analytics.com*",
+    "*googletagmanager.com*",
+    "*doubleclick.net*",
+    "*facebook.net*",
+    "*hotjar.com*",
+    "*gravatar.com*",
+    "*fonts.googleapis.com*",
+    "*fonts.gstatic.com*",
+)
+
+FONT_PATTERNS = ("*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot")
+IMAGE_PATTERNS = ("*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg")
+
+
+@dataclass(frozen=True)
+class BrowserProfile:
+    """Immutable set of browser performance settings."""
+    name: str
+    headless: bool = False
+    block_images: bool = False
+    block_fonts: bool = False
+    blocked_urls: Tuple[str, ...] = ()
+    page_load_strategy: str = "normal"
+    window_size: Optional[Tuple[int, int]] = None  # None maximizes the window
+
+    def url_blocklist(self) -> Tuple[str, ...]:
+        """All URL patterns to block via CDP Network.setBlockedURLs."""
+        patterns = self.blocked_urls
+        if self.block_fonts:
+            patterns += FONT_PATTERNS
+        if self.block_images:
+            patterns += IMAGE_PATTERNS
+        return patterns
+
+
+class BrowserProfiles:
+    """Named performance profiles selectable with --profile."""
+
+    DEFAULT = BrowserProfile(name="default")
+
+    # Same rendering as a user sees, minus third-party noise and the repaint
+    LEAN = BrowserProfile(
+        name="lean",
+        block_images=True,
+        block_fonts=True,
+        blocked_urls=THIRD_PARTY_BLOCKLIST,
+        page_load_strategy="eager",
+        window_size=(1366, 900),
+    )
+
+    HEADLESS = BrowserProfile(
+        name="headless",
+        headless=True,
+        block_images=True,
+        block_fonts=True,
+        blocked_urls=THIRD_PARTY_BLOCKLIST,
+        page_load_strategy="eager",
+        window_size=(1366, 900),
+    )
+
+    ALL: Dict[str, BrowserProfile] = {
+        profile.name: profile for profile in (DEFAULT, LEAN, HEADLESS)
+    }
+
+    @staticmethod
+    def get(name: str) -> BrowserProfile:
+        """
+        Look up a profile by name.
+
+        Raises:
+            KeyError: If the profile does not exist
+        """
+        try:
+            return BrowserProfiles.ALL[name]
+        except KeyError:
+            raise KeyError(
+                f"Unknown browser profile '{name}', choose from {sorted(BrowserProfiles.ALL)}"
+            ) from None
@@ -0,0 +1,85 @@
+# utils/catalog_index.py
+from typing import Dict, Iterable, Optional, Tuple
+from urllib.parse import quote_plus
+
+
+class CatalogIndex:
+    """
+    Product name -> product page URL for one shop, built once per session.
+
+    The index fills up as shop pages are read (one script call per page),
+    so a product seen once is reached with a single driver.get afterwards.
+    Listing pages are followed lazily, only until the product turns up;
+    products still missing are looked up with the shop's search.
+    """
+
+    # One index per site (base URL) for this worker's session
+    _indexes: Dict[str, "CatalogIndex"] = {}
+
+    def __init__(self, base_url: str):
+        """
+        Initialize an empty index.
+
+        Args:
+            base_url: Shop base URL, e.g. Helpers.BASE_URL
+        """
+        self.base_url = base_url.rstrip("/")
+        self.urls: Dict[str, str] = {}
+        self.pages_read = 0
+        self.searches = 0
+        # Next unread listing page; None once the last page was read
+        self._next_page: Optional[str] = f"{self.base_url}/shop/"
+
+    @classmethod
+    def for_site(cls, base_url: str) -> "CatalogIndex":
+        """Session index of a shop."""
+        index = cls._indexes.get(base_url)
+        if index is None:
+            index = cls._indexes[base_url] = cls(base_url)
+        return index
+
+    def add(self, products: Iterable[Tuple[str, str]]) -> None:
+        """Record (name, URL) pairs read from a listing."""
+        for name, url in products:
+            if name:
+                self.urls.setdefault(name.lower(), url)
+
+    def url_for(self, product_name: str, shop_pom) -> Optional[str]:
+        """
+        Find a product's page URL.
+
+        Args:
+            product_name: Product title as shown in the shop
+            shop_pom: ShopPOM used to read listing and search pages
+
+        Returns:
+            str: Product URL, or None if neither the listing nor search has it
+        """
+        key = product_name.lower()
+        if key in self.urls:
+            return self.urls[key]
+
+        while self._next_page is not None:
+            shop_pom.open_page(self._next_page)
+            products, self._next_page = shop_pom.read_catalog_page()
+            self.pages_read += 1
+            self.add(products)
+            if key in self.urls:
+                return self.urls[key]
+
+        return self._search(product_name, shop_pom)
+
+    def _search(self, product_name: str, shop_pom) -> Optional[str]:
+        """Fallback for products hidden from the listing (e.g. catalog visibility)."""
+        self.searches += 1
+        shop_pom.open_page(f"{self.base_url}/?s={quote_plus(product_name)}&post_type=product")
+
+        # WooCommerce jumps straight to the product when the search has one hit
+        current = shop_pom.driver.current_url
+        if "/product/" in current:
+            self.urls[product_name.lower()] = current
+            return current
+
+        products, _ = shop_pom.read_catalog_page()
+        self.add(products)
+        return self.urls.get(product_name.lower())
@@ -0,0 +1,108 @@
+# utils/dom_snapshot.py
+from dataclasses import dataclass
+from typing import Dict, List, Tuple
+
+from app.utils.page_script import PageScript
+
+
+@dataclass(frozen=True)
+class ElementState:
+    """
+    Immutable state of one located element at snapshot time.
+
+    text is '' unless the element is visible; check visible before
+    parsing it.
+    """
+    present: bool
+    visible: bool
+    text: str
+
+
+class DomSnapshot:
+    """
+    Reads many locators in a single WebDriver round-trip.
+
+    Each find_element + .text pair costs two HTTP calls to the driver;
+    a snapshot resolves every locator in one execute_script call and
+    returns text and visibility for all of them.
+    """
+
+    SCRIPT = PageScript("""
+        const specs = arguments[0];
+        const result = {};
+
+        function linkByText(value, partial) {
+            for (const link of document.querySelectorAll('a')) {
+                const text = link.innerText.trim();
+                if (partial ? text.includes(value) : text === value) {
+                    return link;
+                }
+            }
+            return null;
+        }
+
+        function find(by, value) {
+            switch (by) {
+                case 'css selector': return document.querySelector(value);
+                case 'id': return document.getElementById(value);
+                case 'name': return document.getElementsByName(value)[0] || null;
+                case 'class name': return document.getElementsByClassName(value)[0] || null;
+                case 'tag name': return document.getElementsByTagName(value)[0] || null;
+                case 'link text': return linkByText(value, false);
+                case 'partial link text': return linkByText(value, true);
+                case 'xpath': return document.evaluate(
+                    value, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null
+                ).singleNodeValue;
+            }
+            return null;
+        }
+
+        for (const [key, by, value] of specs) {
+            const el = find(by, value);
+            if (!el) {
+                result[key] = [false, false, ''];
+                continue;
+            }
+            const style = window.getComputedStyle(el);
+            const rect = el.getBoundingClientRect();
+            const visible = style.display !== 'none'
+                && style.visibility !== 'hidden'
+                && (rect.width > 0 || rect.height > 0);
+            result[key] = [true, visible, visible ? el.innerText.trim() : ''];
+        }
+        return result;
+    """)
+
+    @staticmethod
+    @SCRIPT.over_http
+    def _read_over_http(driver, specs: List[list]) -> Dict[str, list]:
+        """SCRIPT on HttpDriver: [present, visible, text] of the first match of each locator."""
+        result = {}
+        for key, by, value in specs:
+            elements = driver.find_elements(by, value)
+            if not elements:
+                result[key] = [False, False, ""]
+                continue
+            visible = elements[0].is_displayed()
+            result[key] = [True, visible, elements[0].text.strip() if visible else ""]
+        return result
+
+    @staticmethod
+    def read(driver, locators: Dict[str, Tuple[str, str]]) -> Dict[str, ElementState]:
+        """
+        Snapshot several elements at once.
+
+        Args:
+            driver: WebDriver instance
+            locators: Mapping of key -> (By strategy, value) locator tuple
+
+        Returns:
+            Dict[str, ElementState]: State for every key; missing elements
+            are reported with present=False rather than raising
+        """
+        specs = [[key, by, value] for key, (by, value) in locators.items()]
+        raw = driver.execute_script(DomSnapshot.SCRIPT, specs)
+        return {
+            key: ElementState(present=state[0], visible=state[1], text=state[2])
+            for key, state in raw.items()
+        }
@@ -0,0 +1,110 @@
+# utils/driver_factory.py
+from typing import Optional
+
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.edge.options import Options as EdgeOptions
+from selenium.webdriver.firefox.options import Options as FirefoxOptions
+from app.utils.browser_profiles import BrowserProfile, BrowserProfiles
+from app.utils.driver_services import DriverServices
+from app.utils.http_driver import HttpDriver
+from app.utils.instrumentation import Instrumentation
+
+
+class DriverFactory:
+    """Creates configured WebDriver instances."""
+
+    SUPPORTED_BROWSERS = ("chrome", "firefox", "edge", "http")
+
+    @staticmethod
+    def create(browser: str = "chrome", profile: BrowserProfile = BrowserProfiles.DEFAULT,
+               services: Optional[DriverServices] = None):
+        """
+        Launch a new browser session.
+
+        Args:
+            browser: Browser name - chrome, firefox, edge, or http for a
+                     browserless HttpDriver (server-rendered flows only)
+            profile: Performance settings (headless, blocking, load strategy)
+            services: Cached driver paths and shared driver processes; without
+                      it Selenium resolves and spawns a driver for this browser
+
+        Returns:
+            WebDriver: Ready-to-use driver with waits and window configured
+        """
+        browser = browser.lower()
+        if browser not in DriverFactory.SUPPORTED_BROWSERS:
+            browser = "chrome"
+        if browser == "http":
+            driver = HttpDriver()
+            Instrumentation.attach(driver)
+            return driver
+
+        if browser == "firefox":
+            options = DriverFactory.firefox_options(profile)
+        elif browser == "edge":
+            options = DriverFactory.chromium_options(EdgeOptions(), profile)
+        else:
+            options = DriverFactory.chromium_options(Options(), profile)
+
+        if services is not None:
+            driver = services.new_session(browser, options)
+        elif browser == "firefox":
+            driver = webdriver.Firefox(options=options)
+        elif browser == "edge":
+            driver = webdriver.Edge(options=options)
+        else:
+            driver = webdriver.Chrome(options=options)
+
+        # Waits are explicit (Waiter) so negative checks return immediately
+        driver.implicitly_wait(0)
+        if profile.window_size:
+            driver.set_window_size(*profile.window_size)
+        elif not profile.headless:
+            driver.maximize_window()
+
+        DriverFactory.block_urls(driver, profile)
+        Instrumentation.attach(driver)
+        return driver
+
+    @staticmethod
+    def chromium_options(options, profile: BrowserProfile):
+        """Apply a profile to Chrome or Edge options."""
+        options.page_load_strategy = profile.page_load_strategy
+        if profile.headless:
+            options.add_argument("--headless=new")
+        if profile.window_size:
+            options.add_argument("--window-size={},{}".format(*profile.window_size))
+        if profile.block_images:
+            options.add_experimental_option(
+                "prefs", {"profile.managed_default_content_settings.images": 2}
+            )
+        return options
+
+    @staticmethod
+    def firefox_options(profile: BrowserProfile) -> FirefoxOptions:
+        """
+        Apply a profile to Firefox options.
+
+        Firefox has no CDP URL blocklist, so only images and web fonts
+        are blocked (via prefs); third-party URLs still load.
+        """
+        options = FirefoxOptions()
+        options.page_load_strategy = profile.page_load_strategy
+        if profile.headless:
+            options.add_argument("-headless")
+        if profile.block_images:
+            options.set_preference("permissions.default.image", 2)
+        if profile.block_fonts:
+            options.set_preference("gfx.downloadable_fonts.enabled", False)
+            options.set_preference("browser.display.use_document_fonts", 0)
+        return options
+
+    @staticmethod
+    def block_urls(driver, profile: BrowserProfile) -> None:
+        """Block fonts, images and third-party scripts over CDP (Chromium only)."""
+        patterns = profile.url_blocklist()
+        if not patterns or not hasattr(driver, "execute_cdp_cmd"):
+            return
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": list(patterns)})
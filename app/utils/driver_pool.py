@@ -0,0 +1,200 @@
+# utils/driver_pool.py
+import time
+from dataclasses import asdict, dataclass
+from typing import Callable, List, Optional
+
+from app.utils.helpers import Helpers
+from app.utils.page_script import PageScript
+
+
+@dataclass
+class PoolStats:
+    """Counters collected by DriverPool over a session."""
+    hits: int = 0
+    misses: int = 0
+    recycled: int = 0
+    resets: int = 0
+    reset_seconds: float = 0.0
+    reset_failures: int = 0
+    kept_sessions: int = 0
+
+    @property
+    def avg_reset_ms(self) -> float:
+        """Average reset duration in milliseconds."""
+        if not self.resets:
+            return 0.0
+        return self.reset_seconds / self.resets * 1000
+
+    def merge(self, other: dict) -> None:
+        """Add another worker's stats (as produced by to_dict) to these."""
+        for name, value in other.items():
+            setattr(self, name, getattr(self, name) + value)
+
+    def to_dict(self) -> dict:
+        """Plain dict for xdist workeroutput."""
+        return asdict(self)
+
+    def summary_lines(self) -> List[str]:
+        """Format stats for the pytest terminal summary."""
+        return [
+            f"Pool hits:      {self.hits}",
+            f"Pool misses:    {self.misses}",
+            f"Recycled:       {self.recycled}",
+            f"Resets:         {self.resets} "
+            f"(avg {self.avg_reset_ms:.1f} ms, {self.reset_failures} failed)",
+            f"Kept sessions:  {self.kept_sessions}",
+        ]
+
+
+@dataclass
+class PooledDriver:
+    """A pooled browser and its usage counter."""
+    driver: object
+    uses: int = 0
+    in_use: bool = False
+    kept: bool = False  # Released without a reset for the next test
+
+
+class DriverPool:
+    """
+    Keeps warm browsers alive for the whole session and hands them out per test.
+
+    Responsibilities:
+    - Launch browsers lazily up to `size`
+    - Reset state between tests (cookies, storage, extra windows)
+    - Recycle a browser after `max_uses` tests or after a failure
+    - Keep a session (skip the reset) when the next test shares it, and
+      hand that browser out first
+    - Track hit/miss and reset timing stats
+
+    One pool exists per pytest process, so every xdist worker
+    keeps its own set of browsers.
+    """
+
+    CLEAR_STORAGE_SCRIPT = PageScript(
+        "window.localStorage.clear(); window.sessionStorage.clear();", http=PageScript.ignore
+    )
+
+    def __init__(self, factory: Callable[[], object], size: int = 1, max_uses: int = 50):
+        """
+        Initialize the pool.
+
+        Args:
+            factory: Callable returning a new WebDriver
+            size: Maximum number of warm browsers kept alive
+            max_uses: Number of tests a browser serves before it is recycled
+        """
+        self.factory = factory
+        self.size = size
+        self.max_uses = max_uses
+        self.stats = PoolStats()
+        self._entries: List[PooledDriver] = []
+
+    def acquire(self):
+        """
+        Hand out an idle browser, launching one if none is warm.
+
+        Returns:
+            WebDriver: Driver reset to a clean state
+        """
+        entry = self._find_idle()
+        if entry is None:
+            self.stats.misses += 1
+            entry = PooledDriver(driver=self.factory())
+            if len(self._entries) < self.size:
+                self._entries.append(entry)
+        else:
+            self.stats.hits += 1
+
+        entry.in_use = True
+        entry.kept = False
+        entry.uses += 1
+        return entry.driver
+
+    def release(self, driver, failed: bool = False, keep_session: bool = False) -> None:
+        """
+        Return a browser to the pool.
+
+        Args:
+            driver: Driver previously returned by acquire()
+            failed: True if the test using it failed - the browser is recycled
+            keep_session: True if the next test reuses this login - cookies
+                and storage are kept and the browser is handed out next
+        """
+        entry = self._entry_for(driver)
+        if entry is None:
+            # Overflow driver launched while the pool was full
+            self._quit(driver)
+            return
+
+        entry.in_use = False
+        if failed or entry.uses >= self.max_uses:
+            self._recycle(entry)
+        elif keep_session:
+            entry.kept = True
+            self.stats.kept_sessions += 1
+        elif not self._reset(driver):
+            self._recycle(entry)
+
+    def shutdown(self) -> None:
+        """Quit every pooled browser."""
+        for entry in self._entries:
+            self._quit(entry.driver)
+        self._entries.clear()
+
+    def _recycle(self, entry: PooledDriver) -> None:
+        self.stats.recycled += 1
+        self._entries.remove(entry)
+        self._quit(entry.driver)
+
+    def _find_idle(self) -> Optional[PooledDriver]:
+        idle = [entry for entry in self._entries if not entry.in_use]
+        for entry in idle:
+            if entry.kept:
+                return entry
+        return idle[0] if idle else None
+
+    def _entry_for(self, driver) -> Optional[PooledDriver]:
+        for entry in self._entries:
+            if entry.driver is driver:
+                return entry
+        return None
+
+    def _reset(self, driver) -> bool:
+        """
+        Clear browser state so the next test starts clean.
+
+        The WooCommerce cart of a guest lives in the session cookie and is
+        dropped with it; a logged-in user's persistent cart is still emptied
+        by CartSteps.clear_cart at the start of each test.
+
+        Returns:
+            bool: False if the browser could not be reset and must be recycled
+        """
+        start = time.perf_counter()
+        try:
+            handles = driver.window_handles
+            for handle in handles[1:]:
+                driver.switch_to.window(handle)
+                driver.close()
+            driver.switch_to.window(handles[0])
+
+            # Storage is per-origin, so clear it while on the site
+            if Helpers.BASE_URL not in driver.current_url:
+                driver.get(Helpers.LOGIN_URL)
+            driver.execute_script(self.CLEAR_STORAGE_SCRIPT)
+            driver.delete_all_cookies()
+            return True
+        except Exception:
+            self.stats.reset_failures += 1
+            return False
+        finally:
+            self.stats.resets += 1
+            self.stats.reset_seconds += time.perf_counter() - start
+
+    @staticmethod
+    def _quit(driver) -> None:
+        try:
+            driver.quit()
+        except Exception:
+            pass  # Browser may already be gone
@@ -0,0 +1,228 @@
+# utils/driver_services.py
+import os
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Dict, List, Optional
+
+from selenium import webdriver
+from selenium.common.exceptions import SessionNotCreatedException
+from selenium.webdriver.chrome.service import Service as ChromeService
+from selenium.webdriver.chromium.remote_connection import ChromiumRemoteConnection
+from selenium.webdriver.common.driver_finder import DriverFinder
+from selenium.webdriver.edge.service import Service as EdgeService
+from selenium.webdriver.firefox.service import Service as FirefoxService
+
+PHASES = ("resolve", "service", "session", "first_navigation")
+
+
+@dataclass
+class StartupTimings:
+    """Browser startup cost per phase, in seconds, collected over a session."""
+    seconds: Dict[str, List[float]] = field(default_factory=lambda: {phase: [] for phase in PHASES})
+    path_cache_hits: int = 0
+    services_reused: int = 0
+
+    def add(self, phase: str, seconds: float) -> None:
+        """Record one execution of a phase."""
+        self.seconds[phase].append(seconds)
+
+    def merge(self, other: dict) -> None:
+        """Fold another worker's timings (as produced by asdict) into these."""
+        for phase, values in other.get("seconds", {}).items():
+            self.seconds.setdefault(phase, []).extend(values)
+        self.path_cache_hits += other.get("path_cache_hits", 0)
+        self.services_reused += other.get("services_reused", 0)
+
+    def to_dict(self) -> dict:
+        """Plain dict for xdist workeroutput."""
+        return asdict(self)
+
+    def summary_lines(self) -> List[str]:
+        """Format per-phase timings for the pytest terminal summary."""
+        lines = [f"{'phase':<18} {'count':>5} {'avg ms':>8} {'max ms':>8}"]
+        for phase in PHASES:
+            values = self.seconds.get(phase, [])
+            if not values:
+                continue
+            lines.append(
+                f"{phase:<18} {len(values):>5} {sum(values) / len(values) * 1000:>8.1f} "
+                f"{max(values) * 1000:>8.1f}"
+            )
+        lines.append(f"Driver path cache hits: {self.path_cache_hits}")
+        lines.append(f"Sessions on a running service: {self.services_reused}")
+        return lines
+
+
+class ServiceSession(webdriver.Remote):
+    """
+    Chrome/Edge session attached to a driver service that outlives it.
+
+    webdriver.Chrome/Edge start their own service and stop it in quit();
+    a Remote session only ends the browser. execute_cdp_cmd is kept so
+    CDP features (URL blocking, cookie injection) work unchanged.
+    """
+
+    def execute_cdp_cmd(self, cmd: str, cmd_args: dict):
+        """Send a Chrome DevTools Protocol command."""
+        return self.execute("executeCdpCommand", {"cmd": cmd, "params": cmd_args})["value"]
+
+
+class DriverServices:
+    """
+    Driver binaries and driver processes reused by every browser of a worker.
+
+    Startup has three costs before a test can navigate: Selenium Manager
+    resolving the driver binary, spawning chromedriver/geckodriver, and
+    creating the browser session. Resolved paths are kept in the pytest
+    cache, so later runs on the same machine skip Selenium Manager. One
+    chromedriver/msedgedriver process per browser serves every session of
+    this worker. geckodriver hosts a single session per process, so each
+    Firefox browser still gets its own service; it reuses the cached path.
+    """
+
+    CACHE_KEY = "woocommerce/driver_paths"
+
+    # Browsers whose driver serves many sessions: service class, CDP vendor prefix
+    SHARED = {
+        "chrome": (ChromeService, "goog"),
+        "edge": (EdgeService, "ms"),
+    }
+    SERVICES = {"chrome": ChromeService, "edge": EdgeService, "firefox": FirefoxService}
+    DRIVERS = {"chrome": webdriver.Chrome, "edge": webdriver.Edge, "firefox": webdriver.Firefox}
+
+    def __init__(self, cache=None, shared: bool = True):
+        """
+        Initialize with no running service.
+
+        Args:
+            cache: config.cache to persist driver paths in, or None for this process only
+            shared: False gives every browser its own service (still with cached paths)
+        """
+        self.cache = cache
+        self.shared = shared
+        self.paths: Dict[str, str] = dict(cache.get(self.CACHE_KEY, {})) if cache else {}
+        self.services: Dict[str, object] = {}
+        self.timings = StartupTimings()
+
+    def new_session(self, browser: str, options):
+        """
+        Start a browser on a cached driver binary and, where possible, a running service.
+
+        A session that cannot be created (e.g. a browser update made the
+        cached driver too old) is retried once with a freshly resolved driver.
+
+        Args:
+            browser: chrome, firefox or edge
+            options: Browser options built by DriverFactory
+
+        Returns:
+            WebDriver: New session; its first get() is timed as well
+        """
+        try:
+            driver = self._start(browser, options)
+        except SessionNotCreatedException:
+            self.forget(browser, options)
+            driver = self._start(browser, options)
+        self._time_first_navigation(driver)
+        return driver
+
+    def driver_path(self, browser: str, options) -> str:
+        """
+        Path of the driver binary, resolved by Selenium Manager once per machine.
+
+        Args:
+            browser: chrome, firefox or edge
+            options: Browser options (browser_version selects the driver)
+
+        Returns:
+            str: Driver executable path
+        """
+        key = self._path_key(browser, options)
+        path = self.paths.get(key)
+        if path and os.path.isfile(path):
+            self.timings.path_cache_hits += 1
+            return path
+
+        start = time.perf_counter()
+        path = self._resolve(self.SERVICES[browser](), options)
+        self.timings.add("resolve", time.perf_counter() - start)
+
+        self.paths[key] = path
+        if self.cache is not None:
+            self.cache.set(self.CACHE_KEY, self.paths)
+        return path
+
+    def forget(self, browser: str, options) -> None:
+        """Drop the cached path and the running service of a browser."""
+        self.paths.pop(self._path_key(browser, options), None)
+        if self.cache is not None:
+            self.cache.set(self.CACHE_KEY, self.paths)
+        service = self.services.pop(browser, None)
+        if service is not None:
+            service.stop()
+
+    def shutdown(self) -> None:
+        """Stop every shared service; call after the browsers have quit."""
+        for service in self.services.values():
+            service.stop()
+        self.services.clear()
+
+    def _start(self, browser: str, options):
+        path = self.driver_path(browser, options)
+
+        if not self.shared or browser not in self.SHARED:
+            # Own service, stopped by quit(); spawn and session are one step here
+            start = time.perf_counter()
+            driver = self.DRIVERS[browser](
+                options=options, service=self.SERVICES[browser](executable_path=path)
+            )
+            self.timings.add("session", time.perf_counter() - start)
+            return driver
+
+        service_class, vendor_prefix = self.SHARED[browser]
+        service = self.services.get(browser)
+        if service is None or not service.is_connectable():
+            start = time.perf_counter()
+            service = service_class(executable_path=path)
+            service.start()
+            self.services[browser] = service
+            self.timings.add("service", time.perf_counter() - start)
+        else:
+            self.timings.services_reused += 1
+
+        start = time.perf_counter()
+        executor = ChromiumRemoteConnection(
+            remote_server_addr=service.service_url,
+            vendor_prefix=vendor_prefix,
+            browser_name=options.capabilities["browserName"],
+        )
+        driver = ServiceSession(command_executor=executor, options=options)
+        self.timings.add("session", time.perf_counter() - start)
+        return driver
+
+    def _time_first_navigation(self, driver) -> None:
+        """Time the first get() of a new browser, then restore the plain method."""
+        get = driver.get
+        timings = self.timings
+
+        def first_get(url: str) -> None:
+            del driver.get
+            start = time.perf_counter()
+            try:
+                get(url)
+            finally:
+                timings.add("first_navigation", time.perf_counter() - start)
+
+        driver.get = first_get
+
+    @staticmethod
+    def _path_key(browser: str, options) -> str:
+        return f"{browser}-{options.browser_version or 'stable'}"
+
+    @staticmethod
+    def _resolve(service, options) -> str:
+        """Run Selenium Manager (the API changed in Selenium 4.20)."""
+        try:
+            return DriverFinder(service, options).get_driver_path()
+        except TypeError:
+            return DriverFinder.get_path(service, options)
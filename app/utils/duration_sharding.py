@@ -0,0 +1,58 @@
+# utils/duration_sharding.py
+from typing import Dict, List
+
+
+class DurationSharding:
+    """
+    Orders collected tests by historical duration, longest first.
+
+    xdist hands tests to workers in collection order, so scheduling the
+    slowest cases first (longest-processing-time-first) keeps workers busy
+    until the end of the run instead of leaving one finishing a long
+    checkout while the others sit idle. Durations live in the pytest cache
+    and are updated after every run; without the cache plugin tests keep
+    collection order.
+    """
+
+    CACHE_KEY = "woocommerce/durations"
+
+    def __init__(self, cache):
+        """
+        Initialize from the pytest cache.
+
+        Args:
+            cache: config.cache, or None with -p no:cacheprovider
+        """
+        self.cache = cache
+        self.durations: Dict[str, float] = cache.get(self.CACHE_KEY, {}) if cache else {}
+        self._observed: Dict[str, float] = {}
+        self._default = (
+            sum(self.durations.values()) / len(self.durations)
+            if self.durations else 0.0
+        )
+
+    def order(self, items: List) -> None:
+        """
+        Sort items in place, longest expected duration first.
+
+        Unknown tests get the average duration. Ties keep nodeid order so
+        every xdist worker collects the exact same sequence.
+        """
+        items.sort(
+            key=lambda item: (
+                -self.durations.get(item.nodeid, self._default),
+                item.nodeid,
+            )
+        )
+
+    def pytest_runtest_logreport(self, report):
+        """Remember how long a test took (setup + call + teardown)."""
+        self._observed[report.nodeid] = (
+            self._observed.get(report.nodeid, 0.0) + report.duration
+        )
+
+    def save(self) -> None:
+        """Persist durations observed in this run for the next one."""
+        self.durations.update(self._observed)
+        if self.cache is not None:
+            self.cache.set(self.CACHE_KEY, self.durations)
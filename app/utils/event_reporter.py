@@ -0,0 +1,154 @@
+# utils/event_reporter.py
+import heapq
+import json
+import queue
+import threading
+import time
+from contextlib import ExitStack
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+
+class EventReporter:
+    """
+    Structured test event log written off the test's critical path.
+
+    emit() only builds a dict and puts it on a queue; a background thread
+    serializes events and appends them to a JSON-lines file in batches.
+    Every pytest process (each xdist worker, or the single serial process)
+    writes its own part file, and the controller merges them by timestamp
+    at session end. Values of secret-looking fields are redacted.
+    """
+
+    # The reporter of this process, used by ReportUtils
+    current: Optional["EventReporter"] = None
+
+    SECRET_FIELDS = ("password", "passwd", "secret", "token", "nonce", "cookie")
+    REDACTED = "***"
+
+    _STOP = object()
+
+    def __init__(self, path: str, worker_id: str = "master",
+                 batch_size: int = 200, flush_interval: float = 0.5):
+        """
+        Initialize the reporter.
+
+        Args:
+            path: Part file this process appends to
+            worker_id: xdist worker id, or 'master'
+            batch_size: Maximum events written per batch
+            flush_interval: Seconds an event may wait in memory before it is written
+        """
+        self.path = Path(path)
+        self.worker_id = worker_id
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.test: Optional[str] = None
+        self.written = 0
+        self._queue: "queue.SimpleQueue" = queue.SimpleQueue()
+        self._thread: Optional[threading.Thread] = None
+
+    @staticmethod
+    def part_path(path: str, worker_id: str) -> Path:
+        """Part file of one worker: events.jsonl -> events-gw0.jsonl."""
+        path = Path(path)
+        return path.with_name(f"{path.stem}-{worker_id}{path.suffix}")
+
+    @staticmethod
+    def log(event: str, **fields) -> None:
+        """Emit through the current reporter; does nothing outside a pytest session."""
+        if EventReporter.current is not None:
+            EventReporter.current.emit(event, **fields)
+
+    def emit(self, event: str, **fields) -> None:
+        """Queue an event for the writer thread. Never blocks on I/O."""
+        self._queue.put({
+            "ts": time.time(),
+            "worker": self.worker_id,
+            "test": self.test,
+            "event": event,
+            **self.redact(fields),
+        })
+
+    @staticmethod
+    def redact(fields: Dict[str, Any]) -> Dict[str, Any]:
+        """Replace values of secret-looking fields."""
+        return {
+            name: EventReporter.REDACTED
+            if any(secret in name.lower() for secret in EventReporter.SECRET_FIELDS)
+            else value
+            for name, value in fields.items()
+        }
+
+    def start(self) -> "EventReporter":
+        """Start the background writer."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._thread = threading.Thread(
+            target=self._run, name=f"event-reporter-{self.worker_id}", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def close(self) -> None:
+        """Write every queued event and stop the writer."""
+        if self._thread is None:
+            return
+        self._queue.put(self._STOP)
+        self._thread.join()
+        self._thread = None
+
+    def _run(self) -> None:
+        with open(self.path, "a", encoding="utf-8") as handle:
+            stopping = False
+            while not stopping:
+                batch = self._next_batch()
+                if batch and batch[-1] is self._STOP:
+                    batch.pop()
+                    stopping = True
+                if batch:
+                    handle.write("".join(json.dumps(event, default=str) + "\n" for event in batch))
+                    handle.flush()
+                    self.written += len(batch)
+
+    def _next_batch(self) -> List:
+        """Block until one event arrives, then take whatever else is queued."""
+        try:
+            batch = [self._queue.get(timeout=self.flush_interval)]
+        except queue.Empty:
+            return []
+        while len(batch) < self.batch_size and batch[-1] is not self._STOP:
+            try:
+                batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    @staticmethod
+    def merge(path: str) -> int:
+        """
+        Merge every worker part file of `path` into it, ordered by timestamp.
+
+        Each part is already in timestamp order, so parts are streamed
+        through a k-way merge and deleted afterwards.
+
+        Returns:
+            int: Number of events in the merged file
+        """
+        path = Path(path)
+        parts = sorted(path.parent.glob(f"{path.stem}-*{path.suffix}"))
+        count = 0
+        with ExitStack() as stack, open(path, "w", encoding="utf-8") as out:
+            streams = [stack.enter_context(open(part, encoding="utf-8")) for part in parts]
+            for line in heapq.merge(*streams, key=lambda line: json.loads(line)["ts"]):
+                out.write(line)
+                count += 1
+        for part in parts:
+            part.unlink()
+        return count
+
+    @staticmethod
+    def remove_parts(path: str) -> None:
+        """Delete part files left over from an earlier run."""
+        path = Path(path)
+        for part in path.parent.glob(f"{path.stem}-*{path.suffix}"):
+            part.unlink()
@@ -8,10 +8,28 @@ class Helpers:
     CART_URL = f"{BASE_URL}/cart/"
     CHECKOUT_URL = f"{BASE_URL}/checkout/"
     ACCOUNT_URL = f"{BASE_URL}/my-account/"
+    STORE_API_URL = f"{BASE_URL}/wp-json/wc/store/v1"
 
     USERNAME = "luis.hueso@2.com"
     PASSWORD = "luis.hueso"
 
+    # (username, password) pairs leased one per parallel worker;
+    # override with --accounts-file to run more workers
+    ACCOUNT_POOL = [
+        (USERNAME, PASSWORD),
+    ]
+
     TWO_I_DISCOUNT_COUPON = "2idiscount"
     EDGEWORDS_COUPON = "Edgewords"
 
+    @classmethod
+    def configure(cls, base_url: str):
+        """Point every URL at another deployment (e.g. the local fake shop)."""
+        cls.BASE_URL = base_url.rstrip("/")
+        cls.LOGIN_URL = f"{cls.BASE_URL}/my-account/"
+        cls.SHOP_URL = f"{cls.BASE_URL}/shop/"
+        cls.CART_URL = f"{cls.BASE_URL}/cart/"
+        cls.CHECKOUT_URL = f"{cls.BASE_URL}/checkout/"
+        cls.ACCOUNT_URL = f"{cls.BASE_URL}/my-account/"
+        cls.STORE_API_URL = f"{cls.BASE_URL}/wp-json/wc/store/v1"
+
@@ -0,0 +1,505 @@
+# utils/html_document.py
+import re
+from html.parser import HTMLParser
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+VOID_TAGS = frozenset((
+    "area", "base", "br", "col", "embed", "hr", "img", "input",
+    "link", "meta", "param", "source", "track", "wbr",
+))
+# Never rendered, so never visible and left out of element text
+UNRENDERED_TAGS = frozenset(("head", "script", "style", "template", "noscript", "title"))
+# Text of these starts on a new line, as in a browser's innerText
+BLOCK_TAGS = frozenset((
+    "address", "article", "aside", "blockquote", "br", "dd", "div", "dl", "dt",
+    "fieldset", "footer", "form", "h1", "h2", "h3", "h4", "h5", "h6", "header",
+    "hr", "li", "main", "nav", "ol", "p", "pre", "section", "table", "tbody",
+    "thead", "tfoot", "tr", "ul",
+))
+# An open tag of the same group is closed implicitly, e.g. <li>a<li>b
+IMPLICIT_CLOSE = {
+    "p": {"p"}, "li": {"li"}, "option": {"option"},
+    "tr": {"tr", "td", "th"}, "td": {"td", "th"}, "th": {"td", "th"},
+}
+
+
+class HtmlNode:
+    """An element of a parsed page; text is kept as plain strings among the children."""
+
+    __slots__ = ("tag", "attrs", "children", "parent", "value", "checked")
+
+    def __init__(self, tag: str, attrs: Dict[str, str], parent: Optional["HtmlNode"] = None):
+        self.tag = tag
+        self.attrs = attrs
+        self.children: List = []
+        self.parent = parent
+        # Form state, changed by typing and clicking; None until first changed
+        self.value: Optional[str] = None
+        self.checked: Optional[bool] = None
+
+    @property
+    def classes(self) -> Tuple[str, ...]:
+        """Class names from the class attribute."""
+        return tuple(self.attrs.get("class", "").split())
+
+    def elements(self) -> Iterator["HtmlNode"]:
+        """Descendant elements in document order (not including this one)."""
+        for child in self.children:
+            if isinstance(child, HtmlNode):
+                yield child
+                yield from child.elements()
+
+    def ancestors(self) -> Iterator["HtmlNode"]:
+        """Parent, grandparent, ... up to the document root."""
+        node = self.parent
+        while node is not None:
+            yield node
+            node = node.parent
+
+    def own_text(self) -> str:
+        """Text directly inside this element, like XPath text()."""
+        return "".join(child for child in self.children if isinstance(child, str))
+
+    def text_content(self) -> str:
+        """All text inside this element, like DOM textContent."""
+        return "".join(
+            child if isinstance(child, str) else child.text_content()
+            for child in self.children
+        )
+
+    def rendered_text(self) -> str:
+        """
+        Approximation of innerText: whitespace collapsed, block elements on
+        their own lines, hidden and unrendered content left out.
+        """
+        parts: List[str] = []
+        self._collect_text(parts)
+        lines = (" ".join(line.split()) for line in "".join(parts).split("\n"))
+        return "\n".join(line for line in lines if line)
+
+    def _collect_text(self, parts: List[str]) -> None:
+        for child in self.children:
+            if isinstance(child, str):
+                parts.append(child.replace("\n", " "))
+            elif not child.hides_itself():
+                block = child.tag in BLOCK_TAGS
+                if block:
+                    parts.append("\n")
+                child._collect_text(parts)
+                if block:
+                    parts.append("\n")
+
+    def hides_itself(self) -> bool:
+        """True if this element is not rendered, whatever its ancestors."""
+        if self.tag in UNRENDERED_TAGS or "hidden" in self.attrs:
+            return True
+        if self.tag == "input" and self.attrs.get("type", "").lower() == "hidden":
+            return True
+        style = self.attrs.get("style", "").replace(" ", "").lower()
+        return "display:none" in style or "visibility:hidden" in style
+
+    def is_hidden(self) -> bool:
+        """True if this element or an ancestor is not rendered."""
+        return self.hides_itself() or any(node.hides_itself() for node in self.ancestors())
+
+
+class _TreeBuilder(HTMLParser):
+    """Builds an HtmlNode tree, tolerating the unclosed tags real pages have."""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.root = HtmlNode("#document", {})
+        self.stack = [self.root]
+
+    def handle_starttag(self, tag, attrs):
+        closes = IMPLICIT_CLOSE.get(tag)
+        if closes and self.stack[-1].tag in closes:
+            self.stack.pop()
+        node = HtmlNode(tag, {name: value or "" for name, value in attrs}, self.stack[-1])
+        self.stack[-1].children.append(node)
+        if tag not in VOID_TAGS:
+            self.stack.append(node)
+
+    def handle_startendtag(self, tag, attrs):
+        node = HtmlNode(tag, {name: value or "" for name, value in attrs}, self.stack[-1])
+        self.stack[-1].children.append(node)
+
+    def handle_endtag(self, tag):
+        for depth in range(len(self.stack) - 1, 0, -1):
+            if self.stack[depth].tag == tag:
+                del self.stack[depth:]
+                return
+
+    def handle_data(self, data):
+        self.stack[-1].children.append(data)
+
+
+class HtmlDocument:
+    """
+    A parsed page and the locator strategies of WebDriver over it.
+
+    Supported: id, name, tag name, class name, link text, partial link text,
+    CSS selectors (type, #id, .class and [attr], [attr=v], [attr~|^$*=v]
+    compounds joined by descendant, '>', '+' or '~' combinators, in comma
+    groups) and an XPath subset (child, descendant, parent, ancestor,
+    self and following-sibling axes; @attr, text(), '.', normalize-space(),
+    contains() and starts-with() predicates with and/or/not, and positions).
+    """
+
+    def __init__(self, html: str):
+        builder = _TreeBuilder()
+        builder.feed(html)
+        builder.close()
+        self.root = builder.root
+        self._order: Optional[Dict[int, int]] = None
+
+    @property
+    def title(self) -> str:
+        """Text of the <title> element."""
+        for node in self.root.elements():
+            if node.tag == "title":
+                return " ".join(node.text_content().split())
+        return ""
+
+    def find_all(self, by: str, value: str, scope: Optional[HtmlNode] = None) -> List[HtmlNode]:
+        """
+        Elements matching a locator, in document order.
+
+        Args:
+            by: Selenium By strategy, e.g. 'css selector'
+            value: Locator value
+            scope: Search only below this element (document if None)
+
+        Raises:
+            ValueError: For unsupported strategies or selector syntax
+        """
+        scope = scope or self.root
+        if by == "xpath":
+            # Absolute paths start at the document even when searching from an element
+            start = self.root if value.lstrip().startswith("/") else scope
+            return XPath(value).select(start, self)
+        if by == "css selector":
+            match = CssSelector(value).matches
+        elif by == "id":
+            match = lambda node: node.attrs.get("id") == value
+        elif by == "name":
+            match = lambda node: node.attrs.get("name") == value
+        elif by == "tag name":
+            match = lambda node: node.tag == value.lower()
+        elif by == "class name":
+            match = lambda node: value in node.classes
+        elif by == "link text":
+            match = lambda node: node.tag == "a" and node.rendered_text().strip() == value.strip()
+        elif by == "partial link text":
+            match = lambda node: node.tag == "a" and value in node.rendered_text()
+        else:
+            raise ValueError(f"Unsupported locator strategy: {by}")
+        return [node for node in scope.elements() if match(node)]
+
+    def position(self, node: HtmlNode) -> int:
+        """Index of an element in document order."""
+        if self._order is None:
+            self._order = {id(element): index for index, element in enumerate(self.root.elements())}
+        return self._order.get(id(node), -1)
+
+
+class CssSelector:
+    """Compiled subset of CSS selectors, matched right to left."""
+
+    TOKEN = re.compile(r"""
+        \s*(?P<combinator>[>+~,])\s*
+        | (?P<space>\s+)
+        | (?P<tag>\*|[a-zA-Z][\w-]*)
+        | \#(?P<id>[\w-]+)
+        | \.(?P<cls>[\w-]+)
+        | \[\s*(?P<attr>[\w:-]+)\s*(?:(?P<op>[~|^$*]?=)\s*(?P<val>"[^"]*"|'[^']*'|[^\]\s]+)\s*)?\]
+    """, re.X)
+
+    def __init__(self, selector: str):
+        # Each group: [(combinator to the previous compound, compound), ...]
+        self.groups: List[List[Tuple[str, Callable[[HtmlNode], bool]]]] = []
+        group, combinator, compound = [], " ", []
+        position = 0
+        text = selector.strip()
+
+        def end_compound():
+            nonlocal compound
+            if not compound:
+                raise ValueError(f"Invalid CSS selector: {selector}")
+            group.append((combinator, self._compound(compound)))
+            compound = []
+
+        while position < len(text):
+            token = self.TOKEN.match(text, position)
+            if token is None:
+                raise ValueError(f"Unsupported CSS selector: {selector}")
+            position = token.end()
+            kind = token.lastgroup if token.lastgroup not in ("op", "val") else "attr"
+            if kind in ("combinator", "space"):
+                end_compound()
+                found = token.group("combinator")
+                if found == ",":
+                    self.groups.append(group)
+                    group, combinator = [], " "
+                else:
+                    combinator = found or " "
+            else:
+                compound.append(token)
+        end_compound()
+        self.groups.append(group)
+
+    @staticmethod
+    def _compound(tokens) -> Callable[[HtmlNode], bool]:
+        checks = []
+        for token in tokens:
+            if token.group("tag") and token.group("tag") != "*":
+                tag = token.group("tag").lower()
+                checks.append(lambda node, tag=tag: node.tag == tag)
+            elif token.group("id"):
+                checks.append(lambda node, value=token.group("id"): node.attrs.get("id") == value)
+            elif token.group("cls"):
+                checks.append(lambda node, value=token.group("cls"): value in node.classes)
+            elif token.group("attr"):
+                checks.append(CssSelector._attribute(
+                    token.group("attr").lower(), token.group("op"), (token.group("val") or "").strip("'\"")
+                ))
+        return lambda node: all(check(node) for check in checks)
+
+    @staticmethod
+    def _attribute(name: str, op: Optional[str], value: str) -> Callable[[HtmlNode], bool]:
+        tests = {
+            None: lambda actual: True,
+            "=": lambda actual: actual == value,
+            "~=": lambda actual: value in actual.split(),
+            "|=": lambda actual: actual == value or actual.startswith(value + "-"),
+            "^=": lambda actual: bool(value) and actual.startswith(value),
+            "$=": lambda actual: bool(value) and actual.endswith(value),
+            "*=": lambda actual: bool(value) and value in actual,
+        }
+        test = tests[op]
+        return lambda node: name in node.attrs and test(node.attrs[name])
+
+    def matches(self, node: HtmlNode) -> bool:
+        """True if the element matches any selector group."""
+        return any(self._match_from(group, len(group) - 1, node) for group in self.groups)
+
+    def _match_from(self, group, index: int, node: HtmlNode) -> bool:
+        combinator, compound = group[index]
+        if not compound(node):
+            return False
+        if index == 0:
+            return True
+        if combinator == ">":
+            parent = node.parent
+            return parent is not None and parent.tag != "#document" and self._match_from(group, index - 1, parent)
+        if combinator == " ":
+            return any(
+                self._match_from(group, index - 1, ancestor)
+                for ancestor in node.ancestors() if ancestor.tag != "#document"
+            )
+        siblings = self._preceding_siblings(node)
+        if combinator == "+":
+            return bool(siblings) and self._match_from(group, index - 1, siblings[-1])
+        return any(self._match_from(group, index - 1, sibling) for sibling in siblings)
+
+    @staticmethod
+    def _preceding_siblings(node: HtmlNode) -> List[HtmlNode]:
+        if node.parent is None:
+            return []
+        siblings = [child for child in node.parent.children if isinstance(child, HtmlNode)]
+        return siblings[:siblings.index(node)]
+
+
+class XPath:
+    """Compiled subset of XPath 1.0 location paths."""
+
+    TOKEN = re.compile(r"""
+        \s*(?:
+          (?P<string>"[^"]*"|'[^']*')
+        | (?P<number>\d+)
+        | (?P<op>//|/|::|\[|\]|\(|\)|=|!=|,|@|\.\.|\.|\*)
+        | (?P<name>[a-zA-Z_][\w.-]*(?:-[\w]+)*)
+        )\s*
+    """, re.X)
+
+    AXES = ("child", "descendant", "descendant-or-self", "parent", "ancestor",
+            "ancestor-or-self", "self", "following-sibling")
+
+    def __init__(self, expression: str):
+        self.expression = expression
+        self.tokens: List[Tuple[str, str]] = []
+        position = 0
+        while position < len(expression):
+            token = self.TOKEN.match(expression, position)
+            if token is None or token.end() == position:
+                raise ValueError(f"Unsupported XPath: {expression}")
+            position = token.end()
+            self.tokens.append((token.lastgroup, token.group(token.lastgroup)))
+        self.index = 0
+        self.steps = self._path()
+        if self.index != len(self.tokens):
+            raise ValueError(f"Unsupported XPath: {expression}")
+
+    # Parsing
+
+    def _peek(self, offset: int = 0) -> Optional[str]:
+        index = self.index + offset
+        return self.tokens[index][1] if index < len(self.tokens) else None
+
+    def _take(self, expected: Optional[str] = None) -> str:
+        if self.index >= len(self.tokens):
+            raise ValueError(f"Unsupported XPath: {self.expression}")
+        value = self.tokens[self.index][1]
+        if expected is not None and value != expected:
+            raise ValueError(f"Unsupported XPath: {self.expression}")
+        self.index += 1
+        return value
+
+    def _path(self):
+        steps = []
+        if self._peek() not in ("/", "//"):
+            steps.append(self._step("child"))
+        while self._peek() in ("/", "//"):
+            separator = self._take()
+            steps.append(self._step("descendant" if separator == "//" else "child"))
+        return steps
+
+    def _step(self, default_axis: str):
+        if self._peek() == "..":
+            self._take()
+            return ("parent" if default_axis == "child" else "ancestor", "*", [])
+        if self._peek() == ".":
+            self._take()
+            return ("self" if default_axis == "child" else "descendant-or-self", "*", [])
+        axis = default_axis
+        if self._peek(1) == "::":
+            name = self._take()
+            self._take("::")
+            if name not in self.AXES:
+                raise ValueError(f"Unsupported XPath axis: {name}")
+            axis = name if default_axis == "child" else {
+                "child": "descendant", "self": "descendant-or-self",
+            }.get(name, name)
+        test = self._take()
+        predicates = []
+        while self._peek() == "[":
+            self._take("[")
+            predicates.append(self._expression())
+            self._take("]")
+        return (axis, test.lower(), predicates)
+
+    def _expression(self):
+        left = self._and()
+        while self._peek() == "or":
+            self._take()
+            right = self._and()
+            left = (lambda l, r: lambda node: l(node) or r(node))(left, right)
+        return left
+
+    def _and(self):
+        left = self._condition()
+        while self._peek() == "and":
+            self._take()
+            right = self._condition()
+            left = (lambda l, r: lambda node: l(node) and r(node))(left, right)
+        return left
+
+    def _condition(self):
+        kind, value = self.tokens[self.index] if self.index < len(self.tokens) else (None, None)
+        if kind == "number":
+            self._take()
+            return int(value)
+        if value == "(":
+            self._take()
+            inner = self._expression()
+            self._take(")")
+            return inner
+        if value == "not" and self._peek(1) == "(":
+            self._take()
+            self._take("(")
+            inner = self._expression()
+            self._take(")")
+            return lambda node: not inner(node)
+        if value in ("contains", "starts-with") and self._peek(1) == "(":
+            self._take()
+            self._take("(")
+            operand = self._operand()
+            self._take(",")
+            literal = self._literal()
+            self._take(")")
+            if value == "contains":
+                return lambda node: (operand(node) or "").find(literal) >= 0
+            return lambda node: (operand(node) or "").startswith(literal)
+
+        operand = self._operand()
+        if self._peek() in ("=", "!="):
+            negate = self._take() == "!="
+            literal = self._literal()
+            return lambda node: (operand(node) == literal) != negate
+        return lambda node: operand(node) is not None
+
+    def _operand(self):
+        value = self._take()
+        if value == "@":
+            name = self._take().lower()
+            return lambda node: node.attrs.get(name)
+        if value == ".":
+            return lambda node: node.text_content()
+        if value in ("text", "normalize-space") and self._peek() == "(":
+            self._take("(")
+            if self._peek() == ".":
+                self._take()
+            self._take(")")
+            if value == "text":
+                return lambda node: node.own_text() if node.own_text() else None
+            return lambda node: " ".join(node.text_content().split())
+        raise ValueError(f"Unsupported XPath: {self.expression}")
+
+    def _literal(self) -> str:
+        kind, value = self.tokens[self.index]
+        self._take()
+        if kind != "string":
+            raise ValueError(f"Unsupported XPath: {self.expression}")
+        return value[1:-1]
+
+    # Evaluation
+
+    def select(self, scope: HtmlNode, document: HtmlDocument) -> List[HtmlNode]:
+        """Elements selected from the scope element, in document order."""
+        context = [scope]
+        for axis, test, predicates in self.steps:
+            selected: Dict[int, HtmlNode] = {}
+            for node in context:
+                candidates = [
+                    candidate for candidate in self._axis(node, axis)
+                    if test == "*" or candidate.tag == test
+                ]
+                for predicate in predicates:
+                    if isinstance(predicate, int):
+                        candidates = candidates[predicate - 1:predicate]
+                    else:
+                        candidates = [candidate for candidate in candidates if predicate(candidate)]
+                for candidate in candidates:
+                    selected[id(candidate)] = candidate
+            context = sorted(selected.values(), key=document.position)
+        return [node for node in context if node.tag != "#document"]
+
+    @staticmethod
+    def _axis(node: HtmlNode, axis: str) -> List[HtmlNode]:
+        if axis == "child":
+            return [child for child in node.children if isinstance(child, HtmlNode)]
+        if axis == "descendant":
+            return list(node.elements())
+        if axis == "descendant-or-self":
+            return [node, *node.elements()]
+        if axis == "self":
+            return [node]
+        if axis == "parent":
+            return [node.parent] if node.parent is not None else []
+        if axis == "ancestor":
+            return list(node.ancestors())[::-1]
+        if axis == "ancestor-or-self":
+            return [*list(node.ancestors())[::-1], node]
+        siblings = CssSelector._preceding_siblings(node)
+        following = [child for child in node.parent.children if isinstance(child, HtmlNode)] if node.parent else []
+        return following[len(siblings) + 1:]
@@ -0,0 +1,543 @@
+# utils/http_driver.py
+import time
+import uuid
+from typing import List, Optional, Tuple
+from urllib.parse import urlencode, urljoin, urlsplit, urlunsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.cookies import create_cookie
+from selenium.common.exceptions import (
+    ElementNotInteractableException,
+    InvalidSelectorException,
+    JavascriptException,
+    NoAlertPresentException,
+    NoSuchElementException,
+    NoSuchFrameException,
+    StaleElementReferenceException,
+)
+from selenium.webdriver.common.timeouts import Timeouts
+
+from app.utils.html_document import HtmlDocument, HtmlNode
+
+# Selenium Keys that act on a field; the other special keys are dropped
+ENTER_KEYS = ("\ue006", "\ue007")  # Keys.RETURN, Keys.ENTER
+SPECIAL_KEYS = range(0xE000, 0xF900)
+
+SUBMIT_TYPES = ("submit", "image")
+BUTTON_TYPES = ("submit", "image", "button", "reset")
+
+
+class HttpElement:
+    """
+    WebElement look-alike for an element of an HttpDriver page.
+
+    Elements of a page that was navigated away from raise
+    StaleElementReferenceException, as in a browser.
+    """
+
+    def __init__(self, driver: "HttpDriver", node: HtmlNode, page: int):
+        self._parent = driver
+        self._node = node
+        self._page = page
+
+    @property
+    def parent(self) -> "HttpDriver":
+        """Driver the element belongs to."""
+        return self._parent
+
+    @property
+    def id(self) -> str:
+        """Identifier of the element within its page."""
+        return f"{self._page}-{id(self._node)}"
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, HttpElement) and other._node is self._node
+
+    def __hash__(self) -> int:
+        return hash(id(self._node))
+
+    @property
+    def tag_name(self) -> str:
+        """Element tag name."""
+        return self._current()._node.tag
+
+    @property
+    def text(self) -> str:
+        """Visible text, empty for hidden elements."""
+        node = self._current()._node
+        return "" if node.is_hidden() else node.rendered_text()
+
+    def get_attribute(self, name: str) -> Optional[str]:
+        """Attribute or current property value, resolved like Selenium's getAttribute."""
+        node = self._current()._node
+        if name == "value":
+            return self._value()
+        if name in ("checked", "selected"):
+            return "true" if self._checked() else None
+        if name in ("href", "src", "action") and name in node.attrs:
+            return urljoin(self._parent.current_url, node.attrs[name])
+        if name in ("textContent", "innerText"):
+            return node.text_content() if name == "textContent" else node.rendered_text()
+        return node.attrs.get(name)
+
+    def get_dom_attribute(self, name: str) -> Optional[str]:
+        """Attribute exactly as written in the HTML."""
+        return self._current()._node.attrs.get(name)
+
+    def get_property(self, name: str):
+        """Current value/checked state, or the attribute for other names."""
+        if name == "checked":
+            return self._checked()
+        return self.get_attribute(name)
+
+    def value_of_css_property(self, name: str) -> str:
+        """No stylesheet is applied; always empty."""
+        return ""
+
+    def is_displayed(self) -> bool:
+        """False for elements hidden by attribute, inline style, type=hidden or <head>."""
+        return not self._current()._node.is_hidden()
+
+    def is_enabled(self) -> bool:
+        """False for disabled controls and controls in a disabled fieldset."""
+        node = self._current()._node
+        if "disabled" in node.attrs:
+            return False
+        return not any(
+            ancestor.tag == "fieldset" and "disabled" in ancestor.attrs
+            for ancestor in node.ancestors()
+        )
+
+    def is_selected(self) -> bool:
+        """Checked state of a checkbox/radio, or selected state of an option."""
+        return self._checked()
+
+    def click(self) -> None:
+        """
+        Follow a link, submit a form, toggle a checkbox/radio or click a label's control.
+
+        Anything else is ignored - there is no JavaScript to run a handler.
+        """
+        node = self._current()._node
+        if not self.is_displayed() or not self.is_enabled():
+            raise ElementNotInteractableException(f"Element <{node.tag}> is not interactable")
+
+        control_type = node.attrs.get("type", "submit" if node.tag == "button" else "text").lower()
+        if node.tag == "a":
+            href = node.attrs.get("href", "")
+            if href and not href.startswith(("#", "javascript:")):
+                self._parent.open(urljoin(self._parent.current_url, href))
+        elif node.tag in ("button", "input") and control_type in SUBMIT_TYPES:
+            form = self._form()
+            if form is not None:
+                self._parent.submit_form(form, node)
+        elif node.tag == "input" and control_type == "checkbox":
+            node.checked = not self._checked()
+        elif node.tag == "input" and control_type == "radio":
+            self._check_radio(node)
+        elif node.tag == "option":
+            self._select_option(node)
+        elif node.tag == "label":
+            control = self._labelled_control(node)
+            if control is not None:
+                HttpElement(self._parent, control, self._page).click()
+
+    def clear(self) -> None:
+        """Empty a text field."""
+        self._current()._node.value = ""
+
+    def send_keys(self, *value) -> None:
+        """Type into a field; Enter submits its form."""
+        node = self._current()._node
+        typed = "".join(str(part) for part in value)
+        text = "".join(char for char in typed if ord(char) not in SPECIAL_KEYS)
+        node.value = self._value() + text
+        if any(key in typed for key in ENTER_KEYS):
+            self.submit()
+
+    def submit(self) -> None:
+        """Submit the element's form."""
+        form = self._current()._form()
+        if form is None:
+            raise NoSuchElementException("Element is not in a form")
+        self._parent.submit_form(form)
+
+    def find_element(self, by: str = "id", value: Optional[str] = None) -> "HttpElement":
+        """Find the first matching descendant."""
+        return self._parent._find(by, value, self._current()._node, first=True)[0]
+
+    def find_elements(self, by: str = "id", value: Optional[str] = None) -> List["HttpElement"]:
+        """Find every matching descendant."""
+        return self._parent._find(by, value, self._current()._node)
+
+    def _current(self) -> "HttpElement":
+        if self._page != self._parent.page:
+            raise StaleElementReferenceException("Element is from a page no longer open")
+        return self
+
+    def _value(self) -> str:
+        node = self._node
+        if node.value is not None:
+            return node.value
+        if node.tag == "textarea":
+            return node.text_content()
+        if node.tag == "select":
+            option = HttpDriver.selected_option(node)
+            return HttpDriver.option_value(option) if option is not None else ""
+        if node.tag == "option":
+            return HttpDriver.option_value(node)
+        return node.attrs.get("value", "")
+
+    def _checked(self) -> bool:
+        node = self._node
+        if node.checked is not None:
+            return node.checked
+        return "checked" in node.attrs or "selected" in node.attrs
+
+    def _form(self) -> Optional[HtmlNode]:
+        form_id = self._node.attrs.get("form")
+        if form_id:
+            matches = self._parent.document.find_all("id", form_id)
+            return matches[0] if matches else None
+        return next((node for node in self._node.ancestors() if node.tag == "form"), None)
+
+    def _check_radio(self, node: HtmlNode) -> None:
+        name = node.attrs.get("name")
+        form = self._form()
+        group = form if form is not None else self._parent.document.root
+        for other in group.elements():
+            if other.tag == "input" and other.attrs.get("type", "").lower() == "radio" \
+                    and other.attrs.get("name") == name:
+                other.checked = other is node
+
+    def _select_option(self, node: HtmlNode) -> None:
+        select = next((parent for parent in node.ancestors() if parent.tag == "select"), None)
+        if select is None:
+            return
+        for option in select.elements():
+            if option.tag == "option":
+                option.checked = option is node
+        select.value = HttpDriver.option_value(node)
+
+    def _labelled_control(self, label: HtmlNode) -> Optional[HtmlNode]:
+        target = label.attrs.get("for")
+        if target:
+            matches = self._parent.document.find_all("id", target)
+            return matches[0] if matches else None
+        return next(
+            (node for node in label.elements() if node.tag in ("input", "select", "textarea", "button")),
+            None,
+        )
+
+
+class _HttpSwitchTo:
+    """switch_to for a driver with one window, no frames and no alerts."""
+
+    def __init__(self, driver: "HttpDriver"):
+        self._driver = driver
+
+    def window(self, window_name: str) -> None:
+        """Only the single window exists."""
+
+    def default_content(self) -> None:
+        """Already on the top-level page."""
+
+    def parent_frame(self) -> None:
+        """Already on the top-level page."""
+
+    def frame(self, frame_reference) -> None:
+        """Frames are not loaded."""
+        raise NoSuchFrameException("HttpDriver does not load frames")
+
+    @property
+    def alert(self):
+        """There is no JavaScript to raise an alert."""
+        raise NoAlertPresentException("HttpDriver has no alerts")
+
+
+class HttpDriver:
+    """
+    Browserless WebDriver for flows that only need server-rendered HTML.
+
+    Implements the part of the WebDriver API the POMs use on top of a
+    pooled requests.Session and a stdlib HTML parser: get, find_element(s)
+    (id, name, CSS, link text, XPath subset - see HtmlDocument), element
+    text/attributes, clicks on links, submit buttons, checkboxes, radios
+    and labels, send_keys into form fields, and cookies. There is no
+    JavaScript, layout or CSS: is_displayed() only sees hidden attributes,
+    inline styles and hidden inputs. execute_script runs the Python
+    equivalent a PageScript declares and raises for any other script.
+    Forms are always posted url-encoded.
+
+    Every HTTP request goes through execute(), so Instrumentation counts
+    requests as commands.
+    """
+
+    name = "http"
+    HANDLE = "http-window"
+
+    def __init__(self, timeout: float = 30):
+        """
+        Start a driver with an empty cookie jar and no page.
+
+        Args:
+            timeout: Seconds before an HTTP request fails
+        """
+        self.timeout = timeout
+        self.script_timeout = 30
+        self.session_id = uuid.uuid4().hex
+        self.capabilities = {"browserName": "http", "javascriptEnabled": False}
+        self.http = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=10, max_retries=2)
+        self.http.mount("http://", adapter)
+        self.http.mount("https://", adapter)
+
+        self.current_url = "about:blank"
+        self.page_source = ""
+        self.document = HtmlDocument("")
+        # Incremented on every page load; elements of older pages are stale
+        self.page = 0
+        self.history: List[str] = []
+        self._switch_to = _HttpSwitchTo(self)
+
+    # Navigation
+
+    def execute(self, driver_command: str, params: Optional[dict] = None) -> dict:
+        """
+        Send one HTTP request and load the response as the current page.
+
+        Args:
+            driver_command: HTTP method, 'get' or 'post'
+            params: {'url': ..., 'data': form fields for POST}
+
+        Returns:
+            dict: {'value': requests.Response}
+        """
+        params = params or {}
+        response = self.http.request(
+            driver_command.upper(), params["url"], data=params.get("data"), timeout=self.timeout
+        )
+        self._load(response)
+        return {"value": response}
+
+    def open(self, url: str, method: str = "get", data: Optional[List[Tuple[str, str]]] = None) -> None:
+        """Request a page and make it the current one (redirects are followed)."""
+        self.execute(method, {"url": url, "data": data})
+
+    def get(self, url: str) -> None:
+        """Navigate to a URL."""
+        self.open(url)
+
+    def back(self) -> None:
+        """Reload the previous page of the history."""
+        if len(self.history) > 1:
+            self.history.pop()
+            self.open(self.history.pop())
+
+    def refresh(self) -> None:
+        """Request the current page again."""
+        if self.history:
+            self.open(self.history.pop())
+
+    def submit_form(self, form: HtmlNode, submitter: Optional[HtmlNode] = None) -> None:
+        """
+        Submit a form the way a browser does without JavaScript.
+
+        Args:
+            form: <form> element of the current page
+            submitter: Button that submitted it; its name/value is sent too
+        """
+        fields = self.form_fields(form, submitter)
+        action = urljoin(self.current_url, form.attrs.get("action") or self.current_url)
+        if form.attrs.get("method", "get").lower() == "post":
+            self.open(action, "post", fields)
+            return
+        scheme, netloc, path, _, _ = urlsplit(action)
+        self.open(urlunsplit((scheme, netloc, path, urlencode(fields), "")))
+
+    @staticmethod
+    def form_fields(form: HtmlNode, submitter: Optional[HtmlNode] = None) -> List[Tuple[str, str]]:
+        """Name/value pairs a browser would send for a form."""
+        fields = []
+        for node in form.elements():
+            name = node.attrs.get("name")
+            if not name or "disabled" in node.attrs:
+                continue
+            if node.tag == "button" or (
+                node.tag == "input" and node.attrs.get("type", "").lower() in BUTTON_TYPES
+            ):
+                if node is submitter:
+                    fields.append((name, node.attrs.get("value", "")))
+            elif node.tag == "input":
+                control_type = node.attrs.get("type", "text").lower()
+                if control_type in ("checkbox", "radio"):
+                    checked = node.checked if node.checked is not None else "checked" in node.attrs
+                    if checked:
+                        fields.append((name, node.attrs.get("value", "on")))
+                elif control_type != "file":
+                    fields.append((name, node.value if node.value is not None else node.attrs.get("value", "")))
+            elif node.tag == "textarea":
+                fields.append((name, node.value if node.value is not None else node.text_content()))
+            elif node.tag == "select":
+                option = HttpDriver.selected_option(node)
+                if option is not None:
+                    fields.append((name, HttpDriver.option_value(option)))
+        return fields
+
+    @staticmethod
+    def selected_option(select: HtmlNode) -> Optional[HtmlNode]:
+        """Selected <option> of a <select>: the chosen one, else the first."""
+        options = [node for node in select.elements() if node.tag == "option"]
+        chosen = [
+            option for option in options
+            if (option.checked if option.checked is not None else "selected" in option.attrs)
+        ]
+        return (chosen or options or [None])[0]
+
+    @staticmethod
+    def option_value(option: HtmlNode) -> str:
+        """Value an <option> submits."""
+        return option.attrs.get("value", " ".join(option.text_content().split()))
+
+    def _load(self, response) -> None:
+        self.current_url = response.url
+        self.page_source = response.text
+        self.document = HtmlDocument(response.text)
+        self.page += 1
+        self.history.append(response.url)
+
+    # Elements
+
+    @property
+    def title(self) -> str:
+        """Title of the current page."""
+        return self.document.title
+
+    def find_element(self, by: str = "id", value: Optional[str] = None) -> HttpElement:
+        """Find the first matching element of the current page."""
+        return self._find(by, value, None, first=True)[0]
+
+    def find_elements(self, by: str = "id", value: Optional[str] = None) -> List[HttpElement]:
+        """Find every matching element of the current page."""
+        return self._find(by, value, None)
+
+    def _find(self, by: str, value: Optional[str], scope: Optional[HtmlNode],
+              first: bool = False) -> List[HttpElement]:
+        try:
+            nodes = self.document.find_all(by, value or "", scope)
+        except ValueError as error:
+            raise InvalidSelectorException(str(error)) from error
+        if first and not nodes:
+            raise NoSuchElementException(f"Unable to locate element: {by}={value}")
+        return [HttpElement(self, node, self.page) for node in nodes]
+
+    # Cookies
+
+    def get_cookies(self) -> List[dict]:
+        """Cookies of the session as WebDriver cookie dicts."""
+        cookies = []
+        for cookie in self.http.cookies:
+            entry = {
+                "name": cookie.name,
+                "value": cookie.value,
+                "domain": cookie.domain,
+                "path": cookie.path,
+                "secure": bool(cookie.secure),
+                "httpOnly": cookie.has_nonstandard_attr("HttpOnly"),
+            }
+            if cookie.expires:
+                entry["expiry"] = cookie.expires
+            cookies.append(entry)
+        return cookies
+
+    def get_cookie(self, name: str) -> Optional[dict]:
+        """A cookie by name, or None."""
+        return next((cookie for cookie in self.get_cookies() if cookie["name"] == name), None)
+
+    def add_cookie(self, cookie_dict: dict) -> None:
+        """Add a WebDriver cookie dict; the domain defaults to the current page's host."""
+        expiry = cookie_dict.get("expiry")
+        if expiry is not None and expiry < time.time():
+            return
+        self.http.cookies.set_cookie(create_cookie(
+            cookie_dict["name"],
+            cookie_dict["value"],
+            domain=cookie_dict.get("domain") or urlsplit(self.current_url).hostname or "",
+            path=cookie_dict.get("path", "/"),
+            secure=cookie_dict.get("secure", False),
+            expires=expiry,
+            rest={"HttpOnly": None} if cookie_dict.get("httpOnly") else {},
+        ))
+
+    def delete_cookie(self, name: str) -> None:
+        """Delete a cookie by name on every domain and path."""
+        for cookie in [cookie for cookie in self.http.cookies if cookie.name == name]:
+            self.http.cookies.clear(cookie.domain, cookie.path, cookie.name)
+
+    def delete_all_cookies(self) -> None:
+        """Empty the cookie jar."""
+        self.http.cookies.clear()
+
+    # Browser-only commands
+
+    def execute_script(self, script: str, *args):
+        """
+        Run a PageScript's Python equivalent on the current page.
+
+        Raises:
+            JavascriptException: If the script declares no equivalent
+        """
+        equivalent = getattr(script, "http", None)
+        if equivalent is None:
+            raise JavascriptException("HttpDriver does not run JavaScript; no equivalent for this script")
+        return equivalent(self, *args)
+
+    def execute_async_script(self, script: str, *args):
+        """Same as execute_script; equivalents return the value the script passes to its callback."""
+        return self.execute_script(script, *args)
+
+    @property
+    def switch_to(self) -> _HttpSwitchTo:
+        """Single window, no frames, no alerts."""
+        return self._switch_to
+
+    @property
+    def window_handles(self) -> List[str]:
+        """The single window."""
+        return [self.HANDLE]
+
+    @property
+    def current_window_handle(self) -> str:
+        """The single window."""
+        return self.HANDLE
+
+    def implicitly_wait(self, time_to_wait: float) -> None:
+        """Pages are complete when loaded; nothing to wait for."""
+
+    @property
+    def timeouts(self) -> Timeouts:
+        """Current timeouts; page_load is the HTTP request timeout."""
+        return Timeouts(implicit_wait=0, page_load=self.timeout, script=self.script_timeout)
+
+    def set_script_timeout(self, time_to_wait: float) -> None:
+        """Recorded for timeouts; script equivalents run synchronously."""
+        self.script_timeout = time_to_wait
+
+    def set_page_load_timeout(self, time_to_wait: float) -> None:
+        """Sets the HTTP request timeout."""
+        self.timeout = time_to_wait
+
+    def set_window_size(self, width: int, height: int, windowHandle: str = "current") -> None:
+        """No window to size."""
+
+    def maximize_window(self) -> None:
+        """No window to size."""
+
+    def close(self) -> None:
+        """Close the HTTP session."""
+        self.http.close()
+
+    def quit(self) -> None:
+        """Close the HTTP session."""
+        self.http.close()
@@ -0,0 +1,146 @@
+# utils/instrumentation.py
+import csv
+import functools
+import inspect
+import json
+import time
+from collections import Counter
+from dataclasses import asdict, dataclass
+from typing import Dict, List
+
+from app.utils.waiter import Waiter
+
+
+@dataclass
+class StepRecord:
+    """Aggregated timings for one Steps method across the session."""
+    name: str
+    calls: int = 0
+    wall_seconds: float = 0.0
+    max_seconds: float = 0.0
+    commands: int = 0
+    wait_seconds: float = 0.0
+
+    def add(self, seconds: float, commands: int, wait_seconds: float) -> None:
+        """Add one execution of the step."""
+        self.calls += 1
+        self.wall_seconds += seconds
+        self.max_seconds = max(self.max_seconds, seconds)
+        self.commands += commands
+        self.wait_seconds += wait_seconds
+
+    def merge(self, other: "StepRecord") -> None:
+        """Fold another worker's record for the same step into this one."""
+        self.calls += other.calls
+        self.wall_seconds += other.wall_seconds
+        self.max_seconds = max(self.max_seconds, other.max_seconds)
+        self.commands += other.commands
+        self.wait_seconds += other.wait_seconds
+
+
+class Instrumentation:
+    """
+    Records wall time, WebDriver command count and wait time per step.
+
+    Steps classes opt in with the @instrumented decorator; drivers are
+    attached once at creation so every WebDriver command - including
+    WebElement calls, which go through the parent driver - is counted.
+    Figures are inclusive: a step calling another step includes its cost.
+    """
+
+    commands = 0
+    command_counts: Counter = Counter()
+    records: Dict[str, StepRecord] = {}
+
+    @classmethod
+    def attach(cls, driver) -> None:
+        """Count every command sent through driver.execute."""
+        if getattr(driver, "_instrumented", False):
+            return
+
+        execute = driver.execute
+
+        def counted_execute(driver_command, params=None):
+            cls.commands += 1
+            cls.command_counts[driver_command] += 1
+            return execute(driver_command, params)
+
+        driver.execute = counted_execute
+        driver._instrumented = True
+
+    @classmethod
+    def record(cls, name: str, seconds: float, commands: int, wait_seconds: float) -> None:
+        """Add one step execution."""
+        record = cls.records.get(name)
+        if record is None:
+            record = cls.records[name] = StepRecord(name)
+        record.add(seconds, commands, wait_seconds)
+
+    @classmethod
+    def to_dicts(cls) -> List[dict]:
+        """Records as plain dicts, slowest total first."""
+        records = sorted(cls.records.values(), key=lambda r: r.wall_seconds, reverse=True)
+        return [asdict(record) for record in records]
+
+    @classmethod
+    def merge_dicts(cls, rows: List[dict]) -> None:
+        """Merge records exported by another worker."""
+        for row in rows:
+            incoming = StepRecord(**row)
+            record = cls.records.get(incoming.name)
+            if record is None:
+                cls.records[incoming.name] = incoming
+            else:
+                record.merge(incoming)
+
+    @classmethod
+    def export(cls, path: str) -> None:
+        """Write records as CSV if the path ends in .csv, JSON otherwise."""
+        rows = cls.to_dicts()
+        if path.endswith(".csv"):
+            with open(path, "w", newline="", encoding="utf-8") as handle:
+                writer = csv.DictWriter(handle, fieldnames=list(StepRecord.__dataclass_fields__))
+                writer.writeheader()
+                writer.writerows(rows)
+        else:
+            with open(path, "w", encoding="utf-8") as handle:
+                json.dump({"steps": rows, "commands": dict(cls.command_counts)}, handle, indent=2)
+
+    @classmethod
+    def summary_lines(cls, limit: int = 10) -> List[str]:
+        """Format the slowest steps for the pytest terminal summary."""
+        lines = [f"{'step':<50} {'calls':>5} {'total s':>8} {'max s':>7} {'cmds':>6} {'wait s':>7}"]
+        for row in cls.to_dicts()[:limit]:
+            lines.append(
+                f"{row['name']:<50} {row['calls']:>5} {row['wall_seconds']:>8.2f} "
+                f"{row['max_seconds']:>7.2f} {row['commands']:>6} {row['wait_seconds']:>7.2f}"
+            )
+        return lines
+
+
+def instrumented(cls):
+    """Class decorator timing every public method of a Steps class."""
+    for attr, func in list(vars(cls).items()):
+        if attr.startswith("_") or not inspect.isfunction(func):
+            continue
+        setattr(cls, attr, _timed(f"{cls.__name__}.{attr}", func))
+    return cls
+
+
+def _timed(name: str, func):
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        commands = Instrumentation.commands
+        waited = Waiter.stats.total_wait
+        try:
+            return func(*args, **kwargs)
+        finally:
+            Instrumentation.record(
+                name,
+                time.perf_counter() - start,
+                Instrumentation.commands - commands,
+                Waiter.stats.total_wait - waited,
+            )
+
+    return wrapper
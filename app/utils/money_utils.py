@@ -1,43 +1,135 @@
 # utils/money_utils.py
 from decimal import Decimal, ROUND_HALF_UP
+from typing import Iterable, List, Optional
 import re
 
 
 class MoneyUtils:
     """Utility class for monetary calculations."""
 
+    CENT = Decimal('0.01')
+    ZERO = Decimal('0.00')
+    HUNDRED = Decimal(100)
+
+    # The last number in the text (digits with optional thousands/decimal
+    # separators, e.g. 1,234.56 or 1.234,56) and a minus sign before it,
+    # allowing a currency symbol in between
+    AMOUNT_PATTERN = re.compile(
+        r"(?:([-−])\s*[^\d\s]{0,3}\s*)?(\d[\d.,  ' ]*\d|\d)(?!.*\d)", re.S
+    )
+    # A number that Decimal reads as is, e.g. 33.95
+    PLAIN_NUMBER = re.compile(r"\d+(?:\.\d+)?")
+    GROUPING_CHARS = re.compile(r"[  ' ]")
+
     @staticmethod
-    def parse(text: str) -> Decimal:
-        """Parse strings like '£33.95', '-£4.50', 'Total: £12.00'"""
+    def parse(text: str, decimal_sep: Optional[str] = None) -> Decimal:
+        """
+        Parse strings like '£33.95', '-£4.50', 'Total: £12.00', '£1,234.56'.
+
+        Args:
+            text: Text containing an amount; the last number in it is used
+            decimal_sep: '.' or ',' to force the decimal separator; by
+                default it is inferred from the number itself
+
+        Returns:
+            Decimal: Amount rounded to 2 places (0.00 if no number found)
+        """
         if not text:
-            return Decimal('0.00')
+            return MoneyUtils.ZERO
+        return MoneyUtils._parse_one(text, decimal_sep)
+
+    @staticmethod
+    def parse_many(texts: Iterable[str], decimal_sep: Optional[str] = None) -> List[Decimal]:
+        """
+        Parse a whole column of amounts in one pass.
+
+        Price columns repeat the same strings heavily (unit prices, shipping),
+        so each distinct string is parsed once and reused.
+
+        Args:
+            texts: Amount strings, e.g. every line total of a cart table
+            decimal_sep: See parse()
+
+        Returns:
+            List[Decimal]: Parsed amounts in input order
+        """
+        seen = {}
+        parse_one = MoneyUtils._parse_one
+        result = []
+        append = result.append
+        for text in texts:
+            value = seen.get(text)
+            if value is None:
+                value = parse_one(text, decimal_sep) if text else MoneyUtils.ZERO
+                seen[text] = value
+            append(value)
+        return result
 
-        # Remove non-numeric characters except decimal point, minus, and comma
-        cleaned = re.sub(r'[^0-9.,-]', '', text)
-        cleaned = cleaned.replace(',', '.')
+    @staticmethod
+    def _parse_one(text: str, decimal_sep: Optional[str]) -> Decimal:
+        match = MoneyUtils.AMOUNT_PATTERN.search(text)
+        if match is None:
+            return MoneyUtils.ZERO
+
+        sign, number = match.groups()
+        if decimal_sep == "," or MoneyUtils.PLAIN_NUMBER.fullmatch(number) is None:
+            number = MoneyUtils._normalize(MoneyUtils.GROUPING_CHARS.sub("", number), decimal_sep)
+        if sign:
+            number = "-" + number
 
-        if not cleaned:
-            return Decimal('0.00')
+        return Decimal(number).quantize(MoneyUtils.CENT, rounding=ROUND_HALF_UP)
 
-        # Get last numeric token
-        parts = cleaned.strip().split()
-        candidate = parts[-1] if parts else cleaned
+    @staticmethod
+    def _normalize(token: str, decimal_sep: Optional[str]) -> str:
+        """Turn '1,234.56' / '1.234,56' / '12,50' into '1234.56' / '1234.56' / '12.50'."""
+        if decimal_sep is None:
+            decimal_sep = MoneyUtils._infer_decimal_sep(token)
 
-        return Decimal(candidate).quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
+        if decimal_sep == ",":
+            return token.replace(".", "").replace(",", ".")
+        if decimal_sep == ".":
+            return token.replace(",", "")
+        # No decimal part - every separator groups thousands
+        return token.replace(",", "").replace(".", "")
+
+    @staticmethod
+    def _infer_decimal_sep(token: str) -> Optional[str]:
+        dot = token.rfind(".")
+        comma = token.rfind(",")
+        if dot >= 0 and comma >= 0:
+            # Whichever comes last separates the decimals
+            return "." if dot > comma else ","
+        if dot < 0 and comma < 0:
+            return None
+
+        sep, index = (".", dot) if dot >= 0 else (",", comma)
+        if token.count(sep) > 1:
+            return None  # 1.234.567 / 1,234,567
+        if sep == "," and len(token) - index - 1 == 3:
+            return None  # 1,234
+        return sep
 
     @staticmethod
     def pct(base: Decimal, percent: int) -> Decimal:
         """Calculate percentage of base value."""
-        return (base * Decimal(percent) / Decimal(100)).quantize(
-            Decimal('0.01'), rounding=ROUND_HALF_UP
+        return (base * Decimal(percent) / MoneyUtils.HUNDRED).quantize(
+            MoneyUtils.CENT, rounding=ROUND_HALF_UP
         )
 
+    @staticmethod
+    def pct_many(bases: Iterable[Decimal], percent: int) -> List[Decimal]:
+        """Calculate the same percentage of many values."""
+        factor = Decimal(percent) / MoneyUtils.HUNDRED
+        cent = MoneyUtils.CENT
+        return [(base * factor).quantize(cent, rounding=ROUND_HALF_UP) for base in bases]
+
     @staticmethod
     def round2(value: Decimal) -> Decimal:
         """Round to 2 decimal places."""
-        return value.quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
+        return value.quantize(MoneyUtils.CENT, rounding=ROUND_HALF_UP)
 
     @staticmethod
     def fmt(value: Decimal) -> str:
         """Format as '£x.xx' for logging."""
         return f"£{value}"
+
@@ -0,0 +1,72 @@
+# utils/order_history_index.py
+from typing import Dict, Optional, Set
+
+
+class OrderHistoryIndex:
+    """
+    Order numbers seen in one account's order history.
+
+    Orders never leave a history, so a number once seen is trusted for
+    the rest of the session and answered without touching the browser.
+    Unknown numbers are searched page by page from the page currently
+    open; WooCommerce lists orders newest first, so the search stops as
+    soon as a page ends below the number being looked for.
+    """
+
+    # One index per account for this worker's session
+    _indexes: Dict[str, "OrderHistoryIndex"] = {}
+
+    def __init__(self):
+        self.numbers: Set[str] = set()
+        self.pages_read = 0
+        self.cache_hits = 0
+
+    @classmethod
+    def for_account(cls, username: Optional[str]) -> "OrderHistoryIndex":
+        """Session index of an account; an unshared one if the account is unknown."""
+        if username is None:
+            return cls()
+        return cls._indexes.setdefault(username, cls())
+
+    @classmethod
+    def clear(cls) -> None:
+        """Forget every account's index."""
+        cls._indexes.clear()
+
+    def add(self, order_number: str) -> None:
+        """Record an order known to be in the history."""
+        self.numbers.add(order_number)
+
+    def find(self, order_number: str, orders_pom) -> bool:
+        """
+        Check whether an order is in the history.
+
+        Args:
+            order_number: Order number as shown on the confirmation page
+            orders_pom: MyAccountOrdersPOM on a history page
+
+        Returns:
+            bool: True if the order is listed on this or a later page
+        """
+        if order_number in self.numbers:
+            self.cache_hits += 1
+            return True
+
+        while True:
+            numbers, next_url = orders_pom.read_orders_page()
+            self.pages_read += 1
+            self.numbers.update(numbers)
+            if order_number in self.numbers:
+                return True
+            if next_url is None or self._listed_past(order_number, numbers):
+                return False
+            orders_pom.open_page(next_url)
+
+    @staticmethod
+    def _listed_past(order_number: str, numbers) -> bool:
+        """True if this page already went below the order (newest-first listing)."""
+        if not numbers or not order_number.isdigit():
+            return False
+        if not all(number.isdigit() for number in numbers):
+            return False
+        return int(order_number) > min(int(number) for number in numbers)
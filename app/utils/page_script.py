@@ -0,0 +1,51 @@
+# utils/page_script.py
+from typing import Callable, Optional
+
+from selenium.webdriver.common.by import By
+
+
+class PageScript(str):
+    """
+    In-page JavaScript together with its HttpDriver equivalent.
+
+    A PageScript is the script text itself, so browsers run it unchanged
+    through execute_script. HttpDriver has no JavaScript; it calls `http`
+    with itself and the script's arguments instead, and raises for scripts
+    without one. Both versions live in the module that owns the script:
+
+        RESET_SCRIPT = PageScript(\"\"\"...\"\"\")
+
+        @RESET_SCRIPT.over_http
+        def _reset_over_http(driver, api): ...
+
+    Equivalents use only the WebDriver API and return what the script
+    would, so app/tests/test_page_script_parity.py can check that both
+    sides agree.
+    """
+
+    def __new__(cls, source: str, http: Optional[Callable] = None):
+        script = super().__new__(cls, source)
+        script.http = http
+        return script
+
+    def over_http(self, func: Callable) -> Callable:
+        """Decorator: register func as this script's HttpDriver equivalent."""
+        self.http = func
+        return func
+
+    @staticmethod
+    def ignore(driver, *args) -> None:
+        """Equivalent for scripts with nothing to do without a browser (scrolling, web storage)."""
+        return None
+
+    @staticmethod
+    def text_of(root, selector: str) -> str:
+        """textContent of the first match of a CSS selector under root, stripped; '' if none."""
+        found = root.find_elements(By.CSS_SELECTOR, selector)
+        return found[0].get_attribute("textContent").strip() if found else ""
+
+    @staticmethod
+    def href_of(root, selector: str) -> Optional[str]:
+        """Resolved href of the first match of a CSS selector under root, or None."""
+        found = root.find_elements(By.CSS_SELECTOR, selector)
+        return found[0].get_attribute("href") if found else None
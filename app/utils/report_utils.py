@@ -1,34 +1,39 @@
 # utils/report_utils.py
 from decimal import Decimal
-from app.utils.money_utils  import MoneyUtils
+from app.utils.event_reporter import EventReporter
 
 
 class ReportUtils:
-    """Utility for logging test information."""
+    """Utility for logging test information as structured events."""
 
     @staticmethod
     def log_inputs(username: str, password: str, product_name: str, coupon: str):
-        """Log test input parameters."""
-        print("=== Test Inputs ===")
-        print(f"Username: {username}")
-        print(f"Password: {password}")
-        print(f"Product:  {product_name}")
-        print(f"Coupon:   {coupon}")
-        print("===================")
+        """Log test input parameters (the password is redacted)."""
+        EventReporter.log(
+            "inputs",
+            username=username,
+            password=password,
+            product=product_name,
+            coupon=coupon,
+        )
 
     @staticmethod
     def log_totals(title: str, totals):
         """Log cart totals snapshot."""
-        print(f"=== {title} ===")
-        print(f"Subtotal: {MoneyUtils.fmt(totals.subtotal)}")
-        print(f"Discount: {MoneyUtils.fmt(totals.discount)}")
-        print(f"Shipping: {MoneyUtils.fmt(totals.shipping)}")
-        print(f"Total:    {MoneyUtils.fmt(totals.total)}")
-        print("======================")
+        EventReporter.log(
+            "totals",
+            title=title,
+            subtotal=totals.subtotal,
+            discount=totals.discount,
+            shipping=totals.shipping,
+            total=totals.total,
+        )
 
     @staticmethod
     def log_expectation(expected_discount: Decimal, expected_total: Decimal):
         """Log expected values."""
-        print(f"Expected Discount: {MoneyUtils.fmt(expected_discount)}")
-        print(f"Expected Total:    {MoneyUtils.fmt(expected_total)}")
-
+        EventReporter.log(
+            "expectation",
+            expected_discount=expected_discount,
+            expected_total=expected_total,
+        )
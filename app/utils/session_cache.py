@@ -0,0 +1,162 @@
+# utils/session_cache.py
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from app.models.user_credentials import UserCredentials
+from app.utils.helpers import Helpers
+
+
+@dataclass(frozen=True)
+class CachedSession:
+    """Immutable snapshot of a logged-in user's auth cookies."""
+    cookies: Tuple[dict, ...]
+    expires_at: float
+
+    def is_expired(self, now: Optional[float] = None) -> bool:
+        """Check whether the snapshot is past its TTL or cookie expiry."""
+        return (now or time.time()) >= self.expires_at
+
+
+class LoginSessionCache:
+    """
+    Per-worker cache of WordPress auth cookies keyed by UserCredentials.
+
+    The first login for a user goes through the UI; later logins inject the
+    captured cookies instead. Entries expire after `ttl_seconds` or when the
+    earliest auth cookie expires, whichever comes first.
+    """
+
+    AUTH_COOKIE_PREFIX = "wordpress_"
+
+    def __init__(self, ttl_seconds: float = 1800):
+        """
+        Initialize the cache.
+
+        Args:
+            ttl_seconds: Maximum age of a snapshot; 0 disables caching
+        """
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self.rejections = 0
+        self._sessions: Dict[UserCredentials, CachedSession] = {}
+
+    @property
+    def enabled(self) -> bool:
+        """Check whether snapshots are being kept."""
+        return self.ttl_seconds > 0
+
+    def get(self, credentials: UserCredentials) -> Optional[CachedSession]:
+        """
+        Look up a live snapshot for credentials.
+
+        Returns:
+            CachedSession or None if missing or expired
+        """
+        session = self._sessions.get(credentials)
+        if session is not None and session.is_expired():
+            del self._sessions[credentials]
+            session = None
+
+        if session is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return session
+
+    def discard(self, username: str) -> None:
+        """Drop a user's snapshots after a logout ended their server session."""
+        for credentials in [c for c in self._sessions if c.username == username]:
+            del self._sessions[credentials]
+
+    def store(self, credentials: UserCredentials, cookies: List[dict]) -> None:
+        """
+        Snapshot the auth cookies of a freshly logged-in browser.
+
+        Args:
+            credentials: User that just logged in
+            cookies: Result of driver.get_cookies()
+        """
+        if not self.enabled:
+            return
+
+        auth_cookies = tuple(
+            cookie for cookie in cookies
+            if cookie["name"].startswith(self.AUTH_COOKIE_PREFIX)
+        )
+        if not auth_cookies:
+            return
+
+        expires_at = time.time() + self.ttl_seconds
+        for cookie in auth_cookies:
+            if "expiry" in cookie:
+                expires_at = min(expires_at, cookie["expiry"])
+
+        self._sessions[credentials] = CachedSession(auth_cookies, expires_at)
+
+    def invalidate(self, credentials: UserCredentials) -> None:
+        """Drop a snapshot the server no longer accepts."""
+        if self._sessions.pop(credentials, None) is not None:
+            self.rejections += 1
+
+    @staticmethod
+    def inject(driver, session: CachedSession) -> None:
+        """Load cached cookies into a driver."""
+        LoginSessionCache.inject_cookies(driver, session.cookies)
+
+    @staticmethod
+    def inject_cookies(driver, cookies: Sequence[dict]) -> None:
+        """
+        Load WebDriver cookie dicts into a driver.
+
+        Chrome/Edge receive all cookies in a single CDP Network.setCookies
+        command; other browsers fall back to add_cookie, which needs the
+        browser to be on the cookies' domain first.
+        """
+        if hasattr(driver, "execute_cdp_cmd"):
+            driver.execute_cdp_cmd(
+                "Network.setCookies",
+                {"cookies": [LoginSessionCache._to_cdp(c) for c in cookies]}
+            )
+            return
+
+        if Helpers.BASE_URL not in driver.current_url:
+            driver.get(Helpers.BASE_URL)
+        for cookie in cookies:
+            driver.add_cookie(cookie)
+
+    @staticmethod
+    def _to_cdp(cookie: dict) -> dict:
+        """Convert a WebDriver cookie dict to a CDP CookieParam."""
+        param = {
+            "name": cookie["name"],
+            "value": cookie["value"],
+            "domain": cookie.get("domain"),
+            "path": cookie.get("path", "/"),
+            "secure": cookie.get("secure", False),
+            "httpOnly": cookie.get("httpOnly", False),
+        }
+        if "expiry" in cookie:
+            param["expires"] = cookie["expiry"]
+        if "sameSite" in cookie:
+            param["sameSite"] = cookie["sameSite"]
+        return param
+
+    def stats_dict(self) -> dict:
+        """Hit/miss/rejection counts for xdist workeroutput."""
+        return {"hits": self.hits, "misses": self.misses, "rejections": self.rejections}
+
+    def merge_stats(self, other: dict) -> None:
+        """Add another worker's counts (as produced by stats_dict) to these."""
+        self.hits += other.get("hits", 0)
+        self.misses += other.get("misses", 0)
+        self.rejections += other.get("rejections", 0)
+
+    def summary_lines(self) -> List[str]:
+        """Format stats for the pytest terminal summary."""
+        return [
+            f"Login cache hits:       {self.hits}",
+            f"Login cache misses:     {self.misses}",
+            f"Login cache rejections: {self.rejections}",
+        ]
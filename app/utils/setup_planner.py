@@ -0,0 +1,67 @@
+# utils/setup_planner.py
+from collections import Counter
+from typing import List, Optional, Tuple
+
+
+class SetupPlanner:
+    """
+    Orders data-driven tests so consecutive cases can share browser state.
+
+    Every case from @pytest.mark.cases carries a setup key
+    (user, product, coupon). Cases are grouped by that key so tests for
+    the same user run back to back; between two such tests the browser
+    session is kept, which skips the logout at the end of one test and
+    the login at the start of the next. The cart is still cleared and
+    refilled, because every test changes it (coupons, placed orders).
+    """
+
+    def __init__(self):
+        self.skipped: Counter = Counter()
+        self.groups = 0
+        self.keyed = 0
+
+    @staticmethod
+    def setup_key(item) -> Optional[Tuple[str, ...]]:
+        """(user, product, coupon) of a data-driven item, None for other tests."""
+        callspec = getattr(item, "callspec", None)
+        ref = callspec.params.get("test_data") if callspec else None
+        return getattr(ref, "setup", None) or None
+
+    def order(self, items: List) -> None:
+        """
+        Sort data-driven items in place by setup key.
+
+        Only the positions already held by data-driven items are reordered,
+        so every other test keeps its place. The sort is stable, so cases
+        with the same key keep their collection order.
+        """
+        positions = [index for index, item in enumerate(items) if self.setup_key(item)]
+        keyed = sorted((items[index] for index in positions), key=self.setup_key)
+        for index, item in zip(positions, keyed):
+            items[index] = item
+
+        self.keyed = len(keyed)
+        self.groups = len({self.setup_key(item) for item in keyed})
+
+    def keeps_session(self, item, nextitem) -> bool:
+        """True if the next test logs in as the same user, so the session can stay."""
+        if nextitem is None:
+            return False
+        key, next_key = self.setup_key(item), self.setup_key(nextitem)
+        return bool(key and next_key and key[0] == next_key[0])
+
+    def skip(self, step: str) -> None:
+        """Count a setup step that was not repeated."""
+        self.skipped[step] += 1
+
+    def summary_lines(self) -> List[str]:
+        """Format planner stats for the pytest terminal summary."""
+        lines = []
+        if self.keyed:
+            lines.append(f"Data-driven cases: {self.keyed} in {self.groups} setup groups")
+        if self.skipped:
+            steps = ", ".join(f"{step} x{count}" for step, count in sorted(self.skipped.items()))
+            lines.append(f"Setup steps skipped: {sum(self.skipped.values())} ({steps})")
+        else:
+            lines.append("Setup steps skipped: 0")
+        return lines
@@ -0,0 +1,132 @@
+# utils/store_client.py
+import re
+from typing import Dict, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from app.utils.helpers import Helpers
+
+
+class StoreClient:
+    """
+    HTTP shortcut for WooCommerce cart setup.
+
+    Seeds cart contents and coupons with plain HTTP requests that carry the
+    browser's session cookies, so tests only drive the UI for the step
+    actually under test. The underlying requests.Session and its connection
+    pool are shared by every client in the worker.
+    """
+
+    _session: Optional[requests.Session] = None
+    # Base URL -> lower-cased product name -> ID
+    _product_ids: Dict[str, Dict[str, int]] = {}
+
+    APPLY_COUPON_NONCE = re.compile(r'"apply_coupon_nonce":"(\w+)"')
+
+    def __init__(self, driver):
+        """
+        Initialize client bound to a browser session.
+
+        Args:
+            driver: WebDriver whose cookies identify the shopper
+        """
+        self.driver = driver
+        self.http = self.session()
+
+    @classmethod
+    def session(cls) -> requests.Session:
+        """Get the worker-wide pooled HTTP session."""
+        if cls._session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=10, max_retries=2)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            cls._session = session
+        return cls._session
+
+    def pull_cookies(self) -> None:
+        """Replace the HTTP cookie jar with the browser's cookies."""
+        self.http.cookies.clear()
+        for cookie in self.driver.get_cookies():
+            self.http.cookies.set(
+                cookie["name"],
+                cookie["value"],
+                domain=cookie.get("domain", ""),
+                path=cookie.get("path", "/"),
+            )
+
+    def push_cookies(self) -> None:
+        """
+        Copy cookies the server set or changed (e.g. a new cart session) back to the browser.
+
+        A cookie whose name the browser already has is replaced, since the
+        server may have rotated it. The domain is passed only when the server
+        gave one; host-only cookies take the current page's host.
+        """
+        known = {cookie["name"]: cookie["value"] for cookie in self.driver.get_cookies()}
+        for cookie in self.http.cookies:
+            if known.get(cookie.name) == cookie.value:
+                continue
+            if cookie.name in known:
+                self.driver.delete_cookie(cookie.name)
+            browser_cookie = {
+                "name": cookie.name,
+                "value": cookie.value,
+                "path": cookie.path or "/",
+                "secure": bool(cookie.secure),
+            }
+            if cookie.domain_specified:
+                browser_cookie["domain"] = cookie.domain
+            self.driver.add_cookie(browser_cookie)
+
+    def product_id(self, name: str) -> int:
+        """
+        Resolve a product name to its WooCommerce ID via the Store API.
+
+        Args:
+            name: Product name as shown in the shop
+
+        Raises:
+            LookupError: If no product has that exact name
+        """
+        key = name.lower()
+        product_ids = self._product_ids.setdefault(Helpers.BASE_URL, {})
+        if key not in product_ids:
+            response = self.http.get(
+                f"{Helpers.STORE_API_URL}/products",
+                params={"search": name},
+                timeout=10,
+            )
+            response.raise_for_status()
+            for product in response.json():
+                product_ids[product["name"].strip().lower()] = product["id"]
+
+        if key not in product_ids:
+            raise LookupError(f"Product not found: {name}")
+        return product_ids[key]
+
+    def add_to_cart(self, product_name: str, quantity: int = 1) -> None:
+        """Add a product through the ?add-to-cart=<id> endpoint."""
+        response = self.http.get(
+            f"{Helpers.BASE_URL}/",
+            params={"add-to-cart": self.product_id(product_name), "quantity": quantity},
+            timeout=10,
+        )
+        response.raise_for_status()
+
+    def apply_coupon(self, code: str) -> None:
+        """Apply a coupon through the same AJAX endpoint the cart page uses."""
+        page = self.http.get(Helpers.CART_URL, timeout=10)
+        page.raise_for_status()
+        match = self.APPLY_COUPON_NONCE.search(page.text)
+        if match is None:
+            raise LookupError("apply_coupon nonce not found on cart page")
+
+        response = self.http.post(
+            f"{Helpers.BASE_URL}/",
+            params={"wc-ajax": "apply_coupon"},
+            data={"security": match.group(1), "coupon_code": code},
+            timeout=10,
+        )
+        response.raise_for_status()
@@ -1,28 +1,272 @@
 # utils/waiter.py
-from selenium.webdriver.support.ui import WebDriverWait
+import time
+from bisect import bisect_left
+from typing import Callable, Dict, List, Optional
+
+from selenium.common.exceptions import (
+    NoSuchElementException,
+    StaleElementReferenceException,
+    TimeoutException,
+)
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.by import By
 
+from app.utils.page_script import PageScript
+
+Condition = Callable[[object], object]
+
+
+class WaitStats:
+    """Per-condition latency histograms for every wait in the worker."""
+
+    BUCKETS_MS = (10, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+    def __init__(self):
+        self.histograms: Dict[str, List[int]] = {}
+        self.timeouts: Dict[str, int] = {}
+        self.total_seconds: Dict[str, float] = {}
+        self.total_wait = 0.0
+
+    def record(self, name: str, seconds: float, timed_out: bool = False) -> None:
+        """Add one wait to the histogram of its condition."""
+        buckets = self.histograms.setdefault(name, [0] * (len(self.BUCKETS_MS) + 1))
+        buckets[bisect_left(self.BUCKETS_MS, seconds * 1000)] += 1
+        self.total_seconds[name] = self.total_seconds.get(name, 0.0) + seconds
+        self.total_wait += seconds
+        if timed_out:
+            self.timeouts[name] = self.timeouts.get(name, 0) + 1
+
+    def merge(self, other: dict) -> None:
+        """Add another worker's histograms (as produced by to_dict) to these."""
+        for name, counts in other["histograms"].items():
+            buckets = self.histograms.setdefault(name, [0] * len(counts))
+            self.histograms[name] = [a + b for a, b in zip(buckets, counts)]
+        for name, count in other["timeouts"].items():
+            self.timeouts[name] = self.timeouts.get(name, 0) + count
+        for name, seconds in other["total_seconds"].items():
+            self.total_seconds[name] = self.total_seconds.get(name, 0.0) + seconds
+        self.total_wait += other["total_wait"]
+
+    def to_dict(self) -> dict:
+        """Plain dict for xdist workeroutput."""
+        return {
+            "histograms": self.histograms,
+            "timeouts": self.timeouts,
+            "total_seconds": self.total_seconds,
+            "total_wait": self.total_wait,
+        }
+
+    def summary_lines(self) -> List[str]:
+        """Format histograms for the pytest terminal summary, slowest first."""
+        labels = [f"<={ms}ms" for ms in self.BUCKETS_MS] + [f">{self.BUCKETS_MS[-1]}ms"]
+        lines = []
+        for name in sorted(self.total_seconds, key=self.total_seconds.get, reverse=True):
+            counts = self.histograms[name]
+            spread = " ".join(
+                f"{label}:{count}" for label, count in zip(labels, counts) if count
+            )
+            lines.append(
+                f"{name}: n={sum(counts)} total={self.total_seconds[name]:.2f}s "
+                f"timeouts={self.timeouts.get(name, 0)} [{spread}]"
+            )
+        return lines
+
 
 class Waiter:
-    """Utility class for explicit waits."""
+    """
+    Utility class for explicit waits.
+
+    Implicit waits must stay disabled (DriverFactory sets them to 0) so that
+    negative checks return immediately. Conditions are polled starting at
+    `poll` seconds, growing by `backoff` up to `max_poll`, so fast conditions
+    resolve quickly without hammering the driver on slow ones.
+    """
+
+    # Shared by every Waiter in this worker
+    stats = WaitStats()
+
+    IGNORED_EXCEPTIONS = (NoSuchElementException, StaleElementReferenceException)
+
+    MUTATION_SCRIPT = PageScript("""
+        const [selector, mustBeVisible, timeoutMs] = arguments;
+        const done = arguments[arguments.length - 1];
+
+        function match() {
+            const el = document.querySelector(selector);
+            if (!el) return false;
+            if (!mustBeVisible) return true;
+            const rect = el.getBoundingClientRect();
+            return rect.width > 0 || rect.height > 0;
+        }
+
+        if (match()) return done(true);
+
+        const observer = new MutationObserver(() => {
+            if (match()) {
+                observer.disconnect();
+                clearTimeout(timer);
+                done(true);
+            }
+        });
+        observer.observe(document.documentElement, {
+            childList: true, subtree: true, attributes: true
+        });
+        const timer = setTimeout(() => {
+            observer.disconnect();
+            done(false);
+        }, timeoutMs);
+    """)
+
+    @staticmethod
+    @MUTATION_SCRIPT.over_http
+    def _observed_over_http(driver, selector: str, must_be_visible: bool, timeout_ms: int) -> bool:
+        """MUTATION_SCRIPT on HttpDriver: a page without scripts cannot change, so report it as it is now."""
+        elements = driver.find_elements(By.CSS_SELECTOR, selector)
+        return bool(elements) and (not must_be_visible or elements[0].is_displayed())
 
-    def __init__(self, driver, timeout: int = 10):
+    def __init__(self, driver, timeout: float = 10, poll: float = 0.05,
+                 backoff: float = 1.5, max_poll: float = 0.5):
+        """
+        Initialize waiter.
+
+        Args:
+            driver: WebDriver instance
+            timeout: Default seconds before a wait fails
+            poll: First polling interval in seconds
+            backoff: Factor applied to the interval after each miss (1 = fixed)
+            max_poll: Upper bound for the polling interval
+        """
         self.driver = driver
-        self.wait = WebDriverWait(driver, timeout)
+        self.timeout = timeout
+        self.poll = poll
+        self.backoff = backoff
+        self.max_poll = max_poll
+
+    def until(self, condition: Condition, name: str = "condition",
+              timeout: Optional[float] = None):
+        """
+        Poll a condition until it returns a truthy value.
+
+        Args:
+            condition: Callable receiving the driver
+            name: Histogram key for this wait
+            timeout: Override of the default timeout
+
+        Returns:
+            The condition's truthy result
+
+        Raises:
+            TimeoutException: If the condition never became truthy
+        """
+        timeout = self.timeout if timeout is None else timeout
+        start = time.perf_counter()
+        deadline = start + timeout
+        interval = self.poll
+
+        while True:
+            try:
+                value = condition(self.driver)
+                if value:
+                    self.stats.record(name, time.perf_counter() - start)
+                    return value
+            except self.IGNORED_EXCEPTIONS:
+                pass
+
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                self.stats.record(name, time.perf_counter() - start, timed_out=True)
+                raise TimeoutException(f"Timed out after {timeout}s waiting for {name}")
+
+            time.sleep(min(interval, remaining))
+            interval = min(interval * self.backoff, self.max_poll)
+
+    @staticmethod
+    def any_of(*conditions: Condition) -> Condition:
+        """Compose conditions - truthy as soon as one of them is."""
+        def check(driver):
+            for condition in conditions:
+                try:
+                    value = condition(driver)
+                    if value:
+                        return value
+                except Waiter.IGNORED_EXCEPTIONS:
+                    pass
+            return False
+
+        return check
+
+    @staticmethod
+    def all_of(*conditions: Condition) -> Condition:
+        """Compose conditions - truthy when every one of them is."""
+        def check(driver):
+            results = []
+            for condition in conditions:
+                value = condition(driver)
+                if not value:
+                    return False
+                results.append(value)
+            return results
+
+        return check
 
     def clickable(self, locator):
         """Wait until element is clickable."""
-        return self.wait.until(EC.element_to_be_clickable(locator))
+        return self.until(
+            EC.element_to_be_clickable(locator), name=f"clickable {locator[1]}"
+        )
 
     def visible(self, locator):
         """Wait until element is visible."""
-        return self.wait.until(EC.visibility_of_element_located(locator))
+        return self.until(
+            EC.visibility_of_element_located(locator), name=f"visible {locator[1]}"
+        )
+
+    def present(self, locator):
+        """Wait until element is in the DOM."""
+        return self.until(
+            EC.presence_of_element_located(locator), name=f"present {locator[1]}"
+        )
 
     def invisible(self, locator):
         """Wait until element is invisible."""
-        return self.wait.until(EC.invisibility_of_element_located(locator))
+        return self.until(
+            EC.invisibility_of_element_located(locator), name=f"invisible {locator[1]}"
+        )
 
     def url_contains(self, fragment: str):
         """Wait until URL contains fragment."""
-        return self.wait.until(EC.url_contains(fragment))
\ No newline at end of file
+        return self.until(EC.url_contains(fragment), name=f"url contains {fragment}")
+
+    def observed(self, css_selector: str, visible: bool = True,
+                 timeout: Optional[float] = None) -> bool:
+        """
+        Wait for an element inside the browser with a MutationObserver.
+
+        One execute_async_script call replaces the whole polling loop - use
+        it for AJAX updates within the current page (e.g. coupon applied).
+        It cannot survive a navigation; use url_contains for those.
+        On HttpDriver nothing changes the page between requests, so the
+        current state is returned at once: a missing element raises
+        immediately instead of after `timeout`.
+
+        Raises:
+            TimeoutException: If no matching element appeared in time
+        """
+        timeout = self.timeout if timeout is None else timeout
+        name = f"observed {css_selector}"
+        start = time.perf_counter()
+
+        # The script ends itself after `timeout`; the driver must not give up first
+        previous = self.driver.timeouts.script
+        self.driver.set_script_timeout(timeout + 1)
+        try:
+            found = self.driver.execute_async_script(
+                self.MUTATION_SCRIPT, css_selector, visible, int(timeout * 1000)
+            )
+        finally:
+            self.driver.set_script_timeout(previous)
+
+        self.stats.record(name, time.perf_counter() - start, timed_out=not found)
+        if not found:
+            raise TimeoutException(f"Timed out after {timeout}s waiting for {name}")
+        return True
@@ -0,0 +1,90 @@
+"""
+Compare page-load time and browser memory across browser profiles.
+
+Usage:
+    python -m benchmarks.bench_browser_profiles --browser chrome --target local
+    python -m benchmarks.bench_browser_profiles --profiles default lean --rounds 10
+"""
+import argparse
+import statistics
+import time
+
+from app.fake_shop.server import FakeShop
+from app.utils.browser_profiles import BrowserProfiles
+from app.utils.driver_factory import DriverFactory
+from app.utils.helpers import Helpers
+
+PAGES = ("/shop/", "/product/polo/", "/my-account/", "/cart/")
+
+LOAD_TIME_SCRIPT = """
+    const nav = performance.getEntriesByType('navigation')[0];
+    return nav ? nav.domContentLoadedEventEnd - nav.startTime : null;
+"""
+
+HEAP_SCRIPT = "return performance.memory ? performance.memory.usedJSHeapSize : null;"
+
+
+def measure(browser: str, profile_name: str, rounds: int) -> dict:
+    """Load every page `rounds` times and collect timings and memory."""
+    profile = BrowserProfiles.get(profile_name)
+
+    start = time.perf_counter()
+    driver = DriverFactory.create(browser, profile)
+    startup = time.perf_counter() - start
+
+    wall, dom_ready, heap = [], [], []
+    try:
+        for _ in range(rounds):
+            for page in PAGES:
+                start = time.perf_counter()
+                driver.get(f"{Helpers.BASE_URL}{page}")
+                wall.append((time.perf_counter() - start) * 1000)
+
+                ready = driver.execute_script(LOAD_TIME_SCRIPT)
+                if ready is not None:
+                    dom_ready.append(ready)
+                used = driver.execute_script(HEAP_SCRIPT)
+                if used is not None:
+                    heap.append(used / 1024 / 1024)
+    finally:
+        driver.quit()
+
+    return {
+        "profile": profile_name,
+        "startup_s": startup,
+        "get_ms_median": statistics.median(wall),
+        "get_ms_p95": statistics.quantiles(wall, n=20)[-1] if len(wall) > 1 else wall[0],
+        "dom_ready_ms_median": statistics.median(dom_ready) if dom_ready else float("nan"),
+        "heap_mb_max": max(heap) if heap else float("nan"),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--browser", default="chrome")
+    parser.add_argument("--profiles", nargs="+", default=sorted(BrowserProfiles.ALL))
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--target", choices=("remote", "local"), default="remote")
+    args = parser.parse_args()
+
+    shop = None
+    if args.target == "local":
+        shop = FakeShop(dict(Helpers.ACCOUNT_POOL)).start()
+        Helpers.configure(shop.base_url)
+
+    try:
+        results = [measure(args.browser, name, args.rounds) for name in args.profiles]
+    finally:
+        if shop is not None:
+            shop.stop()
+
+    print(f"{'profile':<10} {'startup s':>9} {'get ms p50':>10} {'get ms p95':>10} "
+          f"{'DCL ms p50':>10} {'heap MB':>8}")
+    for row in results:
+        print(f"{row['profile']:<10} {row['startup_s']:>9.2f} {row['get_ms_median']:>10.1f} "
+              f"{row['get_ms_p95']:>10.1f} {row['dom_ready_ms_median']:>10.1f} "
+              f"{row['heap_mb_max']:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,188 @@
+"""
+End-to-end step-layer benchmarks against the local fake shop.
+
+Usage:
+    pytest benchmarks/bench_flows.py                  # compare with benchmarks/baseline.json
+    pytest benchmarks/bench_flows.py --bench-save     # record a new baseline
+    pytest benchmarks/bench_flows.py --bench-rounds 30 --bench-threshold 0.1
+"""
+import pytest
+
+from app.models.billing_details import BillingDetails
+from app.models.product_data import ProductData
+from app.models.user_credentials import UserCredentials
+from app.steps.cart_steps import CartSteps
+from app.steps.checkout_steps import CheckoutSteps
+from app.steps.login_steps import LoginSteps
+from app.steps.order_verification_steps import OrderVerificationSteps
+from app.steps.shopping_steps import ShoppingSteps
+from app.utils.helpers import Helpers
+from app.utils.order_history_index import OrderHistoryIndex
+from app.utils.page_script import PageScript
+from app.utils.waiter import Waiter
+
+PRODUCT = ProductData(name="Polo")
+COUPON = "2idiscount"
+# Adds `count` units spread over the catalog through the Store API
+SEED_CART_SCRIPT = PageScript("""
+    const [api, count] = arguments;
+    const done = arguments[arguments.length - 1];
+    (async () => {
+        const cart = await fetch(api + '/cart', { credentials: 'same-origin' });
+        const headers = { 'Content-Type': 'application/json', 'Nonce': cart.headers.get('Nonce') };
+        const products = await (await fetch(api + '/products', { credentials: 'same-origin' })).json();
+        for (let i = 0; i < count; i++) {
+            await fetch(api + '/cart/add-item', {
+                method: 'POST', credentials: 'same-origin', headers: headers,
+                body: JSON.stringify({ id: products[i % products.length].id, quantity: 1 }),
+            });
+        }
+        await fetch(api + '/cart/apply-coupon', {
+            method: 'POST', credentials: 'same-origin', headers: headers,
+            body: JSON.stringify({ code: 'edgewords' }),
+        });
+        done(true);
+    })().catch((error) => done(String(error)));
+""")
+
+
+@SEED_CART_SCRIPT.over_http
+def _seed_cart_over_http(driver, api: str, count: int) -> bool:
+    """SEED_CART_SCRIPT on HttpDriver, over the driver's own session."""
+    nonce = driver.http.get(api + "/cart", timeout=driver.timeout).headers.get("Nonce") or ""
+    products = driver.http.get(api + "/products", timeout=driver.timeout).json()
+    for i in range(count):
+        driver.http.post(api + "/cart/add-item", headers={"Nonce": nonce}, timeout=driver.timeout,
+                         json={"id": products[i % len(products)]["id"], "quantity": 1})
+    driver.http.post(api + "/cart/apply-coupon", headers={"Nonce": nonce}, timeout=driver.timeout,
+                     json={"code": "edgewords"})
+    return True
+
+BILLING = BillingDetails(
+    first_name="Alice",
+    last_name="Smith",
+    address1="123 Main St",
+    address2="Apt 4B",
+    city="Birmingham",
+    county="West Midlands",
+    postcode="B1 1HQ",
+    phone="07111222333",
+)
+
+
+class TestFlowBenchmarks:
+    """Representative flows, each timed over --bench-rounds rounds."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, driver, bench):
+        """Build the steps and make sure the benchmark user is logged in."""
+        self.driver = driver
+        self.bench = bench
+        self.user = UserCredentials(username=Helpers.USERNAME, password=Helpers.PASSWORD)
+        self.waiter = Waiter(driver)
+        self.login_steps = LoginSteps(driver, self.waiter)
+        self.shopping_steps = ShoppingSteps(driver, self.waiter)
+        self.cart_steps = CartSteps(driver, self.waiter)
+        self.checkout_steps = CheckoutSteps(driver, self.waiter)
+        self.order_steps = OrderVerificationSteps(driver, self.waiter)
+
+        self.driver.get(Helpers.LOGIN_URL)
+        self.login_steps.login_as(self.user)
+
+    def _cart_with_product(self):
+        self.cart_steps.clear_cart()
+        self.shopping_steps.add_product_to_cart(PRODUCT)
+        self.cart_steps.navigate_to_cart()
+
+    def _at_checkout(self):
+        self._cart_with_product()
+        self.cart_steps.proceed_to_checkout()
+
+    def test_login(self):
+        def logged_out():
+            self.driver.delete_all_cookies()
+            self.driver.get(Helpers.LOGIN_URL)
+
+        self.bench.run("login", lambda: self.login_steps.login_as(self.user), setup=logged_out)
+
+    def test_add_to_cart(self):
+        self.bench.run(
+            "add_to_cart",
+            lambda: self.shopping_steps.add_product_to_cart(PRODUCT),
+            setup=self.cart_steps.clear_cart,
+        )
+
+    def test_apply_coupon(self):
+        self.bench.run(
+            "apply_coupon",
+            lambda: self.cart_steps.apply_coupon(COUPON),
+            setup=self._cart_with_product,
+        )
+
+    @pytest.mark.parametrize("method, items", [
+        ("clear_cart", 1),
+        ("clear_cart", 50),
+        ("clear_cart_via_ui", 50),
+    ])
+    def test_clear_cart(self, method, items):
+        def seeded_cart():
+            self.driver.execute_async_script(SEED_CART_SCRIPT, Helpers.STORE_API_URL, items)
+            self.cart_steps.navigate_to_cart()
+
+        self.bench.run(
+            f"{method}_{items}_items",
+            getattr(self.cart_steps, method),
+            setup=seeded_cart,
+        )
+        assert self.cart_steps.is_cart_empty()
+
+    def test_cart_lines(self):
+        self.cart_steps.clear_cart()
+        self.driver.execute_async_script(SEED_CART_SCRIPT, Helpers.STORE_API_URL, 50)
+        self.cart_steps.navigate_to_cart()
+        names = [item.name for item in self.cart_steps.get_line_items()]
+
+        self.bench.run("line_items_50", self.cart_steps.get_line_items)
+        self.bench.run(
+            "update_quantities_50",
+            lambda: self.cart_steps.update_quantities({name: 2 for name in names}),
+        )
+        assert {item.quantity for item in self.cart_steps.get_line_items()} == {2}
+
+    @pytest.mark.parametrize("mode", ["typed", "bulk"])
+    def test_billing_form(self, mode):
+        self._at_checkout()
+        self.checkout_steps.form_fill = mode
+
+        def reload_checkout():
+            self.driver.get(Helpers.CHECKOUT_URL)
+            self.waiter.visible(self.checkout_steps.checkout.first_name_field)
+
+        self.bench.run(
+            f"billing_form_{mode}",
+            lambda: self.checkout_steps.fill_billing_details(BILLING),
+            setup=reload_checkout,
+        )
+
+    def test_checkout(self):
+        def place_order():
+            self.checkout_steps.complete_checkout_with_cheque(BILLING)
+            self.checkout_steps.place_order()
+
+        self.bench.run("checkout", place_order, setup=self._at_checkout)
+
+    def test_order_lookup(self):
+        self._at_checkout()
+        self.checkout_steps.complete_checkout_with_cheque(BILLING)
+        self.checkout_steps.place_order()
+        order = self.order_steps.capture_order_number()
+
+        def cold_orders_page():
+            OrderHistoryIndex.clear()
+            self.order_steps.navigate_to_my_orders()
+
+        self.bench.run(
+            "order_lookup",
+            lambda: self.order_steps.is_order_in_history(order.order_number),
+            setup=cold_orders_page,
+        )
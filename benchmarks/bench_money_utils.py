@@ -0,0 +1,91 @@
+"""
+Compare the original MoneyUtils.parse with the current one on cart-like price strings.
+
+Every string is distinct by default, so nothing is measured from reuse;
+--distinct N draws the strings from N amounts to show parse_many's
+per-call reuse on repetitive columns.
+
+Usage:
+    python -m benchmarks.bench_money_utils
+    python -m benchmarks.bench_money_utils --count 100000 --rounds 5 --distinct 50
+"""
+import argparse
+import random
+import re
+import statistics
+import time
+from decimal import Decimal, ROUND_HALF_UP
+
+from app.utils.money_utils import MoneyUtils
+
+# How amounts appear in the cart, checkout and order pages
+TEMPLATES = (
+    "£{}", "-£{}", "Total: £{}", "Subtotal: £{}", "-£{} [Remove]", "{}",
+)
+
+
+def legacy_parse(text: str) -> Decimal:
+    """MoneyUtils.parse as it was before the rewrite, unchanged."""
+    if not text:
+        return Decimal('0.00')
+
+    # Remove non-numeric characters except decimal point, minus, and comma
+    cleaned = re.sub(r'[^0-9.,-]', '', text)
+    cleaned = cleaned.replace(',', '.')
+
+    if not cleaned:
+        return Decimal('0.00')
+
+    # Get last numeric token
+    parts = cleaned.strip().split()
+    candidate = parts[-1] if parts else cleaned
+
+    return Decimal(candidate).quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
+
+
+def price_strings(count: int, distinct: int, seed: int = 42):
+    """`count` price strings made from `distinct` amounts, without thousands separators (legacy cannot read them)."""
+    rng = random.Random(seed)
+    amounts = rng.sample(range(1, 1_000_000), distinct)
+    picks = amounts if distinct == count else [rng.choice(amounts) for _ in range(count)]
+    return [rng.choice(TEMPLATES).format(f"{amount / 100:.2f}") for amount in picks]
+
+
+def time_it(func, texts, rounds: int) -> float:
+    """Median seconds to parse every text once."""
+    timings = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        func(texts)
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--count", type=int, default=100_000)
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--distinct", type=int, default=None,
+                        help="Number of distinct amounts (default: every string distinct)")
+    args = parser.parse_args()
+
+    distinct = min(args.distinct or args.count, args.count)
+    texts = price_strings(args.count, distinct)
+    assert [legacy_parse(t) for t in texts[:1000]] == MoneyUtils.parse_many(texts[:1000])
+
+    results = {
+        "legacy parse loop": time_it(lambda ts: [legacy_parse(t) for t in ts], texts, args.rounds),
+        "parse loop": time_it(lambda ts: [MoneyUtils.parse(t) for t in ts], texts, args.rounds),
+        "parse_many": time_it(MoneyUtils.parse_many, texts, args.rounds),
+    }
+
+    baseline = results["legacy parse loop"]
+    print(f"{args.count} strings ({len(set(texts))} distinct), median of {args.rounds} rounds")
+    print(f"{'variant':<18} {'total ms':>9} {'us/str':>7} {'speedup':>8}")
+    for name, seconds in results.items():
+        print(f"{name:<18} {seconds * 1000:>9.1f} {seconds / args.count * 1e6:>7.2f} "
+              f"{baseline / seconds:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""
+Compare memory held by 100k TestData records before and after slots/interning.
+
+Usage:
+    python -m benchmarks.bench_test_data_memory
+    python -m benchmarks.bench_test_data_memory --count 500000
+"""
+import argparse
+import gc
+import random
+import tracemalloc
+from dataclasses import dataclass, fields
+
+from app.tests.data.test_data import TestData
+
+PRODUCTS = ("Polo", "Sunglasses", "Beanie", "Belt", "Cap", "Hoodie")
+COUPONS = (("2idiscount", "25"), ("Edgewords", "15"))
+CITIES = (("London", "Camden"), ("Manchester", "Greater Manchester"), ("Leeds", "West Yorkshire"))
+
+
+@dataclass
+class LegacyTestData:
+    """TestData as it was before: no slots, strings stored as parsed."""
+    username: str
+    password: str
+    product_name: str
+    coupon: str
+    first_name: str
+    last_name: str
+    address: str
+    address2: str
+    city: str
+    state: str
+    postcode: str
+    phone: str
+    expected_discount_percent: int
+
+
+def rows(count: int):
+    """Rows as a CSV reader yields them: a fresh str object per cell."""
+    rng = random.Random(7)
+    for index in range(count):
+        coupon, percent = rng.choice(COUPONS)
+        city, state = rng.choice(CITIES)
+        yield {
+            "username": "".join("luis.hueso@2.com"),
+            "password": "".join("luis.hueso"),
+            "product_name": "".join(rng.choice(PRODUCTS)),
+            "coupon": "".join(coupon),
+            "first_name": f"First{index % 500}",
+            "last_name": f"Last{index % 300}",
+            "address": f"{index % 900} Main St",
+            "address2": "".join(""),
+            "city": "".join(city),
+            "state": "".join(state),
+            "postcode": f"LS{index % 50} 1UR",
+            "phone": f"07{index:09d}",
+            "expected_discount_percent": percent,
+        }
+
+
+def legacy_from_row(row: dict) -> LegacyTestData:
+    values = {f.name: row[f.name] for f in fields(LegacyTestData)}
+    values["expected_discount_percent"] = int(values["expected_discount_percent"])
+    return LegacyTestData(**values)
+
+
+def measure(build, count: int) -> int:
+    """Bytes still allocated after building `count` records."""
+    gc.collect()
+    tracemalloc.start()
+    records = [build(row) for row in rows(count)]
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del records
+    return current
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--count", type=int, default=100_000)
+    args = parser.parse_args()
+
+    results = {
+        "legacy dataclass": measure(legacy_from_row, args.count),
+        "slots + intern": measure(TestData.from_row, args.count),
+    }
+
+    baseline = results["legacy dataclass"]
+    print(f"{args.count} records")
+    print(f"{'variant':<17} {'MB':>8} {'bytes/rec':>10} {'vs legacy':>10}")
+    for name, size in results.items():
+        print(f"{name:<17} {size / 1024 / 1024:>8.1f} {size / args.count:>10.0f} "
+              f"{size / baseline:>9.0%}")
+
+
+if __name__ == "__main__":
+    main()
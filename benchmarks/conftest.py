@@ -0,0 +1,214 @@
+"""
+Fixtures for the step-layer benchmark suite (benchmarks/bench_flows.py).
+
+Flows run against the local fake shop in one browser. Each flow is timed
+over several rounds; latency percentiles, WebDriver command counts and the
+browser's JS heap are compared with a stored baseline and the benchmark
+fails if a metric got worse than the allowed threshold. No baseline is
+committed, because timings depend on the machine: record one with
+--bench-save. Flows without a baseline are measured only, and each one
+raises a warning.
+"""
+import json
+import statistics
+import time
+import warnings
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+import pytest
+
+from app.fake_shop.server import FakeShop
+from app.steps.checkout_steps import CheckoutSteps
+from app.steps.login_steps import LoginSteps
+from app.utils.browser_profiles import BrowserProfiles
+from app.utils.driver_factory import DriverFactory
+from app.utils.helpers import Helpers
+from app.utils.instrumentation import Instrumentation
+from app.utils.page_script import PageScript
+from app.utils.session_cache import LoginSessionCache
+
+# No JS heap to read over HTTP
+HEAP_SCRIPT = PageScript(
+    "return performance.memory ? performance.memory.usedJSHeapSize : null;", http=PageScript.ignore
+)
+
+# Metrics compared with the baseline; all are "lower is better"
+COMPARED = ("ms_p50", "ms_p95", "commands", "heap_mb")
+
+
+def pytest_addoption(parser):
+    """Add benchmark command line options."""
+    parser.addoption("--bench-browser", action="store", default="chrome",
+                     help="Browser used by the benchmarks")
+    parser.addoption("--bench-profile", action="store", default="headless",
+                     choices=sorted(BrowserProfiles.ALL), help="Browser profile used by the benchmarks")
+    parser.addoption("--bench-rounds", action="store", type=int, default=10,
+                     help="Timed rounds per flow")
+    parser.addoption("--bench-baseline", action="store",
+                     default=str(Path(__file__).parent / "baseline.json"),
+                     help="JSON file with baseline results")
+    parser.addoption("--bench-threshold", action="store", type=float, default=0.25,
+                     help="Allowed regression per metric, as a fraction (0.25 = 25%%)")
+    parser.addoption("--bench-save", action="store_true", default=False,
+                     help="Write this run's results as the new baseline")
+
+
+class FlowBench:
+    """Runs flows, collects their metrics and checks them against the baseline."""
+
+    def __init__(self, driver, rounds: int, baseline: Dict[str, dict], threshold: float,
+                 saving: bool = False):
+        self.driver = driver
+        self.rounds = rounds
+        self.baseline = baseline
+        self.threshold = threshold
+        # Recording a baseline: nothing to compare yet, so no warnings
+        self.saving = saving
+        self.results: Dict[str, dict] = {}
+        self.uncompared: List[str] = []
+
+    def run(self, name: str, flow: Callable[[], None],
+            setup: Optional[Callable[[], None]] = None) -> dict:
+        """
+        Time a flow and fail if it regressed.
+
+        Args:
+            name: Result key, e.g. 'login'
+            flow: The timed steps
+            setup: Untimed preparation run before every round
+
+        Returns:
+            dict: The flow's metrics
+        """
+        timings, commands, heap = [], [], []
+        for _ in range(self.rounds):
+            if setup is not None:
+                setup()
+            before = Instrumentation.commands
+            start = time.perf_counter()
+            flow()
+            timings.append((time.perf_counter() - start) * 1000)
+            commands.append(Instrumentation.commands - before)
+
+            used = self.driver.execute_script(HEAP_SCRIPT)
+            if used is not None:
+                heap.append(used / 1024 / 1024)
+
+        result = {
+            "rounds": self.rounds,
+            "ms_p50": statistics.median(timings),
+            "ms_p95": statistics.quantiles(timings, n=20)[-1] if len(timings) > 1 else timings[0],
+            "ms_max": max(timings),
+            "commands": statistics.median(commands),
+            "heap_mb": max(heap) if heap else None,
+        }
+        self.results[name] = result
+        self.check(name, result)
+        return result
+
+    def check(self, name: str, result: dict) -> None:
+        """Raise AssertionError listing every metric beyond the threshold; warn without a baseline."""
+        baseline = self.baseline.get(name)
+        if not baseline:
+            self.uncompared.append(name)
+            if not self.saving:
+                warnings.warn(
+                    f"{name}: no baseline, so the flow was measured but not compared. "
+                    "Record one with --bench-save.",
+                    pytest.PytestWarning,
+                )
+            return
+        regressions = [
+            f"{metric}: {result[metric]:.1f} vs baseline {baseline[metric]:.1f}"
+            for metric in COMPARED
+            if result.get(metric) is not None and baseline.get(metric)
+            and result[metric] > baseline[metric] * (1 + self.threshold)
+        ]
+        assert not regressions, (
+            f"{name} regressed more than {self.threshold:.0%}: " + "; ".join(regressions)
+        )
+
+    def summary_lines(self):
+        """Format results for the terminal summary."""
+        lines = [f"{'flow':<20} {'ms p50':>8} {'ms p95':>8} {'ms max':>8} {'cmds':>6} {'heap MB':>8}  vs baseline"]
+        for name, row in self.results.items():
+            baseline = self.baseline.get(name)
+            change = (
+                f"{row['ms_p50'] / baseline['ms_p50'] - 1:+.0%}"
+                if baseline and baseline.get("ms_p50") else "no baseline"
+            )
+            heap = f"{row['heap_mb']:.1f}" if row["heap_mb"] is not None else "-"
+            lines.append(
+                f"{name:<20} {row['ms_p50']:>8.1f} {row['ms_p95']:>8.1f} {row['ms_max']:>8.1f} "
+                f"{row['commands']:>6.0f} {heap:>8}  {change}"
+            )
+        return lines
+
+
+@pytest.fixture(scope="session")
+def shop():
+    """Local fake shop every flow runs against."""
+    shop = FakeShop(dict(Helpers.ACCOUNT_POOL)).start()
+    remote_url = Helpers.BASE_URL
+    Helpers.configure(shop.base_url)
+
+    yield shop
+
+    Helpers.configure(remote_url)
+    shop.stop()
+
+
+@pytest.fixture(scope="session")
+def driver(request, shop):
+    """One browser shared by every flow."""
+    driver = DriverFactory.create(
+        request.config.getoption("--bench-browser"),
+        BrowserProfiles.get(request.config.getoption("--bench-profile")),
+    )
+    # Measure real UI logins, not cookie injection
+    LoginSteps.session_cache = LoginSessionCache(ttl_seconds=0)
+    # Flows other than the billing form comparison fill forms the fast way
+    CheckoutSteps.form_fill = "bulk"
+
+    yield driver
+
+    driver.quit()
+
+
+@pytest.fixture(scope="session")
+def bench(request, driver):
+    """FlowBench for the session; saves the baseline at the end with --bench-save."""
+    config = request.config
+    path = Path(config.getoption("--bench-baseline"))
+    baseline = json.loads(path.read_text()) if path.is_file() else {}
+    flow_bench = FlowBench(
+        driver,
+        rounds=config.getoption("--bench-rounds"),
+        baseline=baseline,
+        threshold=config.getoption("--bench-threshold"),
+        saving=config.getoption("--bench-save"),
+    )
+    config.flow_bench = flow_bench
+
+    yield flow_bench
+
+    if config.getoption("--bench-save"):
+        path.write_text(json.dumps({**baseline, **flow_bench.results}, indent=2, sort_keys=True))
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config):
+    """Print every flow's metrics."""
+    flow_bench = getattr(config, "flow_bench", None)
+    if flow_bench is None or not flow_bench.results:
+        return
+    terminalreporter.write_sep("=", "flow benchmarks")
+    for line in flow_bench.summary_lines():
+        terminalreporter.write_line(line)
+    if flow_bench.uncompared and not flow_bench.saving:
+        terminalreporter.write_line(
+            f"{len(flow_bench.uncompared)} flow(s) had no baseline in "
+            f"{config.getoption('--bench-baseline')} and were not checked for regressions; "
+            "record one with --bench-save",
+            yellow=True,
+        )